@@ -0,0 +1,39 @@
+"""
+Script para comparar los manifiestos de huellas de dos ejecuciones.
+"""
+
+import argparse
+import sys
+
+from data_generator_app.fingerprint import compare_manifests, load_manifest
+
+
+def main():
+    """Función principal del programa."""
+    parser = argparse.ArgumentParser(description='Comparador de huellas de datos de televisiones generados')
+    parser.add_argument('reference', type=str, help='Manifiesto de referencia (--fingerprint)')
+    parser.add_argument('candidate', type=str, help='Manifiesto a comprobar')
+    args = parser.parse_args()
+
+    try:
+        reference = load_manifest(args.reference)
+        candidate = load_manifest(args.candidate)
+    except (ValueError, OSError) as e:
+        parser.error(str(e))
+
+    # Las opciones y versiones distintas ayudan a explicar una diferencia
+    for key, value in reference['metadata'].items():
+        other = candidate['metadata'].get(key)
+        if other != value:
+            print(f"Aviso: {key} es {value} en la referencia y {other} en el candidato")
+
+    difference = compare_manifests(reference, candidate)
+    if difference is None:
+        print(f"Las huellas coinciden: {reference['rows']} filas, {reference['digest']}")
+        return
+    print(difference['reason'])
+    sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
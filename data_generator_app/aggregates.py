@@ -0,0 +1,363 @@
+"""
+Agregados en streaming para las visualizaciones.
+
+Las gráficas no necesitan las filas originales, solo recuentos, tablas
+cruzadas, sumas para correlaciones, histogramas de precios y una muestra
+acotada de puntos por tecnología. :class:`ChartAggregates` los calcula por bloques en una
+sola pasada, de modo que la memoria usada no depende del tamaño del archivo.
+"""
+
+import numpy as np
+import pandas as pd
+
+from .constants import BRANDS
+
+
+# Filas leídas por bloque al recorrer un archivo
+DEFAULT_CHUNK_SIZE = 500_000
+
+# Segmentos de precio usados en las gráficas
+PRICE_SEGMENT_BINS = [0, 500, 1000, 2000, 5000, 20000]
+PRICE_SEGMENT_LABELS = ['Económico', 'Básico', 'Medio', 'Premium', 'Gama Alta']
+
+# Variables numéricas del mapa de calor de correlación
+CORRELATION_COLUMNS = [
+    'PRICE_USD', 'QUALITY_RATING', 'SCREEN_SIZE_INCHES',
+    'REFRESH_RATE_HZ', 'HDMI_PORTS', 'USB_PORTS',
+    'AUDIO_OUTPUT_WATTS', 'CUSTOMER_RATING', 'WEIGHT_KG',
+    'POWER_CONSUMPTION_WATTS', 'INPUT_LAG_MS'
+]
+
+# Columnas de la muestra usada en los diagramas de dispersión
+SCATTER_COLUMNS = ['PRICE_USD', 'QUALITY_RATING', 'DISPLAY_TECHNOLOGY', 'SCREEN_SIZE_INCHES']
+
+# Número máximo de puntos conservados por tecnología para los diagramas de dispersión
+DEFAULT_SAMPLE_SIZE = 20_000
+
+# Ancho (USD) de los intervalos del histograma 2D precio/calificación
+PRICE_RATING_STEP = 25.0
+
+# Calificaciones posibles (0-5) en el histograma 2D precio/calificación
+RATING_BINS = 6
+
+# Ancho (USD) de los intervalos del histograma de precios por marca
+PRICE_HISTOGRAM_STEP = 1.0
+
+# Tipos explícitos para leer solo lo necesario y sin inferencia
+COLUMN_DTYPES = {
+    'BRAND': 'category',
+    'DISPLAY_TECHNOLOGY': 'category',
+    'RESOLUTION': 'category',
+    'VOICE_ASSISTANT': 'category',
+    'SCREEN_SIZE_INCHES': 'int16',
+    'MANUFACTURE_YEAR': 'int16',
+    'PRICE_USD': 'float64',
+    'QUALITY_RATING': 'int8',
+    'REFRESH_RATE_HZ': 'int16',
+    'HDMI_PORTS': 'int8',
+    'USB_PORTS': 'int8',
+    'AUDIO_OUTPUT_WATTS': 'int16',
+    'CUSTOMER_RATING': 'float64',
+    'WEIGHT_KG': 'float64',
+    'POWER_CONSUMPTION_WATTS': 'int16',
+    'INPUT_LAG_MS': 'int16',
+}
+
+
+class ChartAggregates:
+    """
+    Agregados fusionables que necesitan las gráficas.
+
+    Cada bloque de datos se incorpora con :meth:`update` y los agregados de
+    distintos bloques o procesos se combinan con :meth:`merge`.
+    """
+
+    def __init__(self, value_count_columns=(), price_by_brand=False, tech_by_segment=False,
+                 correlation=False, scatter_sample=False, sample_size=DEFAULT_SAMPLE_SIZE,
+                 seed=None):
+        """
+        Inicializa agregados vacíos.
+
+        Args:
+            value_count_columns (iterable): Columnas de las que contar valores.
+            price_by_brand (bool): Histograma de precios por marca (diagramas de caja).
+            tech_by_segment (bool): Tabla cruzada de tecnología por segmento de precio.
+            correlation (bool): Sumas para la matriz de correlación.
+            scatter_sample (bool): Muestra estratificada por tecnología e
+                histograma 2D de precio y calificación para dispersión.
+            sample_size (int): Tamaño máximo de la muestra de cada tecnología.
+            seed (int, optional): Semilla de la muestra.
+        """
+        self.total_records = 0
+        self.value_counts = {column: pd.Series(dtype='int64') for column in value_count_columns}
+        self.price_histograms = {} if price_by_brand else None
+        self.tech_by_segment = (
+            pd.DataFrame(dtype='int64', columns=PRICE_SEGMENT_LABELS) if tech_by_segment else None
+        )
+
+        self.correlation = correlation
+        self._corr_count = 0
+        self._corr_mean = np.zeros(len(CORRELATION_COLUMNS))
+        self._corr_comoment = np.zeros((len(CORRELATION_COLUMNS), len(CORRELATION_COLUMNS)))
+
+        self.sample_size = sample_size
+        self.sample = pd.DataFrame(columns=SCATTER_COLUMNS + ['_KEY']) if scatter_sample else None
+        self.price_rating_counts = np.zeros(0, dtype=np.int64)
+        self._rng = np.random.default_rng(seed)
+
+    @property
+    def columns(self):
+        """list: Columnas del archivo necesarias para estos agregados."""
+        needed = list(self.value_counts)
+        if self.price_histograms is not None:
+            needed += ['BRAND', 'PRICE_USD']
+        if self.tech_by_segment is not None:
+            needed += ['DISPLAY_TECHNOLOGY', 'PRICE_USD']
+        if self.correlation:
+            needed += CORRELATION_COLUMNS
+        if self.sample is not None:
+            needed += SCATTER_COLUMNS
+        return list(dict.fromkeys(needed))
+
+    def update(self, chunk):
+        """
+        Incorpora un bloque de datos.
+
+        Args:
+            chunk (pandas.DataFrame): Bloque con al menos :attr:`columns`.
+        """
+        self.total_records += len(chunk)
+
+        for column in self.value_counts:
+            counts = chunk[column].value_counts()
+            counts = counts[counts > 0]
+            # Las categorías de cada bloque pueden diferir: usar valores planos
+            counts.index = counts.index.to_numpy()
+            self.value_counts[column] = self.value_counts[column].add(counts, fill_value=0).astype('int64')
+
+        if self.price_histograms is not None:
+            self._update_price_histograms(chunk)
+
+        if self.tech_by_segment is not None:
+            segments = pd.cut(chunk['PRICE_USD'], bins=PRICE_SEGMENT_BINS, labels=PRICE_SEGMENT_LABELS)
+            table = pd.crosstab(chunk['DISPLAY_TECHNOLOGY'].astype(str), segments)
+            self.tech_by_segment = self.tech_by_segment.add(table, fill_value=0)
+
+        if self.correlation and len(chunk):
+            values = chunk[CORRELATION_COLUMNS].to_numpy(dtype=np.float64)
+            mean = values.mean(axis=0)
+            centered = values - mean
+            self._merge_moments(len(values), mean, centered.T @ centered)
+
+        if self.sample is not None and len(chunk):
+            part = chunk[SCATTER_COLUMNS].copy()
+            part['DISPLAY_TECHNOLOGY'] = part['DISPLAY_TECHNOLOGY'].astype(str)
+            part['_KEY'] = self._rng.random(len(part))
+            self._merge_sample(part)
+            self._update_price_rating(chunk)
+
+    def merge(self, other):
+        """
+        Combina otros agregados con los mismos ajustes.
+
+        Args:
+            other (ChartAggregates): Agregados a incorporar.
+        """
+        self.total_records += other.total_records
+        for column in self.value_counts:
+            self.value_counts[column] = (
+                self.value_counts[column].add(other.value_counts[column], fill_value=0).astype('int64')
+            )
+
+        if self.price_histograms is not None:
+            for brand, counts in other.price_histograms.items():
+                self.price_histograms[brand] = _add_counts(self.price_histograms.get(brand), counts)
+
+        if self.tech_by_segment is not None:
+            self.tech_by_segment = self.tech_by_segment.add(other.tech_by_segment, fill_value=0)
+
+        if self.correlation and other._corr_count:
+            self._merge_moments(other._corr_count, other._corr_mean, other._corr_comoment)
+
+        if self.sample is not None:
+            self._merge_sample(other.sample)
+            self.price_rating_counts = _add_counts(self.price_rating_counts, other.price_rating_counts)
+
+    def counts(self, column, sort_index=False):
+        """
+        Devuelve el recuento de valores de una columna.
+
+        Args:
+            column (str): Nombre de la columna.
+            sort_index (bool): Ordenar por valor en lugar de por frecuencia.
+
+        Returns:
+            pandas.Series: Recuentos enteros.
+        """
+        counts = self.value_counts[column]
+        if sort_index:
+            return counts.sort_index()
+        return counts.sort_values(ascending=False, kind='stable')
+
+    def crosstab(self):
+        """pandas.DataFrame: Tecnologías por segmento de precio (solo segmentos observados)."""
+        table = self.tech_by_segment.fillna(0).astype('int64')
+        table = table[[label for label in PRICE_SEGMENT_LABELS if table[label].sum() > 0]]
+        table.index.name = 'DISPLAY_TECHNOLOGY'
+        table.columns.name = 'PRICE_SEGMENT'
+        return table.sort_index()
+
+    def correlation_matrix(self):
+        """pandas.DataFrame: Matriz de correlación de Pearson de :data:`CORRELATION_COLUMNS`."""
+        std = np.sqrt(np.diag(self._corr_comoment))
+        with np.errstate(invalid='ignore', divide='ignore'):
+            corr = self._corr_comoment / np.outer(std, std)
+        return pd.DataFrame(corr, index=CORRELATION_COLUMNS, columns=CORRELATION_COLUMNS)
+
+    def price_box_stats(self):
+        """
+        Estadísticas de diagrama de caja por marca a partir de los histogramas.
+
+        Los cuartiles tienen una resolución de :data:`PRICE_HISTOGRAM_STEP` y
+        los bigotes siguen el criterio de 1,5 veces el rango intercuartílico.
+
+        Returns:
+            list: Diccionarios aceptados por ``matplotlib.axes.Axes.bxp``.
+        """
+        known = [brand for brand in BRANDS if brand in self.price_histograms]
+        others = sorted(brand for brand in self.price_histograms if brand not in BRANDS)
+
+        stats = []
+        for brand in known + others:
+            counts = self.price_histograms[brand]
+            centers = (np.arange(len(counts)) + 0.5) * PRICE_HISTOGRAM_STEP
+            cumulative = np.cumsum(counts)
+            total = cumulative[-1]
+            q1, median, q3 = (
+                centers[np.searchsorted(cumulative, q * total)] for q in (0.25, 0.5, 0.75)
+            )
+            iqr = q3 - q1
+            present = centers[counts > 0]
+            low = present[present >= q1 - 1.5 * iqr]
+            high = present[present <= q3 + 1.5 * iqr]
+            stats.append({
+                'label': brand,
+                'q1': q1,
+                'med': median,
+                'q3': q3,
+                'whislo': low.min() if len(low) else q1,
+                'whishi': high.max() if len(high) else q3,
+                'fliers': [],
+            })
+        return stats
+
+    def scatter_points(self, max_points=None):
+        """
+        Muestra de filas para dispersión, estratificada por tecnología.
+
+        Args:
+            max_points (int, optional): Número máximo de puntos. Se reparte a
+                partes iguales entre tecnologías para que las minoritarias
+                sigan siendo visibles. Sin límite se devuelve toda la muestra.
+
+        Returns:
+            pandas.DataFrame: Filas de :data:`SCATTER_COLUMNS`.
+        """
+        sample = self.sample
+        if max_points is not None and len(sample) > max_points:
+            strata = max(1, sample['DISPLAY_TECHNOLOGY'].nunique())
+            sample = (
+                sample.sort_values('_KEY')
+                .groupby('DISPLAY_TECHNOLOGY', sort=False)
+                .head(max(1, max_points // strata))
+            )
+        return sample.drop(columns='_KEY').reset_index(drop=True)
+
+    def price_rating_histogram(self):
+        """
+        Histograma 2D de precio y calificación de calidad de todas las filas.
+
+        Returns:
+            tuple: ``(prices, ratings, counts)`` con el centro de precio, la
+            calificación y el recuento de cada celda no vacía.
+        """
+        counts = self.price_rating_counts
+        cells = np.flatnonzero(counts)
+        price_bins, ratings = np.divmod(cells, RATING_BINS)
+        return (price_bins + 0.5) * PRICE_RATING_STEP, ratings, counts[cells]
+
+    def _update_price_histograms(self, chunk):
+        bins = np.floor(chunk['PRICE_USD'].to_numpy() / PRICE_HISTOGRAM_STEP).astype(np.int64)
+        brands = chunk['BRAND'].astype(str).to_numpy()
+        valid = bins >= 0
+        for brand in np.unique(brands[valid]):
+            counts = np.bincount(bins[valid & (brands == brand)])
+            self.price_histograms[brand] = _add_counts(self.price_histograms.get(brand), counts)
+
+    def _merge_moments(self, count, mean, comoment):
+        # Combinación de momentos de Chan et al.: estable para miles de bloques
+        total = self._corr_count + count
+        delta = mean - self._corr_mean
+        self._corr_comoment = (
+            self._corr_comoment + comoment
+            + np.outer(delta, delta) * self._corr_count * count / total
+        )
+        self._corr_mean = self._corr_mean + delta * count / total
+        self._corr_count = total
+
+    def _merge_sample(self, part):
+        # Conservar las claves aleatorias más pequeñas de cada tecnología da
+        # una muestra estratificada que se puede fusionar entre bloques
+        if len(part) == 0:
+            return
+        combined = pd.concat([self.sample, part]) if len(self.sample) else part
+        self.sample = (
+            combined.sort_values('_KEY')
+            .groupby('DISPLAY_TECHNOLOGY', sort=False)
+            .head(self.sample_size)
+        )
+
+    def _update_price_rating(self, chunk):
+        price_bins = np.floor(chunk['PRICE_USD'].to_numpy() / PRICE_RATING_STEP).astype(np.int64)
+        ratings = np.clip(chunk['QUALITY_RATING'].to_numpy().astype(np.int64), 0, RATING_BINS - 1)
+        cells = price_bins * RATING_BINS + ratings
+        counts = np.bincount(cells[price_bins >= 0])
+        self.price_rating_counts = _add_counts(self.price_rating_counts, counts)
+
+
+def _add_counts(current, counts):
+    """Suma dos arrays de recuentos de distinta longitud."""
+    if current is None:
+        return counts.astype(np.int64)
+    if len(counts) > len(current):
+        current, counts = counts.astype(np.int64), current
+    current = current.copy()
+    current[:len(counts)] += counts
+    return current
+
+
+def compute_chart_aggregates(file_path, aggregates, chunksize=DEFAULT_CHUNK_SIZE):
+    """
+    Recorre un CSV por bloques y acumula los agregados indicados.
+
+    Solo se leen las columnas que necesitan los agregados, con tipos
+    explícitos.
+
+    Args:
+        file_path (str): Ruta del archivo CSV.
+        aggregates (ChartAggregates): Agregados vacíos a completar.
+        chunksize (int): Filas leídas por bloque.
+
+    Returns:
+        ChartAggregates: Los mismos agregados, ya completados.
+    """
+    columns = aggregates.columns
+    reader = pd.read_csv(
+        file_path,
+        usecols=columns,
+        dtype={column: COLUMN_DTYPES.get(column, 'object') for column in columns},
+        chunksize=chunksize,
+    )
+    for chunk in reader:
+        aggregates.update(chunk)
+    return aggregates
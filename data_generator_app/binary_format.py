@@ -0,0 +1,326 @@
+"""
+Formato binario de registros de ancho fijo.
+
+Cada televisión ocupa exactamente ``RECORD_DTYPE.itemsize`` bytes:
+
+* las columnas categóricas de texto se guardan como códigos ``uint8`` en las
+  listas de constants.py;
+* HDR_FORMATS y ECO_CERTIFICATIONS como máscaras de bits;
+* PRODUCT_SKU, SUPPLIER_ID y DIMENSIONS_CM como enteros;
+* el resto en tipos numéricos nativos (MODEL como bytes de ancho fijo).
+
+El archivo empieza con una cabecera pequeña (``MAGIC``, longitud y un JSON
+con el dtype y las listas de categorías) alineada a ``HEADER_ALIGNMENT``
+bytes. Después de ella los registros se pueden abrir con ``numpy.memmap``
+y leer el registro ``i`` en O(1), sin analizar texto y cargando del disco
+solo las páginas que se tocan.
+"""
+
+import json
+import os
+import struct
+
+import numpy as np
+import pandas as pd
+
+from .constants import (
+    BRANDS, COLOR, COLUMN_NAMES, COUNTRY_OF_ORIGIN, DISPLAY_TECHNOLOGIES, ECO_FRIENDLY_CERTIFICATIONS,
+    ENERGY_STAR_RATING, HDR_FORMATS_SUPPORTED, RESOLUTIONS, SMART_TV_PLATFORMS, TUNER_TYPE,
+    VOICE_ASSISTANT_SUPPORT, WAREHOUSE_LOCATION
+)
+from .sku import decode_skus, encode_skus
+
+
+MAGIC = b"TVREC\x00v1"
+HEADER_ALIGNMENT = 64
+
+# Columnas de texto guardadas como código en su lista de valores
+CATEGORY_COLUMNS = {
+    "BRAND": BRANDS,
+    "DISPLAY_TECHNOLOGY": DISPLAY_TECHNOLOGIES,
+    "RESOLUTION": RESOLUTIONS,
+    "SMART_TV_PLATFORM": SMART_TV_PLATFORMS,
+    "VOICE_ASSISTANT": VOICE_ASSISTANT_SUPPORT,
+    "TUNER_TYPE": TUNER_TYPE,
+    "ENERGY_RATING": ENERGY_STAR_RATING,
+    "COUNTRY_OF_ORIGIN": COUNTRY_OF_ORIGIN,
+    "WAREHOUSE_LOCATION": WAREHOUSE_LOCATION,
+    "COLOR": COLOR,
+}
+
+# Columnas con varios valores separados por comas, guardadas como máscara de bits
+SET_COLUMNS = {
+    "HDR_FORMATS": [value for value in HDR_FORMATS_SUPPORTED if value != "None"],
+    "ECO_CERTIFICATIONS": [value for value in ECO_FRIENDLY_CERTIFICATIONS if value != "None"],
+}
+
+# Bytes reservados para MODEL
+MODEL_WIDTH = 16
+
+_NUMERIC_DTYPES = {
+    "SCREEN_SIZE_INCHES": "<i2",
+    "PRICE_USD": "<f8",
+    "QUALITY_RATING": "<i2",
+    "REFRESH_RATE_HZ": "<i2",
+    "HDMI_PORTS": "<i2",
+    "USB_PORTS": "<i2",
+    "AUDIO_OUTPUT_WATTS": "<i2",
+    "HAS_WIFI": "?",
+    "HAS_BLUETOOTH": "?",
+    "MANUFACTURE_YEAR": "<i2",
+    "STOCK_QUANTITY": "<i4",
+    "CUSTOMER_RATING": "<f8",
+    "IS_CURVED": "?",
+    "WEIGHT_KG": "<f8",
+    "WARRANTY_YEARS": "<i2",
+    "RELEASE_DATE": "<M8[D]",
+    "POWER_CONSUMPTION_WATTS": "<i4",
+    "INPUT_LAG_MS": "<i2",
+}
+
+
+def _field(column):
+    """Campo del registro de una columna."""
+    if column == "PRODUCT_SKU":
+        return (column, "<i4")
+    if column == "MODEL":
+        return (column, f"S{MODEL_WIDTH}")
+    if column in CATEGORY_COLUMNS or column in SET_COLUMNS:
+        return (column, "u1")
+    if column == "SUPPLIER_ID":
+        return (column, "<u2")
+    if column == "DIMENSIONS_CM":
+        # Ancho y alto en cm y profundidad en décimas de cm
+        return (column, "<u2", (3,))
+    return (column, _NUMERIC_DTYPES[column])
+
+
+# Dtype empaquetado de un registro, con los campos en el orden de COLUMN_NAMES
+RECORD_DTYPE = np.dtype([_field(column) for column in COLUMN_NAMES])
+
+_DIMENSIONS_PATTERN = r"^(\d+)W x (\d+)H x (\d+)\.(\d)D$"
+
+
+def _set_table(names):
+    """Texto de cada máscara de bits sobre ``names``, como lo escribe el generador."""
+    table = []
+    for mask in range(1 << len(names)):
+        selected = [name for bit, name in enumerate(names) if mask >> bit & 1]
+        table.append(",".join(selected) if selected else "None")
+    return np.array(table, dtype=object)
+
+
+def _checked_codes(column, codes):
+    """Comprueba que todos los valores de una columna tienen código."""
+    if np.any(codes < 0):
+        raise ValueError(f"La columna {column} tiene valores que no se pueden codificar en binario")
+    return codes
+
+
+def _fits(column, values, dtype):
+    """Comprueba que los valores enteros caben en el tipo del registro."""
+    info = np.iinfo(dtype)
+    if len(values) and (values.min() < info.min or values.max() > info.max):
+        raise ValueError(f"La columna {column} tiene valores fuera del rango de {np.dtype(dtype)}")
+    return values
+
+
+def encode_records(columns):
+    """
+    Convierte datos generados en registros binarios.
+
+    Args:
+        columns (pd.DataFrame or dict): Datos con las columnas de COLUMN_NAMES.
+
+    Returns:
+        numpy.ndarray: Array de RECORD_DTYPE.
+
+    Raises:
+        ValueError: Si algún valor no se puede representar en el registro.
+    """
+    length = len(columns[COLUMN_NAMES[0]])
+    records = np.zeros(length, dtype=RECORD_DTYPE)
+    for column in COLUMN_NAMES:
+        values = np.asarray(columns[column])
+        dtype = RECORD_DTYPE[column]
+
+        if column == "PRODUCT_SKU":
+            records[column] = _checked_codes(column, encode_skus(values))
+        elif column == "MODEL":
+            encoded = values.astype(f"S{MODEL_WIDTH + 1}")
+            if len(encoded) and np.char.str_len(encoded).max() > MODEL_WIDTH:
+                raise ValueError(f"MODEL no puede tener más de {MODEL_WIDTH} caracteres")
+            records[column] = encoded
+        elif column in CATEGORY_COLUMNS:
+            codes = pd.Categorical(values, categories=CATEGORY_COLUMNS[column]).codes
+            records[column] = _checked_codes(column, codes)
+        elif column in SET_COLUMNS:
+            table = _set_table(SET_COLUMNS[column])
+            masks = pd.Series(values).map({text: mask for mask, text in enumerate(table)})
+            records[column] = _checked_codes(column, masks.fillna(-1).to_numpy(dtype=np.int64))
+        elif column == "SUPPLIER_ID":
+            text = pd.Series(values, dtype=object)
+            numbers = pd.to_numeric(text.str.slice(3).where(text.str.startswith("SUP")), errors="coerce")
+            codes = _checked_codes(column, numbers.fillna(-1).to_numpy(dtype=np.int64))
+            records[column] = _fits(column, codes, np.uint16)
+        elif column == "DIMENSIONS_CM":
+            parts = pd.Series(values).str.extract(_DIMENSIONS_PATTERN)
+            if parts.isna().any(axis=None):
+                raise ValueError("DIMENSIONS_CM no tiene el formato 'AW x BH x C.D'")
+            parts = parts.astype(np.int64).to_numpy()
+            dimensions = np.column_stack([parts[:, 0], parts[:, 1], parts[:, 2] * 10 + parts[:, 3]])
+            records[column] = _fits(column, dimensions, np.uint16)
+        elif column == "RELEASE_DATE":
+            records[column] = np.asarray(values, dtype="datetime64[D]")
+        elif dtype.kind in "iu":
+            records[column] = _fits(column, values.astype(np.int64), dtype)
+        else:
+            records[column] = values
+    return records
+
+
+def decode_records(records, header=None):
+    """
+    Convierte registros binarios en un DataFrame como el del generador.
+
+    Args:
+        records (numpy.ndarray): Registros (array o memmap de RECORD_DTYPE).
+        header (dict, optional): Cabecera del archivo de origen (ver
+            read_header); sus listas de categorías tienen prioridad sobre las
+            de constants.py.
+
+    Returns:
+        pd.DataFrame: Filas decodificadas con los tipos del generador.
+    """
+    categories = header["categories"] if header else CATEGORY_COLUMNS
+    sets = header["sets"] if header else SET_COLUMNS
+    data = {}
+    for column in COLUMN_NAMES:
+        values = records[column]
+        if column == "PRODUCT_SKU":
+            data[column] = decode_skus(values).astype(object)
+        elif column == "MODEL":
+            data[column] = np.char.decode(values, "ascii").astype(object)
+        elif column in categories:
+            data[column] = np.asarray(categories[column], dtype=object)[values]
+        elif column in sets:
+            data[column] = _set_table(sets[column])[values]
+        elif column == "SUPPLIER_ID":
+            data[column] = ("SUP" + pd.Series(values, dtype=np.int64).astype(str)).to_numpy(dtype=object)
+        elif column == "DIMENSIONS_CM":
+            width = pd.Series(values[:, 0], dtype=np.int64).astype(str)
+            height = pd.Series(values[:, 1], dtype=np.int64).astype(str)
+            depth = pd.Series(values[:, 2], dtype=np.int64)
+            data[column] = (
+                width + "W x " + height + "H x " + (depth // 10).astype(str) + "." + (depth % 10).astype(str) + "D"
+            ).to_numpy(dtype=object)
+        elif column == "RELEASE_DATE":
+            data[column] = np.datetime_as_string(values, unit="D").astype(object)
+        elif values.dtype.kind in "iu":
+            data[column] = values.astype(np.int64)
+        else:
+            data[column] = np.asarray(values)
+    return pd.DataFrame(data, columns=COLUMN_NAMES)
+
+
+def _header_bytes():
+    """Cabecera del formato alineada a HEADER_ALIGNMENT bytes."""
+    schema = json.dumps({
+        "dtype": np.lib.format.dtype_to_descr(RECORD_DTYPE),
+        "categories": CATEGORY_COLUMNS,
+        "sets": SET_COLUMNS,
+    }, ensure_ascii=False).encode("utf-8")
+    size = len(MAGIC) + 4 + len(schema)
+    padding = -size % HEADER_ALIGNMENT
+    return MAGIC + struct.pack("<I", len(schema) + padding) + schema + b" " * padding
+
+
+def read_header(path):
+    """
+    Lee la cabecera de un archivo binario.
+
+    Args:
+        path (str): Ruta del archivo.
+
+    Returns:
+        dict: Esquema con ``dtype``, ``categories``, ``sets`` y ``offset`` (byte
+        en el que empiezan los registros).
+
+    Raises:
+        ValueError: Si el archivo no tiene el formato binario.
+    """
+    with open(path, "rb") as f:
+        prefix = f.read(len(MAGIC) + 4)
+        if len(prefix) < len(MAGIC) + 4 or not prefix.startswith(MAGIC):
+            raise ValueError(f"{path} no es un archivo binario de televisiones")
+        (length,) = struct.unpack("<I", prefix[len(MAGIC):])
+        header = json.loads(f.read(length).decode("utf-8"))
+
+    # JSON convierte las tuplas del descr en listas
+    header["dtype"] = np.lib.format.descr_to_dtype([tuple(tuple(v) if isinstance(v, list) else v for v in field)
+                                                    for field in header["dtype"]])
+    header["offset"] = len(MAGIC) + 4 + length
+    return header
+
+
+def write_binary_stream(chunks, sink):
+    """
+    Escribe bloques de datos como registros binarios de ancho fijo.
+
+    Args:
+        chunks (iterable): Bloques de datos (pandas.DataFrame o diccionarios de
+            arrays).
+        sink (str or file): Ruta o archivo binario de destino.
+
+    Returns:
+        int: Número de registros escritos.
+    """
+    if isinstance(sink, str):
+        with open(sink, "wb") as f:
+            return write_binary_stream(chunks, f)
+    sink.write(_header_bytes())
+    rows = 0
+    for chunk in chunks:
+        records = encode_records(chunk)
+        sink.write(records.view(np.uint8))
+        rows += len(records)
+        # Se liberan el bloque y sus registros antes de generar el siguiente
+        del chunk, records
+    return rows
+
+
+def open_records(path, mode="r"):
+    """
+    Proyecta en memoria los registros de un archivo binario.
+
+    Args:
+        path (str): Ruta del archivo.
+        mode (str): Modo de ``numpy.memmap`` (``r`` o ``r+``).
+
+    Returns:
+        numpy.memmap: Registros del archivo; ``records[i]`` se lee en O(1).
+    """
+    header = read_header(path)
+    dtype = header["dtype"]
+    size = os.path.getsize(path) - header["offset"]
+    if size % dtype.itemsize:
+        raise ValueError(f"{path} tiene un registro incompleto al final")
+    if size == 0:
+        return np.zeros(0, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode=mode, offset=header["offset"], shape=(size // dtype.itemsize,))
+
+
+def read_rows(path, indices):
+    """
+    Lee filas concretas de un archivo binario sin recorrerlo.
+
+    Args:
+        path (str): Ruta del archivo.
+        indices (array-like or slice): Posiciones de las filas.
+
+    Returns:
+        pd.DataFrame: Filas decodificadas.
+    """
+    records = open_records(path)
+    selected = records[indices]
+    return decode_records(np.atleast_1d(selected), read_header(path))
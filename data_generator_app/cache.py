@@ -0,0 +1,213 @@
+"""
+Caché en disco de conjuntos de datos generados.
+
+Cada entrada se identifica por un hash del estado de los generadores
+aleatorios, el número de filas, las columnas y una huella del esquema y del
+código del generador. Las columnas se guardan como archivos ``.npy`` que se
+proyectan en memoria al leerlos, y el estado aleatorio posterior a la
+generación, como JSON.
+"""
+
+import hashlib
+import json
+import os
+import random
+import shutil
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+from . import __version__
+from . import constants
+from .constants import COLUMN_NAMES
+
+
+# Tamaño máximo por defecto de la caché (1 GB)
+DEFAULT_CACHE_MAX_BYTES = 1 << 30
+
+
+def schema_fingerprint():
+    """
+    Calcula una huella del esquema y del código que generan los datos.
+
+    Cambia si se modifica cualquier constante, el código de cualquier módulo
+    del paquete o su versión. Se incluyen todos los módulos y no solo los que
+    generan las filas, porque estos importan otros (sku.py, conditions.py,
+    formats.py...) que también dan forma al resultado.
+
+    Returns:
+        str: Hash hexadecimal.
+    """
+    digest = hashlib.sha256(__version__.encode())
+    for name in sorted(vars(constants)):
+        if name.isupper():
+            digest.update(f"{name}={getattr(constants, name)!r}".encode())
+
+    package = os.path.dirname(__file__)
+    for module in sorted(name for name in os.listdir(package) if name.endswith(".py")):
+        digest.update(module.encode())
+        with open(os.path.join(package, module), "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def _rng_state():
+    """Devuelve el estado actual de ``random`` y ``numpy.random``."""
+    return random.getstate(), np.random.get_state()
+
+
+def _set_rng_state(state):
+    """Restaura un estado obtenido con :func:`_rng_state`."""
+    python_state, numpy_state = state
+    random.setstate(python_state)
+    np.random.set_state(numpy_state)
+
+
+def _state_to_json(state):
+    """Estado de :func:`_rng_state` como datos JSON, que a diferencia de pickle no ejecutan código al leerlos."""
+    (version, internal, gauss), (name, keys, position, has_gauss, cached) = state
+    return {
+        "python": [version, list(internal), gauss],
+        "numpy": [name, keys.tolist(), int(position), int(has_gauss), float(cached)],
+    }
+
+
+def _state_from_json(data):
+    """Inverso de :func:`_state_to_json`."""
+    version, internal, gauss = data["python"]
+    name, keys, position, has_gauss, cached = data["numpy"]
+    return (version, tuple(internal), gauss), (name, np.array(keys, dtype=np.uint32), position, has_gauss, cached)
+
+
+class DatasetCache:
+    """
+    Caché de DataFrames generados con expulsión LRU por tamaño.
+
+    La clave incluye el estado de los generadores aleatorios en el momento de
+    la llamada, de modo que un acierto devuelve exactamente lo que se habría
+    generado. Al acertar también se restaura el estado aleatorio posterior a
+    la generación, así que las llamadas siguientes no cambian.
+    """
+
+    def __init__(self, cache_dir, max_bytes=DEFAULT_CACHE_MAX_BYTES):
+        """
+        Inicializa la caché.
+
+        Args:
+            cache_dir (str): Directorio de la caché. Se crea si no existe.
+            max_bytes (int): Tamaño máximo total de las entradas.
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def key(self, num_records, columns=COLUMN_NAMES, options=None):
+        """
+        Calcula la clave de una generación con el estado aleatorio actual.
+
+        Args:
+            num_records (int): Número de filas a generar.
+            columns (list): Columnas del resultado.
+            options (dict, optional): Parámetros adicionales de la generación
+                que afectan al resultado.
+
+        Returns:
+            str: Clave hexadecimal de la entrada.
+        """
+        python_state, numpy_state = _rng_state()
+        digest = hashlib.sha256()
+        digest.update(repr(python_state).encode())
+        digest.update(numpy_state[1].tobytes())
+        digest.update(repr(numpy_state[2:]).encode())
+        digest.update(f"{num_records}|{','.join(columns)}".encode())
+        digest.update(schema_fingerprint().encode())
+        digest.update(json.dumps(options, sort_keys=True, default=str).encode())
+        return digest.hexdigest()
+
+    def load(self, key):
+        """
+        Busca una entrada y, si existe, restaura el estado aleatorio.
+
+        Args:
+            key (str): Clave de la entrada.
+
+        Returns:
+            pandas.DataFrame or None: Datos almacenados o None si no existe.
+        """
+        entry = os.path.join(self.cache_dir, key)
+        state_path = os.path.join(entry, "rng_state.json")
+        if not os.path.isfile(state_path):
+            return None
+
+        with open(os.path.join(entry, "meta.json")) as f:
+            meta = json.load(f)
+
+        columns = {}
+        for i, (name, kind) in enumerate(meta["columns"]):
+            # Copia en escritura: se lee bajo demanda y el DataFrame se puede modificar sin tocar la caché
+            values = np.load(os.path.join(entry, f"{i}.npy"), mmap_mode="c")
+            # Las cadenas se guardan con ancho fijo y se devuelven como objetos
+            columns[name] = values.astype(object) if kind == "str" else np.asarray(values)
+        df = pd.DataFrame(columns, copy=False)
+
+        with open(state_path) as f:
+            _set_rng_state(_state_from_json(json.load(f)))
+
+        # La fecha de modificación indica el último uso para la expulsión LRU
+        os.utime(entry)
+        return df
+
+    def store(self, key, df):
+        """
+        Guarda un DataFrame junto con el estado aleatorio actual.
+
+        Args:
+            key (str): Clave de la entrada.
+            df (pandas.DataFrame): Datos a guardar.
+        """
+        entry = os.path.join(self.cache_dir, key)
+        if os.path.isdir(entry):
+            return
+
+        # Se escribe en un directorio temporal y se renombra para que otros
+        # procesos nunca vean una entrada a medias
+        temp_dir = tempfile.mkdtemp(dir=self.cache_dir, prefix=".tmp-")
+        try:
+            columns = []
+            for i, name in enumerate(df.columns):
+                values = df[name].to_numpy()
+                kind = "str" if values.dtype == object else "native"
+                if kind == "str":
+                    values = values.astype(str)
+                np.save(os.path.join(temp_dir, f"{i}.npy"), values)
+                columns.append((name, kind))
+
+            with open(os.path.join(temp_dir, "meta.json"), "w") as f:
+                json.dump({"columns": columns, "rows": len(df)}, f)
+            with open(os.path.join(temp_dir, "rng_state.json"), "w") as f:
+                json.dump(_state_to_json(_rng_state()), f)
+
+            os.replace(temp_dir, entry)
+        except OSError:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+            if not os.path.isdir(entry):
+                raise
+        self.evict()
+
+    def evict(self):
+        """Elimina las entradas usadas hace más tiempo hasta respetar ``max_bytes``."""
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            path = os.path.join(self.cache_dir, name)
+            if name.startswith(".") or not os.path.isdir(path):
+                continue
+            size = sum(entry.stat().st_size for entry in os.scandir(path))
+            entries.append((os.stat(path).st_mtime, size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(path, ignore_errors=True)
+            total -= size
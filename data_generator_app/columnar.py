@@ -0,0 +1,617 @@
+"""
+Motor vectorizado de generación de datos de televisiones.
+
+Genera columnas completas con NumPy en lugar de construir un diccionario por
+fila. Reproduce las mismas reglas y correlaciones que
+:func:`~data_generator_app.data_generator.generate_tv_data_row`, pero con su
+propia secuencia aleatoria, así que sus datos no coinciden fila a fila con los
+del motor original.
+
+Las filas se generan en bloques de ``BLOCK_SIZE`` y cada bloque usa un
+generador derivado de la semilla y de su número de bloque, por lo que las
+filas ``[a, b)`` son idénticas sea cual sea el troceado de la generación.
+
+Las columnas de texto (PRODUCT_SKU, MODEL, SUPPLIER_ID, DIMENSIONS_CM,
+HDR_FORMATS y ECO_CERTIFICATIONS) se componen a partir de arrays de códigos
+enteros sobre búferes de bytes de ancho fijo o tablas precalculadas, sin
+operaciones de cadenas fila a fila.
+"""
+
+import random
+
+import numpy as np
+import pandas as pd
+
+from .constants import (
+    BRANDS, DISPLAY_TECHNOLOGIES, RESOLUTIONS, SCREEN_SIZES_INCHES,
+    SMART_TV_PLATFORMS, NUMBER_OF_HDMI_PORTS, NUMBER_OF_USB_PORTS,
+    TUNER_TYPE, COUNTRY_OF_ORIGIN, WAREHOUSE_LOCATION, WARRANTY_YEARS,
+    COLOR, ECO_FRIENDLY_CERTIFICATIONS, MANUFACTURE_YEAR, ENERGY_STAR_RATING,
+    CATEGORICAL_VALUES, COLUMN_NAMES
+)
+from .conditions import constrained_weights, parse_where
+from .formats import to_return_type
+from .sampling import AliasTable, build_samplers
+from .sku import SKU_SPACE, decode_skus
+
+
+# Filas por bloque con generador aleatorio propio
+BLOCK_SIZE = 8192
+
+# Letras de los nombres de modelo (sin I ni O, como en _generate_model_name)
+MODEL_LETTERS = "ABCDEFGHJKLMNPQRSTUVWXYZ"
+
+# Permutación de SKUs: red de Feistel sobre 30 bits con recorrido de ciclos
+_FEISTEL_HALF_BITS = 15
+_FEISTEL_MASK = np.uint64((1 << _FEISTEL_HALF_BITS) - 1)
+_FEISTEL_ROUNDS = 4
+
+_PREMIUM_BRANDS = ["Samsung", "LG", "Sony"]
+_MID_TIER_BRANDS = ["Panasonic", "Philips", "TCL"]
+_ECO_PREMIUM_BRANDS = ["Samsung", "LG", "Sony", "Panasonic", "Philips"]
+
+_RESOLUTION_MULT = {"HD": 0.7, "Full HD": 1.0, "4K UHD": 1.5, "8K UHD": 3.0}
+_PRICE_TECH_MULT = {
+    "LCD": 0.8, "LED": 1.0, "Plasma": 1.2, "QLED": 1.5,
+    "Mini-LED": 1.8, "OLED": 2.0, "MicroLED": 3.0
+}
+_WEIGHT_TECH_FACTOR = {"OLED": 0.8, "LED": 0.8, "LCD": 1.0, "QLED": 1.0, "Plasma": 1.2, "MicroLED": 1.2}
+_POWER_TECH_FACTOR = {"OLED": 0.9, "LED": 1.0, "LCD": 1.1, "QLED": 1.2, "Mini-LED": 1.2, "Plasma": 1.5}
+_LAG_TECH_FACTOR = {"OLED": 0.8, "QLED": 0.9, "Mini-LED": 0.9, "LED": 1.0, "LCD": 1.2, "Plasma": 1.3}
+
+# Asistente de cada plataforma: (asistente con probabilidad p, alternativa, p)
+_PLATFORM_ASSISTANTS = {
+    "Android TV": ("Google Assistant", "Google Assistant", 1.0),
+    "Google TV": ("Google Assistant", "Google Assistant", 1.0),
+    "WebOS": ("Alexa", "Google Assistant", 0.5),
+    "Tizen": ("Bixby", "Alexa", 0.7),
+    "Roku TV": ("Alexa", "Google Assistant", 0.5),
+    "Fire TV": ("Alexa", "Alexa", 1.0),
+    "Vidaa": ("Alexa", "Alexa", 1.0),
+    "SmartCast": ("Google Assistant", "Alexa", 0.5),
+    "My Home Screen": ("Google Assistant", "Alexa", 0.5),
+}
+
+_HDR_NAMES = ["HDR10", "HDR10+", "Dolby Vision", "HLG"]
+_ECO_NAMES = [cert for cert in ECO_FRIENDLY_CERTIFICATIONS if cert != "None"]
+
+
+def _by_index(values, mapping, default=1.0):
+    """Tabla con el valor de ``mapping`` para cada elemento de ``values``."""
+    return np.array([mapping.get(value, default) for value in values])
+
+
+def _mask_table(names):
+    """Tabla de cadenas indexada por la máscara de bits de ``names``."""
+    table = []
+    for mask in range(1 << len(names)):
+        selected = [name for bit, name in enumerate(names) if mask >> bit & 1]
+        table.append(",".join(selected) if selected else "None")
+    return np.array(table, dtype=object)
+
+
+_HDR_TABLE = _mask_table(_HDR_NAMES)
+_ECO_TABLE = _mask_table(_ECO_NAMES)
+_PRICE_BRAND_FACTOR = np.where(np.isin(BRANDS, _PREMIUM_BRANDS), 1.5, np.where(np.isin(BRANDS, _MID_TIER_BRANDS), 1.2, 1.0))
+_BRAND_TIER = np.where(np.isin(BRANDS, _PREMIUM_BRANDS), 0, np.where(np.isin(BRANDS, _MID_TIER_BRANDS), 1, 2))
+_ECO_BASE_PROB = np.where(np.isin(BRANDS, _ECO_PREMIUM_BRANDS), 0.6, 0.3)
+
+
+# Composición de cadenas sobre búferes de bytes
+
+def _constant_bytes(text, count):
+    """Búfer ``(count, len(text))`` con el mismo texto en todas las filas."""
+    return np.broadcast_to(np.frombuffer(text.encode("ascii"), dtype=np.uint8), (count, len(text)))
+
+
+def _number_bytes(values, width):
+    """
+    Dígitos decimales de enteros no negativos en un búfer de ``width`` bytes.
+
+    Los ceros a la izquierda se dejan como bytes nulos, que :func:`_join_bytes`
+    elimina al componer la cadena.
+    """
+    values = np.asarray(values, dtype=np.int64)
+    buffer = np.zeros((len(values), width), dtype=np.uint8)
+    remaining = values.copy()
+    for position in range(width - 1, -1, -1):
+        remaining, digit = np.divmod(remaining, 10)
+        buffer[:, position] = digit + ord("0")
+    # Bytes nulos en los ceros iniciales, salvo el último dígito
+    significant = np.zeros(len(values), dtype=bool)
+    for position in range(width - 1):
+        significant |= buffer[:, position] != ord("0")
+        buffer[~significant, position] = 0
+    return buffer
+
+
+def _letter_bytes(indices, alphabet):
+    """Búfer con la letra ``alphabet[i]`` para cada índice."""
+    table = np.frombuffer(alphabet.encode("ascii"), dtype=np.uint8)
+    return table[np.asarray(indices)].reshape(len(indices), -1)
+
+
+def _table_bytes(texts, indices):
+    """Búfer con ``texts[i]`` para cada índice, rellenado con bytes nulos."""
+    table = np.array([text.encode("ascii") for text in texts], dtype="S")
+    width = table.dtype.itemsize
+    return table.view(np.uint8).reshape(len(texts), width)[np.asarray(indices)]
+
+
+def _join_bytes(parts, keep=None):
+    """
+    Concatena búferes de bytes y devuelve las cadenas resultantes.
+
+    Los bytes nulos se desplazan al final de cada fila con una ordenación
+    estable, de modo que las partes de ancho variable quedan contiguas.
+
+    Args:
+        parts (list): Búferes ``(n, ancho)`` de ``uint8``.
+        keep (list, optional): Máscaras booleanas por parte; en las filas con
+            False la parte se omite.
+
+    Returns:
+        numpy.ndarray: Cadenas como array de objetos ``str``.
+    """
+    if keep is not None:
+        parts = [part if mask is None else np.where(mask[:, None], part, 0) for part, mask in zip(parts, keep)]
+    buffer = np.ascontiguousarray(np.hstack(parts))
+    order = np.argsort(buffer == 0, axis=1, kind="stable")
+    buffer = np.ascontiguousarray(np.take_along_axis(buffer, order, axis=1))
+    width = buffer.shape[1]
+    return buffer.view(f"S{width}").ravel().astype(f"U{width}").astype(object)
+
+
+# SKUs únicos por permutación del índice de fila
+
+def _feistel_keys(seed):
+    """Claves de ronda de la permutación de SKUs para una semilla."""
+    return np.random.SeedSequence(seed).generate_state(_FEISTEL_ROUNDS, dtype=np.uint64)
+
+
+def _feistel(values, keys):
+    """Permutación de ``[0, 2**30)`` con una red de Feistel equilibrada."""
+    left = values >> np.uint64(_FEISTEL_HALF_BITS)
+    right = values & _FEISTEL_MASK
+    for key in keys:
+        mixed = (right ^ key) * np.uint64(0x9E3779B97F4A7C15)
+        mixed ^= mixed >> np.uint64(29)
+        mixed *= np.uint64(0xBF58476D1CE4E5B9)
+        mixed ^= mixed >> np.uint64(32)
+        left, right = right, left ^ (mixed & _FEISTEL_MASK)
+    return (left << np.uint64(_FEISTEL_HALF_BITS)) | right
+
+
+def sku_codes(indices, seed):
+    """
+    Asigna un código de SKU distinto a cada índice de fila.
+
+    La red de Feistel es una biyección sobre ``[0, 2**30)``; los valores que
+    caen fuera de ``[0, SKU_SPACE)`` se vuelven a permutar hasta entrar en el
+    rango, lo que conserva la biyección sobre ``[0, SKU_SPACE)``.
+
+    Args:
+        indices (array-like): Índices de fila en ``[0, SKU_SPACE)``.
+        seed (int): Semilla de la permutación.
+
+    Returns:
+        numpy.ndarray: Códigos ``int64`` sin repeticiones.
+    """
+    keys = _feistel_keys(seed)
+    codes = _feistel(np.asarray(indices, dtype=np.uint64), keys)
+    outside = codes >= SKU_SPACE
+    while outside.any():
+        codes[outside] = _feistel(codes[outside], keys)
+        outside = codes >= SKU_SPACE
+    return codes.astype(np.int64)
+
+
+# Condiciones sobre el precio
+
+# Rango del ruido multiplicativo del precio
+_PRICE_NOISE = (0.85, 1.15)
+
+
+class _PriceConditionSampler:
+    """
+    Muestreo conjunto de marca, tecnología, tamaño, resolución y ruido del
+    precio condicionado a un rango de PRICE_USD.
+
+    Cada combinación de las cuatro columnas tiene su probabilidad sin
+    condiciones multiplicada por la fracción del ruido que deja el precio
+    dentro del rango; después el ruido se muestrea uniforme en esa fracción.
+    """
+
+    def __init__(self, price_range, column_weights):
+        """
+        Construye la tabla alias de las combinaciones posibles.
+
+        Args:
+            price_range (tuple): Límites inclusivos (mínimo, máximo) del precio, en céntimos.
+            column_weights (dict): Pesos de las columnas con pesos o condiciones
+                (ver constrained_weights); el resto son uniformes.
+        """
+        def marginal(column):
+            weights = np.asarray(column_weights.get(column, [1] * len(CATEGORICAL_VALUES[column])), dtype=np.float64)
+            return weights / weights.sum()
+
+        brand, tech, size, resolution = np.meshgrid(
+            np.arange(len(BRANDS)), np.arange(len(DISPLAY_TECHNOLOGIES)),
+            np.arange(len(SCREEN_SIZES_INCHES)), np.arange(len(RESOLUTIONS)), indexing="ij"
+        )
+        brand, tech, size, resolution = brand.ravel(), tech.ravel(), size.ravel(), resolution.ravel()
+        base = (
+            np.asarray(SCREEN_SIZES_INCHES)[size] * 10.0
+            * _PRICE_BRAND_FACTOR[brand]
+            * _by_index(RESOLUTIONS, _RESOLUTION_MULT)[resolution]
+            * _by_index(DISPLAY_TECHNOLOGIES, _PRICE_TECH_MULT)[tech]
+        )
+        # Precios sin redondear que quedan dentro del rango al redondearlos a céntimos
+        low, high = price_range
+        noise_low = np.maximum(_PRICE_NOISE[0], (low - 0.005) / base)
+        noise_high = np.minimum(_PRICE_NOISE[1], (high + 0.005) / base)
+        weights = (
+            marginal("BRAND")[brand] * marginal("DISPLAY_TECHNOLOGY")[tech]
+            * marginal("SCREEN_SIZE_INCHES")[size] * marginal("RESOLUTION")[resolution]
+            * np.maximum(noise_high - noise_low, 0)
+        )
+        feasible = weights > 0
+        if not feasible.any():
+            raise ValueError("Ninguna combinación de marca, tecnología, tamaño y resolución cumple el rango de precio")
+
+        self.table = AliasTable(np.flatnonzero(feasible), weights[feasible])
+        self.brand, self.tech, self.size, self.resolution = brand, tech, size, resolution
+        self.noise_low, self.noise_high = noise_low, noise_high
+        self.price_range = price_range
+
+    def sample(self, rng, count):
+        """
+        Muestrea ``count`` combinaciones.
+
+        Returns:
+            tuple: Índices de marca, tecnología, tamaño y resolución y el ruido del precio.
+        """
+        combo = self.table.sample_batch(count, rng)
+        low, high = self.noise_low[combo], self.noise_high[combo]
+        noise = low + (high - low) * rng.random(count)
+        return self.brand[combo], self.tech[combo], self.size[combo], self.resolution[combo], noise
+
+
+# Generación de bloques
+
+def _categorical(rng, column, size, samplers):
+    """Índices de los valores de una columna categórica."""
+    if samplers is not None and column in samplers:
+        return samplers[column].sample_indices(size, rng)
+    return rng.integers(0, len(CATEGORICAL_VALUES[column]), size)
+
+
+def _pick(values, indices):
+    """Valores de una lista para un array de índices."""
+    return np.asarray(values)[indices]
+
+
+def _release_dates(rng, years):
+    """Fechas entre el 1 de enero y el 30 de junio de cada año."""
+    start = (years - 1970).astype("datetime64[Y]").astype("datetime64[D]")
+    end = (years - 1970).astype("datetime64[Y]").astype("datetime64[D]") + np.timedelta64(180, "D")
+    leap = ((years % 4 == 0) & (years % 100 != 0)) | (years % 400 == 0)
+    end = end + leap.astype("timedelta64[D]")
+    days = rng.integers(0, (end - start).astype(np.int64) + 1)
+    return np.datetime_as_string(start + days.astype("timedelta64[D]"), unit="D").astype(object)
+
+
+def _model_names(rng, brand_idx, tech_idx, sizes):
+    """Nombres de modelo con los formatos de cada marca."""
+    count = len(brand_idx)
+    brands = _pick(BRANDS, brand_idx)
+    techs = _pick(DISPLAY_TECHNOLOGIES, tech_idx)
+    premium = np.isin(brands, _PREMIUM_BRANDS)
+
+    # Prefijos de marcas premium: QN (Samsung QLED), OLED (LG OLED), XBR- (Sony)
+    prefix_idx = np.select(
+        [(brands == "Samsung") & (techs == "QLED"), (brands == "LG") & (techs == "OLED"), brands == "Sony"],
+        [1, 2, 3], 0
+    )
+    prefix = _table_bytes(["", "QN", "OLED", "XBR-"], np.where(premium, prefix_idx, 0))
+
+    letters = len(MODEL_LETTERS)
+    generic_prefix = _letter_bytes(rng.integers(0, letters, (count, 2)), MODEL_LETTERS)
+    series = _letter_bytes(rng.integers(0, letters, (count, 1)), MODEL_LETTERS)
+    model_num = _number_bytes(rng.integers(1, 10, count) * 10 + rng.integers(0, 10, count), 2)
+    suffix = _letter_bytes(rng.integers(0, letters, (count, 2)), MODEL_LETTERS)
+    generic_digits = _number_bytes(rng.integers(0, 10_000, count) + 10_000, 5)[:, 1:]
+
+    generic = ~premium
+    return _join_bytes(
+        [prefix, generic_prefix, _constant_bytes("-", count), _number_bytes(sizes, 3),
+         series, model_num, suffix, generic_digits],
+        keep=[None, generic, generic, None, premium, premium, premium, generic],
+    )
+
+
+def _dimensions(rng, sizes):
+    """Cadenas ``WxHxD`` en centímetros a partir del tamaño de pantalla."""
+    count = len(sizes)
+    width = np.round(sizes * 2.54 * 0.87 * rng.uniform(0.98, 1.02, count)).astype(np.int64)
+    height = np.round(sizes * 2.54 * 0.49 * rng.uniform(0.98, 1.02, count)).astype(np.int64)
+    depth = np.round((5 + sizes / 50) * rng.uniform(0.95, 1.05, count) * 10).astype(np.int64)
+    return _join_bytes([
+        _number_bytes(width, 4), _constant_bytes("W x ", count),
+        _number_bytes(height, 4), _constant_bytes("H x ", count),
+        _number_bytes(depth // 10, 3), _constant_bytes(".", count),
+        _number_bytes(depth % 10, 1), _constant_bytes("D", count),
+    ])
+
+
+def _voice_assistants(rng, price, platform_idx):
+    """Asistente de voz según plataforma y precio."""
+    count = len(price)
+    first = _by_index(SMART_TV_PLATFORMS, {k: v[0] for k, v in _PLATFORM_ASSISTANTS.items()}, "None")
+    second = _by_index(SMART_TV_PLATFORMS, {k: v[1] for k, v in _PLATFORM_ASSISTANTS.items()}, "None")
+    prob = _by_index(SMART_TV_PLATFORMS, {k: v[2] for k, v in _PLATFORM_ASSISTANTS.items()})
+
+    typical = np.where(rng.random(count) < prob[platform_idx], first[platform_idx], second[platform_idx])
+    assistant = np.where((price > 1500) & (rng.random(count) < 0.3), "Multiple", typical)
+    assistant = np.where((price < 400) & (rng.random(count) < 0.7), "None", assistant)
+    return assistant.astype(object)
+
+
+def _generate_block(seed, block, samplers, price_sampler=None):
+    """
+    Genera las columnas de un bloque completo de ``BLOCK_SIZE`` filas.
+
+    Args:
+        seed (int): Semilla de la generación.
+        block (int): Número de bloque.
+        samplers (dict or None): Tablas alias por columna.
+        price_sampler (_PriceConditionSampler, optional): Muestreo conjunto
+            de las columnas que determinan el precio, si hay un rango de precio.
+
+    Returns:
+        dict: Array por columna, sin PRODUCT_SKU.
+    """
+    rng = np.random.default_rng(np.random.SeedSequence(seed, spawn_key=(block,)))
+    count = BLOCK_SIZE
+
+    if price_sampler is None:
+        brand_idx = _categorical(rng, "BRAND", count, samplers)
+        tech_idx = _categorical(rng, "DISPLAY_TECHNOLOGY", count, samplers)
+        size_idx = _categorical(rng, "SCREEN_SIZE_INCHES", count, samplers)
+        resolution_idx = _categorical(rng, "RESOLUTION", count, samplers)
+        noise = None
+    else:
+        brand_idx, tech_idx, size_idx, resolution_idx, noise = price_sampler.sample(rng, count)
+    sizes = _pick(SCREEN_SIZES_INCHES, size_idx).astype(np.int64)
+    techs = _pick(DISPLAY_TECHNOLOGIES, tech_idx)
+    resolutions = _pick(RESOLUTIONS, resolution_idx)
+
+    # Precio con correlaciones realistas
+    price = (
+        sizes * 10.0
+        * _PRICE_BRAND_FACTOR[brand_idx]
+        * _by_index(RESOLUTIONS, _RESOLUTION_MULT)[resolution_idx]
+        * _by_index(DISPLAY_TECHNOLOGIES, _PRICE_TECH_MULT)[tech_idx]
+        * (rng.uniform(*_PRICE_NOISE, count) if noise is None else noise)
+    )
+    price = np.round(price, 2)
+    if price_sampler is not None:
+        # Un precio justo en el medio céntimo del borde puede redondearse hacia fuera
+        price = np.clip(price, *price_sampler.price_range)
+
+    years = _pick(MANUFACTURE_YEAR, _categorical(rng, "MANUFACTURE_YEAR", count, samplers)).astype(np.int64)
+
+    # Calificaciones correlacionadas con marca y precio
+    tier = _BRAND_TIER[brand_idx]
+    low = np.array([3.5, 3.0, 2.0])[tier]
+    high = np.array([5.0, 4.5, 4.0])[tier]
+    base_rating = low + (high - low) * rng.random(count)
+    quality = np.clip(np.round(base_rating * 0.7 + np.minimum(1.0, price / 3000) * 1.5), 1, 5).astype(np.int64)
+    customer = np.round(np.clip(quality + rng.uniform(-0.8, 0.8, count), 1.0, 5.0), 1)
+
+    # Tasa de refresco por gama
+    premium = (price > 2000) | np.isin(techs, ["OLED", "QLED", "MicroLED"])
+    high_rate = np.where(
+        premium, rng.random(count) < 0.8, (price > 1000) & (rng.random(count) < 0.6)
+    )
+    high_choices = np.where(premium, np.array([120, 144, 240])[rng.integers(0, 3, count)],
+                            np.array([120, 144])[rng.integers(0, 2, count)])
+    refresh = np.where(high_rate, high_choices, np.array([60, 75])[rng.integers(0, 2, count)])
+
+    platform_idx = _categorical(rng, "SMART_TV_PLATFORM", count, samplers)
+
+    # Formatos HDR como máscara de bits sobre _HDR_NAMES
+    no_hdr = np.isin(resolutions, ["HD", "Full HD"]) & (price < 500) & (rng.random(count) < 0.8)
+    hdr_mask = (
+        (rng.random(count) < 0.9).astype(np.int64)
+        | ((price > 700) & (rng.random(count) < 0.5)).astype(np.int64) << 1
+        | ((price > 1200) & (rng.random(count) < 0.7)).astype(np.int64) << 2
+        | ((price > 800) & (rng.random(count) < 0.6)).astype(np.int64) << 3
+    )
+    hdr = _HDR_TABLE[np.where(no_hdr, 0, hdr_mask)]
+
+    # Puertos por gama de precio
+    tier_offset = np.where(price < 500, 0, np.where(price < 1500, 1, 2))
+    hdmi = np.array(NUMBER_OF_HDMI_PORTS)[tier_offset + rng.integers(0, np.where(tier_offset == 2, 3, 2))]
+    usb = np.array(NUMBER_OF_USB_PORTS)[tier_offset + rng.integers(0, np.where(tier_offset == 2, 3, 2))]
+
+    audio = (np.round(10 * (sizes / 50) * (0.5 + 0.5 * price / 1000) / 5) * 5).astype(np.int64)
+    weight = np.round(
+        0.01 * sizes ** 1.5 * _by_index(DISPLAY_TECHNOLOGIES, _WEIGHT_TECH_FACTOR)[tech_idx]
+        * rng.uniform(0.9, 1.1, count), 1
+    )
+    power = np.round(
+        sizes * 1.5 * _by_index(DISPLAY_TECHNOLOGIES, _POWER_TECH_FACTOR)[tech_idx] * rng.uniform(0.9, 1.1, count)
+    ).astype(np.int64)
+    lag = np.maximum(1, np.round(
+        (40 - refresh / 8) * _by_index(DISPLAY_TECHNOLOGIES, _LAG_TECH_FACTOR)[tech_idx]
+        * rng.uniform(0.85, 1.15, count)
+    )).astype(np.int64)
+
+    # Certificaciones ecológicas como máscara de bits sobre _ECO_NAMES
+    eco_prob = _ECO_BASE_PROB[brand_idx] + np.minimum(0.3, price / 5000)
+    eco_bits = rng.random((count, len(_ECO_NAMES))) < eco_prob[:, None]
+    eco_mask = eco_bits @ (1 << np.arange(len(_ECO_NAMES)))
+
+    return {
+        "BRAND": _pick(BRANDS, brand_idx).astype(object),
+        "MODEL": _model_names(rng, brand_idx, tech_idx, sizes),
+        "DISPLAY_TECHNOLOGY": techs.astype(object),
+        "SCREEN_SIZE_INCHES": sizes,
+        "RESOLUTION": resolutions.astype(object),
+        "PRICE_USD": price,
+        "QUALITY_RATING": quality,
+        "REFRESH_RATE_HZ": refresh.astype(np.int64),
+        "SMART_TV_PLATFORM": _pick(SMART_TV_PLATFORMS, platform_idx).astype(object),
+        "HDR_FORMATS": hdr,
+        "HDMI_PORTS": hdmi.astype(np.int64),
+        "USB_PORTS": usb.astype(np.int64),
+        "AUDIO_OUTPUT_WATTS": audio,
+        "HAS_WIFI": rng.random(count) < 0.95,
+        "HAS_BLUETOOTH": rng.random(count) < 0.75,
+        "VOICE_ASSISTANT": _voice_assistants(rng, price, platform_idx),
+        "TUNER_TYPE": _pick(TUNER_TYPE, _categorical(rng, "TUNER_TYPE", count, samplers)).astype(object),
+        "MANUFACTURE_YEAR": years,
+        "ENERGY_RATING": _pick(ENERGY_STAR_RATING, _categorical(rng, "ENERGY_RATING", count, samplers)).astype(object),
+        "COUNTRY_OF_ORIGIN": _pick(COUNTRY_OF_ORIGIN, _categorical(rng, "COUNTRY_OF_ORIGIN", count, samplers)).astype(object),
+        "SUPPLIER_ID": _join_bytes([_constant_bytes("SUP", count), _number_bytes(rng.integers(1000, 10_000, count), 4)]),
+        "WAREHOUSE_LOCATION": _pick(WAREHOUSE_LOCATION, _categorical(rng, "WAREHOUSE_LOCATION", count, samplers)).astype(object),
+        "STOCK_QUANTITY": np.maximum(0, np.trunc(rng.normal(50, 30, count))).astype(np.int64),
+        "CUSTOMER_RATING": customer,
+        "IS_CURVED": rng.random(count) < 0.15,
+        "WEIGHT_KG": weight,
+        "DIMENSIONS_CM": _dimensions(rng, sizes),
+        "WARRANTY_YEARS": _pick(WARRANTY_YEARS, _categorical(rng, "WARRANTY_YEARS", count, samplers)).astype(np.int64),
+        "RELEASE_DATE": _release_dates(rng, years),
+        "COLOR": _pick(COLOR, _categorical(rng, "COLOR", count, samplers)).astype(object),
+        "ECO_CERTIFICATIONS": _ECO_TABLE[eco_mask],
+        "POWER_CONSUMPTION_WATTS": power,
+        "INPUT_LAG_MS": lag,
+    }
+
+
+def _resolve_collisions(codes, seed, existing_skus):
+    """
+    Sustituye los códigos ya presentes en ``existing_skus``.
+
+    Los sustitutos se toman de los índices más altos de la permutación,
+    que no usa ninguna fila de un conjunto de tamaño realista.
+    """
+    if isinstance(existing_skus, set):
+        taken = pd.Index(decode_skus(codes)).isin(existing_skus) if existing_skus else np.zeros(len(codes), bool)
+        contains = lambda candidates: pd.Index(decode_skus(candidates)).isin(existing_skus)
+    else:
+        taken = existing_skus.contains_codes(codes)
+        contains = existing_skus.contains_codes
+
+    missing = int(np.count_nonzero(taken))
+    next_index = SKU_SPACE - 1
+    replacements = []
+    while missing > 0:
+        candidates = sku_codes(np.arange(next_index, next_index - 2 * missing - 16, -1), seed)
+        next_index -= len(candidates)
+        free = candidates[~contains(candidates) & ~np.isin(candidates, codes)]
+        replacements.append(free[:missing])
+        missing -= len(replacements[-1])
+
+    if replacements:
+        codes = codes.copy()
+        codes[taken] = np.concatenate(replacements)
+    return codes
+
+
+def _reserve_collisions(codes, seed, existing_skus):
+    """
+    Reserva los códigos en ``existing_skus``.
+
+    Con un SkuRegistry otro proceso puede haber reservado alguno desde que se
+    comprobaron; esos se vuelven a sustituir hasta que todos quedan reservados.
+    """
+    reserved = existing_skus.reserve_codes(codes)
+    while not reserved.all():
+        codes = codes.copy()
+        pending = ~reserved
+        codes[pending] = _resolve_collisions(codes[pending], seed, existing_skus)
+        reserved[pending] = existing_skus.reserve_codes(codes[pending])
+    return codes
+
+
+def generate_columns(row_count, seed=None, start=0, existing_skus=None, weights=None, where=None):
+    """
+    Genera las columnas del conjunto de datos de forma vectorizada.
+
+    Args:
+        row_count (int): Número de filas a generar.
+        seed (int, optional): Semilla. Si no se indica, se toma de ``random``,
+            de modo que ``random.seed`` también hace reproducible este motor.
+        start (int): Índice global de la primera fila. Las filas
+            ``[start, start + row_count)`` son las mismas con cualquier troceado.
+        existing_skus (set or SkuIndex, optional): SKUs que no deben repetirse.
+            Los SKUs generados se añaden a esta colección.
+        weights (dict or str, optional): Pesos de las columnas categóricas.
+        where (dict or str, optional): Condiciones que cumplen todas las filas
+            (ver parse_where). Se aplican al muestrear, sin descartar filas.
+
+    Returns:
+        dict: Array de NumPy por columna, en el orden de COLUMN_NAMES.
+    """
+    if row_count < 0 or start < 0:
+        raise ValueError("El número de filas y la fila inicial no pueden ser negativos")
+    if start + row_count > SKU_SPACE:
+        raise ValueError(f"No se pueden generar más de {SKU_SPACE} SKUs distintos")
+    if seed is None:
+        seed = random.getrandbits(64)
+    price_sampler = None
+    if where:
+        where = parse_where(where)
+        column_weights = constrained_weights(where, weights)
+        samplers = build_samplers(column_weights)
+        if "PRICE_USD" in where:
+            price_sampler = _PriceConditionSampler(where["PRICE_USD"], column_weights)
+    else:
+        samplers = build_samplers(weights) if weights else None
+
+    first_block = start // BLOCK_SIZE
+    last_block = (start + row_count - 1) // BLOCK_SIZE if row_count else first_block - 1
+    blocks = [_generate_block(seed, block, samplers, price_sampler) for block in range(first_block, last_block + 1)]
+
+    offset = start - first_block * BLOCK_SIZE
+    columns = {}
+    codes = sku_codes(np.arange(start, start + row_count), seed)
+    if existing_skus is not None:
+        codes = _resolve_collisions(codes, seed, existing_skus)
+        if not isinstance(existing_skus, set):
+            codes = _reserve_collisions(codes, seed, existing_skus)
+    columns["PRODUCT_SKU"] = decode_skus(codes).astype(object)
+
+    for column in COLUMN_NAMES[1:]:
+        if blocks:
+            values = np.concatenate([block[column] for block in blocks])[offset:offset + row_count]
+        else:
+            values = np.array([], dtype=object)
+        columns[column] = values
+
+    if isinstance(existing_skus, set):
+        existing_skus.update(columns["PRODUCT_SKU"])
+    return columns
+
+
+def generate_frame(row_count, seed=None, start=0, existing_skus=None, weights=None, where=None):
+    """
+    Genera un DataFrame con el motor vectorizado.
+
+    Args:
+        row_count (int): Número de filas a generar.
+        seed (int, optional): Semilla (ver generate_columns).
+        start (int): Índice global de la primera fila.
+        existing_skus (set or SkuIndex, optional): SKUs que no deben repetirse.
+        weights (dict or str, optional): Pesos de las columnas categóricas.
+        where (dict or str, optional): Condiciones que cumplen todas las filas.
+
+    Returns:
+        pd.DataFrame: Datos generados con las columnas de COLUMN_NAMES.
+    """
+    columns = generate_columns(
+        row_count, seed=seed, start=start, existing_skus=existing_skus, weights=weights, where=where
+    )
+    return to_return_type(columns)
@@ -0,0 +1,178 @@
+"""
+Condiciones de generación (``where``).
+
+Describen qué filas se quieren generar, por ejemplo "OLED de más de 2000 USD
+de marcas premium". En lugar de generar todo y filtrar, el motor vectorizado
+lleva las condiciones al muestreo:
+
+* las condiciones sobre columnas categóricas ponen a cero el peso de los
+  valores excluidos, así que solo se muestrean valores válidos;
+* el rango de PRICE_USD se convierte en una distribución conjunta de marca,
+  tecnología, tamaño y resolución ponderada por la probabilidad de que el
+  ruido del precio caiga dentro del rango, y el ruido se muestrea truncado a
+  ese intervalo (ver columnar.py).
+
+El resultado sigue exactamente la distribución condicionada del generador y
+el coste es proporcional a las filas generadas.
+"""
+
+import math
+
+from .constants import CATEGORICAL_VALUES, MARKET_SHARE_WEIGHTS
+from .sampling import _resolve_weights
+
+
+# Columnas con rango que no son categóricas
+RANGE_COLUMNS = ["PRICE_USD"]
+
+# Decimales con los que se generan las columnas con rango
+RANGE_DECIMALS = {"PRICE_USD": 2}
+
+# Operadores del formato de texto, de más largo a más corto
+_OPERATORS = (">=", "<=", "=")
+
+
+def _parse_number(text):
+    try:
+        return float(text)
+    except ValueError:
+        raise ValueError(f"Valor numérico no válido en la condición: '{text}'") from None
+
+
+def _snap_range(column, low, high):
+    """Ajusta un rango a los valores que toma la columna: [1234.561, 1234.579] pasa a [1234.57, 1234.57]."""
+    scale = 10 ** RANGE_DECIMALS[column]
+    # El redondeo previo evita que 0.29 * 100 = 28.999999999999996 pierda un céntimo
+    if math.isfinite(low):
+        low = math.ceil(round(low * scale, 6)) / scale
+    if math.isfinite(high):
+        high = math.floor(round(high * scale, 6)) / scale
+    return low, high
+
+
+def _values_in_range(column, low, high):
+    """Valores de una columna categórica numérica dentro de ``[low, high]``."""
+    values = CATEGORICAL_VALUES[column]
+    if not all(isinstance(value, (int, float)) for value in values):
+        raise ValueError(f"La columna {column} no admite rangos")
+    return [value for value in values if low <= value <= high]
+
+
+def _allowed_values(column, values):
+    """Valores de una columna categórica incluidos en una lista, comparados como texto."""
+    values = [values] if isinstance(values, (str, int, float)) else list(values)
+    known = {str(value): value for value in CATEGORICAL_VALUES[column]}
+    unknown = sorted({str(value) for value in values} - set(known))
+    if unknown:
+        raise ValueError(f"Valores desconocidos en la condición de {column}: {unknown}")
+    selected = {str(value) for value in values}
+    return [value for value in CATEGORICAL_VALUES[column] if str(value) in selected]
+
+
+def _condition_from_text(text):
+    """Convierte ``COLUMNA=v1,v2``, ``COLUMNA>=x`` o ``COLUMNA<=x`` en (columna, condición)."""
+    for operator in _OPERATORS:
+        if operator in text:
+            column, value = (part.strip() for part in text.split(operator, 1))
+            if operator == "=":
+                return column, [item.strip() for item in value.split(",")]
+            bound = _parse_number(value)
+            return column, {"min": bound} if operator == ">=" else {"max": bound}
+    raise ValueError(f"Condición no válida: '{text}' (use COLUMNA=v1,v2, COLUMNA>=x o COLUMNA<=x)")
+
+
+def parse_where(spec):
+    """
+    Interpreta y valida las condiciones de generación.
+
+    Args:
+        spec (str or dict): Diccionario columna -> condición o texto con
+            condiciones separadas por ``;`` (por ejemplo
+            ``DISPLAY_TECHNOLOGY=OLED;BRAND=Samsung,LG,Sony;PRICE_USD>=2000``).
+            Una condición es un valor o una lista de valores admitidos, o un
+            diccionario ``{"min": x, "max": y}`` con límites inclusivos
+            para PRICE_USD y las columnas categóricas numéricas; PRICE_USD
+            también admite una tupla ``(mínimo, máximo)``.
+            Varias condiciones de texto sobre la misma columna se combinan.
+
+    Returns:
+        dict: Lista de valores admitidos por columna categórica y tupla
+        ``(mínimo, máximo)`` para PRICE_USD, con los límites ajustados a
+        céntimos.
+    """
+    if isinstance(spec, str):
+        conditions = []
+        for part in spec.split(";"):
+            if part.strip():
+                conditions.append(_condition_from_text(part.strip()))
+    else:
+        conditions = list(spec.items())
+
+    where = {}
+    for column, condition in conditions:
+        if column not in CATEGORICAL_VALUES and column not in RANGE_COLUMNS:
+            raise ValueError(f"La columna {column} no admite condiciones")
+        if column in RANGE_COLUMNS and isinstance(condition, (tuple, list)) and len(condition) == 2:
+            condition = {"min": condition[0], "max": condition[1]}
+
+        if isinstance(condition, dict):
+            unknown = set(condition) - {"min", "max"}
+            if unknown:
+                raise ValueError(f"Límites desconocidos en la condición de {column}: {sorted(unknown)}")
+            low = condition.get("min")
+            high = condition.get("max")
+            low = -math.inf if low is None else _parse_number(low)
+            high = math.inf if high is None else _parse_number(high)
+            if column in RANGE_COLUMNS:
+                previous_low, previous_high = where.get(column, (-math.inf, math.inf))
+                where[column] = _snap_range(column, max(low, previous_low), min(high, previous_high))
+                if where[column][0] > where[column][1]:
+                    raise ValueError(f"El rango de {column} está vacío")
+                continue
+            allowed = _values_in_range(column, low, high)
+        elif column in RANGE_COLUMNS:
+            raise ValueError(f"La columna {column} solo admite rangos (min/max)")
+        else:
+            allowed = _allowed_values(column, condition)
+
+        if column in where:
+            allowed = [value for value in where[column] if value in allowed]
+        if not allowed:
+            raise ValueError(f"Ningún valor de {column} cumple la condición")
+        where[column] = allowed
+    return where
+
+
+def constrained_weights(where, weights=None):
+    """
+    Combina los pesos de las columnas categóricas con las condiciones.
+
+    Args:
+        where (dict): Condiciones validadas por parse_where.
+        weights (dict or str, optional): Pesos de las columnas categóricas
+            (ver build_samplers).
+
+    Returns:
+        dict: Lista de pesos alineada con CATEGORICAL_VALUES para cada columna
+        con pesos o condiciones, con peso 0 en los valores excluidos.
+    """
+    if isinstance(weights, str):
+        if weights != "realistic":
+            raise ValueError(f"Pesos predefinidos no soportados: {weights}. Use 'realistic'.")
+        weights = MARKET_SHARE_WEIGHTS
+    weights = dict(weights or {})
+
+    combined = {}
+    for column in set(weights) | (set(where) & set(CATEGORICAL_VALUES)):
+        if column not in CATEGORICAL_VALUES:
+            raise ValueError(f"La columna {column} no admite pesos")
+        values = CATEGORICAL_VALUES[column]
+        column_weights = _resolve_weights(values, weights[column]) if column in weights else [1] * len(values)
+        if column in where:
+            column_weights = [
+                weight if value in where[column] else 0 for value, weight in zip(values, column_weights)
+            ]
+            if not any(column_weights):
+                raise ValueError(f"Los valores de {column} que cumplen la condición tienen peso 0")
+        combined[column] = column_weights
+    return combined
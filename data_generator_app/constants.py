@@ -68,6 +68,24 @@ WAREHOUSE_LOCATION = [
     "Shanghái", "Shenzhen", "Tokio", "Seúl", "Ámsterdam"
 ]
 
+# Región de cada ubicación de almacén
+WAREHOUSE_REGIONS = {
+    "Los Angeles": "Norteamérica", "New York": "Norteamérica", "Chicago": "Norteamérica",
+    "Houston": "Norteamérica", "Miami": "Norteamérica", "Seattle": "Norteamérica",
+    "Dallas": "Norteamérica", "Atlanta": "Norteamérica", "Denver": "Norteamérica",
+    "Boston": "Norteamérica", "Shanghái": "Asia", "Shenzhen": "Asia", "Tokio": "Asia",
+    "Seúl": "Asia", "Ámsterdam": "Europa"
+}
+
+# Partes de los nombres de proveedores
+SUPPLIER_NAME_PREFIXES = [
+    "Global", "Pacific", "Prime", "Vision", "Nova", "Delta", "Orion", "Apex",
+    "Summit", "Atlas", "Zenith", "Vertex"
+]
+SUPPLIER_NAME_SUFFIXES = [
+    "Electronics", "Distribution", "Trading", "Components", "Logistics", "Supply"
+]
+
 # Años de garantía
 WARRANTY_YEARS = [1, 2, 3, 5]
 
@@ -123,3 +141,30 @@ COLUMN_NAMES = [
     "POWER_CONSUMPTION_WATTS",
     "INPUT_LAG_MS",
 ]
+
+# Columnas categóricas que admiten pesos y sus valores posibles
+CATEGORICAL_VALUES = {
+    "BRAND": BRANDS,
+    "DISPLAY_TECHNOLOGY": DISPLAY_TECHNOLOGIES,
+    "SCREEN_SIZE_INCHES": SCREEN_SIZES_INCHES,
+    "RESOLUTION": RESOLUTIONS,
+    "MANUFACTURE_YEAR": MANUFACTURE_YEAR,
+    "SMART_TV_PLATFORM": SMART_TV_PLATFORMS,
+    "ENERGY_RATING": ENERGY_STAR_RATING,
+    "COUNTRY_OF_ORIGIN": COUNTRY_OF_ORIGIN,
+    "WAREHOUSE_LOCATION": WAREHOUSE_LOCATION,
+    "TUNER_TYPE": TUNER_TYPE,
+    "WARRANTY_YEARS": WARRANTY_YEARS,
+    "COLOR": COLOR,
+}
+
+# Cuotas de mercado aproximadas (pesos relativos alineados con cada lista)
+MARKET_SHARE_WEIGHTS = {
+    "BRAND": [20, 12, 8, 3, 3, 14, 11, 3, 6, 3, 1, 9, 1.5, 1],
+    "DISPLAY_TECHNOLOGY": [45, 10, 18, 8, 17, 0.5, 0.1],
+    "SCREEN_SIZE_INCHES": [12, 8, 12, 14, 18, 5, 15, 4, 7, 4, 1],
+    "RESOLUTION": [8, 22, 68, 2],
+    "SMART_TV_PLATFORM": [12, 16, 13, 20, 13, 8, 8, 6, 4],
+    "COUNTRY_OF_ORIGIN": [55, 12, 3, 2, 6, 10, 4, 5, 3],
+    "COLOR": [80, 6, 8, 5, 0.5, 0.5],
+}
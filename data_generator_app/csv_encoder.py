@@ -0,0 +1,265 @@
+"""
+Codificador CSV que conoce el esquema del generador.
+
+Produce los mismos bytes que ``DataFrame.to_csv(index=False)`` pero compone
+cada bloque en un único búfer sin formatear los valores uno a uno:
+
+* los valores de las listas de constants.py (y las combinaciones de
+  HDR_FORMATS y ECO_CERTIFICATIONS) se renderizan una vez, ya entrecomillados
+  si hace falta, y se copian por código;
+* los precios y calificaciones se escriben con sus decimales fijos a partir
+  de enteros escalados, con la misma representación que ``repr``;
+* los enteros se convierten en dígitos con operaciones vectorizadas.
+
+Cada columna se convierte en un búfer ``(filas, ancho)`` de bytes rellenado
+con bytes nulos; al eliminar los nulos del búfer de todas las columnas queda
+directamente el texto del CSV. Los valores que no encajan en estos casos
+(nulos, negativos, textos desconocidos...) se formatean uno a uno con
+``str``, que para ellos coincide con pandas. Los bloques con valores que
+pandas escribe con su propio formato (fechas, duraciones, decimales de
+32 bits, enteros sin signo mayores que ``int64`` o textos con bytes nulos)
+se codifican directamente con ``to_csv``.
+"""
+
+import csv
+import io
+
+import numpy as np
+import pandas as pd
+
+from .columnar import _number_bytes
+from .constants import (
+    BRANDS, COLOR, COUNTRY_OF_ORIGIN, DISPLAY_TECHNOLOGIES, ECO_FRIENDLY_CERTIFICATIONS, ENERGY_STAR_RATING,
+    HDR_FORMATS_SUPPORTED, RESOLUTIONS, SMART_TV_PLATFORMS, TUNER_TYPE, VOICE_ASSISTANT_SUPPORT,
+    WAREHOUSE_LOCATION
+)
+
+
+def _combinations(values):
+    """Textos de todos los subconjuntos de ``values`` tal como los escribe el generador."""
+    names = [value for value in values if value != "None"]
+    table = []
+    for mask in range(1 << len(names)):
+        selected = [name for bit, name in enumerate(names) if mask >> bit & 1]
+        table.append(",".join(selected) if selected else "None")
+    return table
+
+
+# Valores conocidos de las columnas de texto categóricas
+CATEGORY_VALUES = {
+    "BRAND": BRANDS,
+    "DISPLAY_TECHNOLOGY": DISPLAY_TECHNOLOGIES,
+    "RESOLUTION": RESOLUTIONS,
+    "SMART_TV_PLATFORM": SMART_TV_PLATFORMS,
+    "HDR_FORMATS": _combinations(HDR_FORMATS_SUPPORTED),
+    "VOICE_ASSISTANT": VOICE_ASSISTANT_SUPPORT,
+    "TUNER_TYPE": TUNER_TYPE,
+    "ENERGY_RATING": ENERGY_STAR_RATING,
+    "COUNTRY_OF_ORIGIN": COUNTRY_OF_ORIGIN,
+    "WAREHOUSE_LOCATION": WAREHOUSE_LOCATION,
+    "COLOR": COLOR,
+    "ECO_CERTIFICATIONS": _combinations(ECO_FRIENDLY_CERTIFICATIONS),
+}
+
+# Decimales con los que el generador redondea cada columna decimal
+FLOAT_DECIMALS = {"PRICE_USD": 2, "CUSTOMER_RATING": 1, "WEIGHT_KG": 1}
+
+# Valor máximo que se escribe con decimales fijos; por encima repr puede
+# cambiar de representación
+_FIXED_DECIMAL_LIMIT = 1e12
+
+# Filas codificadas por lote
+ENCODE_BATCH_ROWS = 16_384
+
+# Mayor entero sin signo que se escribe como int64
+_INT64_MAX = np.iinfo(np.int64).max
+
+# Bytes que obligan a entrecomillar un campo
+_NEEDS_QUOTES = np.zeros(256, dtype=bool)
+_NEEDS_QUOTES[[ord(","), ord('"'), ord("\n"), ord("\r")]] = True
+
+
+class _PandasFormat(Exception):
+    """Valores que solo ``to_csv`` sabe escribir igual que pandas."""
+
+
+def _quote(text):
+    """Entrecomilla un campo como ``csv.QUOTE_MINIMAL``."""
+    if any(char in text for char in ',"\n\r'):
+        return '"' + text.replace('"', '""') + '"'
+    return text
+
+
+def _texts_bytes(texts):
+    """Búfer ``(n, ancho)`` con los textos en UTF-8 rellenados con bytes nulos."""
+    table = np.array([text.encode("utf-8") for text in texts] or [b""], dtype="S")
+    width = max(table.dtype.itemsize, 1)
+    return table.astype(f"S{width}").view(np.uint8).reshape(-1, width)[:len(texts)]
+
+
+def _rendered_table(values):
+    """Tabla de bytes con cada valor ya entrecomillado."""
+    return _texts_bytes([_quote(str(value)) for value in values])
+
+
+_RENDERED_CATEGORIES = {column: _rendered_table(values) for column, values in CATEGORY_VALUES.items()}
+_BOOL_TABLE = _rendered_table(["False", "True"])
+_FRACTION_TABLES = {
+    decimals: _texts_bytes([f"{fraction:0{decimals}d}".rstrip("0") or "0" for fraction in range(10 ** decimals)])
+    for decimals in set(FLOAT_DECIMALS.values())
+}
+
+
+def _merge(buffer, rows, other):
+    """Sustituye las filas ``rows`` de ``buffer`` por las de ``other``, ampliando el ancho si hace falta."""
+    width = max(buffer.shape[1], other.shape[1])
+    merged = np.zeros((len(buffer), width), dtype=np.uint8)
+    merged[:, :buffer.shape[1]] = buffer
+    merged[rows] = 0
+    merged[rows, :other.shape[1]] = other
+    return merged
+
+
+def _pandas_texts(values):
+    """Formatea valores como pandas: nulos vacíos y el resto con ``str``."""
+    return [_quote(str(value)) if not pd.isna(value) else "" for value in values]
+
+
+def _object_bytes(values, categories=None):
+    """Búfer de una columna de texto."""
+    if categories is not None:
+        codes = pd.Categorical(values, categories=CATEGORY_VALUES[categories]).codes
+        if len(codes) and codes.min() >= 0:
+            return _RENDERED_CATEGORIES[categories][codes]
+
+    # Textos ASCII sin caracteres especiales: conversión directa a bytes. Los
+    # bytes nulos se confundirían con el relleno
+    try:
+        raw = None if "\x00" in "".join(values) else values.astype("S")
+    except (UnicodeEncodeError, TypeError, ValueError):
+        raw = None
+    if raw is not None and raw.dtype.itemsize and not pd.isna(values).any():
+        buffer = raw.view(np.uint8).reshape(len(values), -1)
+        if not _NEEDS_QUOTES[buffer].any():
+            return buffer
+
+    # Caso general: cada valor distinto se formatea una sola vez
+    codes, uniques = pd.factorize(values, use_na_sentinel=True)
+    texts = _pandas_texts(uniques)
+    if any("\x00" in text for text in texts):
+        raise _PandasFormat
+    table = _texts_bytes(texts + [""])
+    return table[codes]
+
+
+def _int_bytes(values):
+    """Búfer de una columna entera."""
+    if not len(values):
+        return np.zeros((0, 1), dtype=np.uint8)
+    negative = values < 0
+    width = len(str(int(np.abs(values).max())))
+    buffer = _number_bytes(np.where(negative, 0, values), width)
+    if negative.any():
+        buffer = _merge(buffer, negative, _texts_bytes([str(value) for value in values[negative]]))
+    return buffer
+
+
+def _float_bytes(values, decimals):
+    """Búfer de una columna decimal, con ``decimals`` decimales fijos si los valores lo permiten."""
+    if decimals is None:
+        return _texts_bytes(_pandas_texts(values))
+
+    scale = 10 ** decimals
+    with np.errstate(invalid="ignore"):
+        scaled = np.rint(values * scale)
+        fixed = (
+            np.isfinite(values) & ~np.signbit(values) & (values < _FIXED_DECIMAL_LIMIT) & (scaled / scale == values)
+        )
+    scaled = np.where(fixed, scaled, 0).astype(np.int64)
+    whole, fraction = np.divmod(scaled, scale)
+    width = len(str(int(whole.max()))) if len(whole) else 1
+    buffer = np.hstack([
+        _number_bytes(whole, width),
+        np.full((len(values), 1), ord("."), dtype=np.uint8),
+        _FRACTION_TABLES[decimals][fraction],
+    ])
+    if not fixed.all():
+        buffer = _merge(buffer, ~fixed, _texts_bytes(_pandas_texts(values[~fixed])))
+    return buffer
+
+
+def _column_bytes(name, values):
+    """Búfer de bytes con el campo de cada fila de una columna."""
+    values = np.asarray(values)
+    kind = values.dtype.kind
+    if kind == "b":
+        return _BOOL_TABLE[values.astype(np.intp)]
+    if kind == "i" or kind == "u" and not (len(values) and values.max() > _INT64_MAX):
+        return _int_bytes(values.astype(np.int64))
+    if kind == "f" and values.dtype.itemsize == 8:
+        return _float_bytes(values, FLOAT_DECIMALS.get(name))
+    if kind == "O":
+        return _object_bytes(values, name if name in CATEGORY_VALUES else None)
+    raise _PandasFormat
+
+
+def _values(column):
+    """Array de una columna; las de tipos de pandas con nulos (``Int64``, ``boolean``...) pasan a objetos."""
+    if isinstance(getattr(column, "dtype", None), pd.api.extensions.ExtensionDtype):
+        return np.asarray(column, dtype=object)
+    return np.asarray(column)
+
+
+def _header(names):
+    """Línea de cabecera como la escribe pandas."""
+    line = io.StringIO()
+    csv.writer(line, lineterminator="\n").writerow(names)
+    return line.getvalue().encode("utf-8")
+
+
+def _encode_rows(columns, names, start, stop):
+    """Codifica las filas ``[start, stop)`` en un único búfer sin relleno."""
+    parts = [_column_bytes(name, columns[name][start:stop]) for name in names]
+    buffer = np.empty((stop - start, sum(part.shape[1] + 1 for part in parts)), dtype=np.uint8)
+    offset = 0
+    for part in parts:
+        width = part.shape[1]
+        buffer[:, offset:offset + width] = part
+        buffer[:, offset + width] = ord(",")
+        offset += width + 1
+    buffer[:, -1] = ord("\n")
+
+    # Al quitar el relleno nulo del búfer completo queda el CSV contiguo
+    flat = buffer.ravel()
+    return flat[flat != 0].tobytes()
+
+
+def encode_csv(columns, header=True):
+    """
+    Codifica un bloque de datos como CSV.
+
+    Las filas se procesan en lotes de ENCODE_BATCH_ROWS para que los búferes
+    intermedios quepan en la caché del procesador. Si alguna columna tiene
+    valores que pandas formatea a su manera, el bloque se codifica con
+    ``to_csv``.
+
+    Args:
+        columns (pd.DataFrame or dict): Datos a codificar; los diccionarios se
+            escriben en el orden de sus claves.
+        header (bool): Si se incluye la línea de cabecera.
+
+    Returns:
+        bytes: Texto CSV en UTF-8, igual al de ``to_csv(index=False)`` con
+        ``lineterminator="\\n"``.
+    """
+    names = list(columns.keys()) if isinstance(columns, dict) else list(columns.columns)
+    arrays = {name: _values(columns[name]) for name in names}
+    length = len(arrays[names[0]]) if names else 0
+    pieces = [_header(names)] if header else []
+    try:
+        for start in range(0, length, ENCODE_BATCH_ROWS):
+            pieces.append(_encode_rows(arrays, names, start, min(start + ENCODE_BATCH_ROWS, length)))
+    except _PandasFormat:
+        frame = columns if isinstance(columns, pd.DataFrame) else pd.DataFrame(columns)
+        return frame.to_csv(index=False, header=header, lineterminator="\n").encode("utf-8")
+    return b"".join(pieces)
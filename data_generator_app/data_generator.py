@@ -3,20 +3,47 @@ Módulo principal para generar datos sintéticos de televisiones.
 """
 
 import random
-import pandas as pd
 import numpy as np
-import uuid
-import os
 from datetime import datetime, timedelta
+from functools import lru_cache
 from .constants import (
     BRANDS, DISPLAY_TECHNOLOGIES, RESOLUTIONS, SCREEN_SIZES_INCHES, 
-    PRICE_USD, QUALITY_RATING, REFRESH_RATES_HZ, SMART_TV_PLATFORMS,
-    HDR_FORMATS_SUPPORTED, NUMBER_OF_HDMI_PORTS, NUMBER_OF_USB_PORTS,
+    PRICE_USD, QUALITY_RATING, SMART_TV_PLATFORMS,
+    NUMBER_OF_HDMI_PORTS, NUMBER_OF_USB_PORTS,
     AUDIO_OUTPUT_WATTS, VOICE_ASSISTANT_SUPPORT, TUNER_TYPE,
     COUNTRY_OF_ORIGIN, WAREHOUSE_LOCATION, WARRANTY_YEARS,
     COLOR, ECO_FRIENDLY_CERTIFICATIONS, MANUFACTURE_YEAR,
     ENERGY_STAR_RATING, COLUMN_NAMES
 )
+from .cache import DEFAULT_CACHE_MAX_BYTES, DatasetCache
+from .sampling import build_samplers
+from .columnar import generate_columns
+from .csv_encoder import encode_csv
+from .formats import check_return_type, to_return_type
+from .sku import encode_skus
+
+
+# Motores de generación disponibles
+ENGINES = ("legacy", "vectorized")
+
+# Filas que se acumulan como tuplas antes de volcarlas en las columnas
+ROW_BATCH_SIZE = 65_536
+
+# Tipo de cada columna en el DataFrame generado
+_INT_COLUMNS = {
+    "SCREEN_SIZE_INCHES", "QUALITY_RATING", "REFRESH_RATE_HZ", "HDMI_PORTS", "USB_PORTS",
+    "AUDIO_OUTPUT_WATTS", "MANUFACTURE_YEAR", "STOCK_QUANTITY", "WARRANTY_YEARS",
+    "POWER_CONSUMPTION_WATTS", "INPUT_LAG_MS"
+}
+_FLOAT_COLUMNS = {"PRICE_USD", "CUSTOMER_RATING", "WEIGHT_KG"}
+_BOOL_COLUMNS = {"HAS_WIFI", "HAS_BLUETOOTH", "IS_CURVED"}
+COLUMN_DTYPES = [
+    np.int64 if column in _INT_COLUMNS
+    else np.float64 if column in _FLOAT_COLUMNS
+    else np.bool_ if column in _BOOL_COLUMNS
+    else object
+    for column in COLUMN_NAMES
+]
 
 
 def generate_unique_sku(existing_skus):
@@ -44,21 +71,71 @@ def generate_unique_sku(existing_skus):
             return sku
 
 
-def generate_tv_data_row(sku):
+class _PendingSkus:
+    """SKUs de un índice más los del lote en curso, que aún no están reservados."""
+
+    def __init__(self, index):
+        self.index = index
+        self.batch = set()
+
+    def __contains__(self, sku):
+        return sku in self.batch or sku in self.index
+
+    def add(self, sku):
+        self.batch.add(sku)
+
+
+def _reserve_batch(rows, index):
+    """
+    Reserva en ``index`` los SKUs de un lote de filas.
+
+    Con un SkuRegistry otro proceso puede haber reservado alguno desde que se
+    comprobó; esas filas reciben un SKU nuevo hasta que todos quedan reservados.
+    """
+    rejected = np.flatnonzero(~index.reserve_codes(encode_skus([row[0] for row in rows])))
+    while len(rejected):
+        pending = _PendingSkus(index)
+        for i in rejected:
+            sku = generate_unique_sku(pending)
+            pending.add(sku)
+            rows[i] = (sku,) + rows[i][1:]
+        rejected = rejected[~index.reserve_codes(encode_skus([rows[i][0] for i in rejected]))]
+
+
+def _choice(samplers, column, values):
+    """Elige un valor con la tabla alias de la columna o de forma uniforme."""
+    if samplers is not None and column in samplers:
+        return samplers[column].sample()
+    return random.choice(values)
+
+
+def generate_tv_data_row(sku, samplers=None):
     """
     Genera una fila de datos para un televisor.
     
     Args:
         sku (str): SKU único para el producto.
+        samplers (dict, optional): Tablas alias por columna, creadas con
+            build_samplers. Las columnas sin tabla se eligen uniformemente.
         
     Returns:
         dict: Diccionario con datos del televisor.
     """
+    return dict(zip(COLUMN_NAMES, _generate_row_values(sku, samplers)))
+
+
+def _generate_row_values(sku, samplers=None):
+    """
+    Genera los valores de una fila como tupla en el orden de COLUMN_NAMES.
+    
+    Es el núcleo de generate_tv_data_row; evita construir un diccionario por
+    fila cuando las filas se vuelcan directamente en columnas.
+    """
     # Seleccionar características base
-    brand = random.choice(BRANDS)
-    display_tech = random.choice(DISPLAY_TECHNOLOGIES)
-    screen_size = random.choice(SCREEN_SIZES_INCHES)
-    resolution = random.choice(RESOLUTIONS)
+    brand = _choice(samplers, "BRAND", BRANDS)
+    display_tech = _choice(samplers, "DISPLAY_TECHNOLOGY", DISPLAY_TECHNOLOGIES)
+    screen_size = _choice(samplers, "SCREEN_SIZE_INCHES", SCREEN_SIZES_INCHES)
+    resolution = _choice(samplers, "RESOLUTION", RESOLUTIONS)
     
     # Generar modelo basado en la marca y características
     model = _generate_model_name(brand, screen_size, display_tech)
@@ -67,7 +144,7 @@ def generate_tv_data_row(sku):
     price = _generate_price(brand, screen_size, resolution, display_tech)
     
     # Generar año de fabricación
-    manufacture_year = random.choice(MANUFACTURE_YEAR)
+    manufacture_year = _choice(samplers, "MANUFACTURE_YEAR", MANUFACTURE_YEAR)
     
     # La fecha de lanzamiento debe ser consistente con el año de fabricación
     release_date = _generate_release_date(manufacture_year)
@@ -80,7 +157,7 @@ def generate_tv_data_row(sku):
     
     # Generar características técnicas
     refresh_rate = _get_refresh_rate(display_tech, price)
-    smart_platform = random.choice(SMART_TV_PLATFORMS)
+    smart_platform = _choice(samplers, "SMART_TV_PLATFORM", SMART_TV_PLATFORMS)
     
     # Generar formatos HDR (más probable en TVs premium)
     hdr_formats = _generate_hdr_formats(price, resolution)
@@ -103,7 +180,7 @@ def generate_tv_data_row(sku):
     dimensions = _calculate_dimensions(screen_size)
     
     # Características energéticas
-    energy_rating = random.choice(ENERGY_STAR_RATING)
+    energy_rating = _choice(samplers, "ENERGY_RATING", ENERGY_STAR_RATING)
     power_consumption = _calculate_power_consumption(screen_size, display_tech)
     
     # Información de juegos
@@ -111,83 +188,127 @@ def generate_tv_data_row(sku):
     
     # Información de inventario y venta
     supplier_id = f"SUP{random.randint(1000, 9999)}"
-    warehouse = random.choice(WAREHOUSE_LOCATION)
+    warehouse = _choice(samplers, "WAREHOUSE_LOCATION", WAREHOUSE_LOCATION)
     stock = max(0, int(np.random.normal(50, 30)))
     
     # Características adicionales
-    tuner = random.choice(TUNER_TYPE)
-    warranty = random.choice(WARRANTY_YEARS)
-    color = random.choice(COLOR)
+    tuner = _choice(samplers, "TUNER_TYPE", TUNER_TYPE)
+    warranty = _choice(samplers, "WARRANTY_YEARS", WARRANTY_YEARS)
+    color = _choice(samplers, "COLOR", COLOR)
     
     # Certificaciones ecológicas (más probables en marcas premium)
     eco_certs = _generate_eco_certifications(brand, price)
     
-    # Crear y retornar el diccionario de datos
-    return {
-        "PRODUCT_SKU": sku,
-        "BRAND": brand,
-        "MODEL": model,
-        "DISPLAY_TECHNOLOGY": display_tech,
-        "SCREEN_SIZE_INCHES": screen_size,
-        "RESOLUTION": resolution,
-        "PRICE_USD": price,
-        "QUALITY_RATING": quality_rating,
-        "REFRESH_RATE_HZ": refresh_rate,
-        "SMART_TV_PLATFORM": smart_platform,
-        "HDR_FORMATS": ",".join(hdr_formats) if hdr_formats else "None",
-        "HDMI_PORTS": hdmi_ports,
-        "USB_PORTS": usb_ports,
-        "AUDIO_OUTPUT_WATTS": audio_watts,
-        "HAS_WIFI": has_wifi,
-        "HAS_BLUETOOTH": has_bluetooth,
-        "VOICE_ASSISTANT": voice_assistant,
-        "TUNER_TYPE": tuner,
-        "MANUFACTURE_YEAR": manufacture_year,
-        "ENERGY_RATING": energy_rating,
-        "COUNTRY_OF_ORIGIN": random.choice(COUNTRY_OF_ORIGIN),
-        "SUPPLIER_ID": supplier_id,
-        "WAREHOUSE_LOCATION": warehouse,
-        "STOCK_QUANTITY": stock,
-        "CUSTOMER_RATING": customer_rating,
-        "IS_CURVED": is_curved,
-        "WEIGHT_KG": weight_kg,
-        "DIMENSIONS_CM": dimensions,
-        "WARRANTY_YEARS": warranty,
-        "RELEASE_DATE": release_date,
-        "COLOR": color,
-        "ECO_CERTIFICATIONS": ",".join(eco_certs) if eco_certs else "None",
-        "POWER_CONSUMPTION_WATTS": power_consumption,
-        "INPUT_LAG_MS": input_lag_ms
-    }
-
-
-def generate_television_data(row_count: int) -> pd.DataFrame:
+    # Valores en el orden de COLUMN_NAMES
+    return (
+        sku,
+        brand,
+        model,
+        display_tech,
+        screen_size,
+        resolution,
+        price,
+        quality_rating,
+        refresh_rate,
+        smart_platform,
+        ",".join(hdr_formats) if hdr_formats else "None",
+        hdmi_ports,
+        usb_ports,
+        audio_watts,
+        has_wifi,
+        has_bluetooth,
+        voice_assistant,
+        tuner,
+        manufacture_year,
+        energy_rating,
+        _choice(samplers, "COUNTRY_OF_ORIGIN", COUNTRY_OF_ORIGIN),
+        supplier_id,
+        warehouse,
+        stock,
+        customer_rating,
+        is_curved,
+        weight_kg,
+        dimensions,
+        warranty,
+        release_date,
+        color,
+        ",".join(eco_certs) if eco_certs else "None",
+        power_consumption,
+        input_lag_ms,
+    )
+
+
+def generate_television_data(row_count: int, existing_skus=None, weights=None, engine="legacy",
+                             return_type="pandas", seed=None, start=0, where=None):
     """
     Genera un conjunto de datos de televisiones.
     
     Args:
         row_count (int): Número de filas a generar.
+        existing_skus (set or SkuIndex, optional): SKUs ya utilizados que no
+            deben repetirse. Los SKUs generados se añaden a esta colección;
+            en un SkuIndex (o un SkuRegistry compartido) se reservan por
+            lotes con ``reserve_codes``.
+        weights (dict or str, optional): Pesos de las columnas categóricas
+            (ver build_samplers). Por defecto todas son uniformes.
+        engine (str): ``legacy`` genera fila a fila con ``random``;
+            ``vectorized`` genera columnas completas con NumPy (ver
+            columnar.py), con otra secuencia aleatoria.
+        return_type (str): ``pandas`` (DataFrame), ``numpy`` (diccionario de
+            arrays por columna), ``structured`` (array estructurado de NumPy)
+            o ``arrow`` (tabla de pyarrow). Salvo ``pandas``, el resultado se
+            construye sin pasar por pandas.
+        seed (int, optional): Semilla del motor vectorizado.
+        start (int): Índice global de la primera fila con el motor
+            vectorizado (ver generate_columns).
+        where (dict or str, optional): Condiciones que cumplen todas las
+            filas con el motor vectorizado (ver parse_where), aplicadas al
+            muestrear en lugar de filtrar.
         
     Returns:
-        pd.DataFrame: DataFrame con los datos generados.
+        pd.DataFrame: DataFrame con los datos generados, o el tipo indicado
+        en ``return_type``.
     """
-    data_rows = []
-    generated_skus = set()
-    
-    for _ in range(row_count):
-        # Generar SKU único
-        sku = generate_unique_sku(generated_skus)
-        generated_skus.add(sku)
+    if engine not in ENGINES:
+        raise ValueError(f"Motor no soportado: {engine}. Use 'legacy' o 'vectorized'.")
+    check_return_type(return_type)
+    if engine == "vectorized":
+        columns = generate_columns(
+            row_count, seed=seed, start=start, existing_skus=existing_skus, weights=weights, where=where
+        )
+        return to_return_type(columns, return_type)
+    if seed is not None or start:
+        raise ValueError("La semilla y el índice inicial solo están disponibles con el motor vectorizado")
+    if where:
+        raise ValueError("Las condiciones de generación solo están disponibles con el motor vectorizado")
+    
+    generated_skus = set() if existing_skus is None else existing_skus
+    index = None if isinstance(generated_skus, set) else generated_skus
+    samplers = build_samplers(weights) if weights else None
+    
+    # Columnas con su tipo final reservadas de antemano; las filas se generan
+    # en el mismo orden y con las mismas llamadas aleatorias que
+    # generate_tv_data_row y se vuelcan por lotes
+    columns = [np.empty(row_count, dtype=dtype) for dtype in COLUMN_DTYPES]
+    for batch_start in range(0, row_count, ROW_BATCH_SIZE):
+        batch_end = min(batch_start + ROW_BATCH_SIZE, row_count)
+        rows = []
+        pending = generated_skus if index is None else _PendingSkus(index)
+        for _ in range(batch_end - batch_start):
+            # Generar SKU único
+            sku = generate_unique_sku(pending)
+            pending.add(sku)
+            rows.append(_generate_row_values(sku, samplers))
+        if index is not None:
+            _reserve_batch(rows, index)
         
-        # Generar fila de datos
-        row = generate_tv_data_row(sku)
-        data_rows.append(row)
-    
-    # Crear DataFrame con columnas en el orden definido
-    df = pd.DataFrame(data_rows)
+        # Transponer el lote y copiarlo en cada columna (la asignación por
+        # tramos admite columnas de objetos, a diferencia de np.fromiter
+        # antes de NumPy 1.23)
+        for column, values in zip(columns, zip(*rows)):
+            column[batch_start:batch_end] = values
     
-    # Reorganizar las columnas según el orden definido en COLUMN_NAMES
-    return df[COLUMN_NAMES]
+    return to_return_type(dict(zip(COLUMN_NAMES, columns)), return_type)
 
 
 # Funciones auxiliares para la generación realista de datos
@@ -474,20 +595,26 @@ def _calculate_input_lag(refresh_rate, display_tech):
     return max(1, round(lag))
 
 
-def _generate_release_date(year):
-    """Genera una fecha de lanzamiento basada en el año de fabricación."""
-    # Los modelos suelen lanzarse en el primer semestre del año
+@lru_cache(maxsize=None)
+def _first_half_dates(year):
+    """Fechas del 1 de enero al 30 de junio de un año, ya formateadas."""
     start_date = datetime(year, 1, 1)
     end_date = datetime(year, 6, 30)
-    
-    # Número de días entre las fechas
     days_between = (end_date - start_date).days
+    return tuple(
+        (start_date + timedelta(days=day)).strftime("%Y-%m-%d")
+        for day in range(days_between + 1)
+    )
+
+
+def _generate_release_date(year):
+    """Genera una fecha de lanzamiento basada en el año de fabricación."""
+    # Los modelos suelen lanzarse en el primer semestre del año; las fechas
+    # formateadas se calculan una vez por año
+    dates = _first_half_dates(year)
     
     # Fecha aleatoria dentro del rango
-    random_days = random.randint(0, days_between)
-    release_date = start_date + timedelta(days=random_days)
-    
-    return release_date.strftime("%Y-%m-%d")
+    return dates[random.randint(0, len(dates) - 1)]
 
 
 def _generate_eco_certifications(brand, price):
@@ -521,28 +648,52 @@ class TelevisionDataGenerator:
     Clase para generar datos sintéticos de televisiones con diferentes atributos.
     """
     
-    def __init__(self, seed=None):
+    def __init__(self, seed=None, cache_dir=None, cache_max_bytes=DEFAULT_CACHE_MAX_BYTES, weights=None,
+                 engine="legacy"):
         """
         Inicializa el generador de datos.
         
         Args:
             seed (int, optional): Semilla para reproducibilidad. Por defecto None.
+            cache_dir (str, optional): Directorio de una caché en disco de los
+                conjuntos generados. Solo se usa si hay semilla.
+            cache_max_bytes (int): Tamaño máximo de la caché.
+            weights (dict or str, optional): Pesos de las columnas categóricas
+                (ver build_samplers).
+            engine (str): Motor de generación ('legacy' o 'vectorized').
         """
+        self.seed = seed
+        self.weights = weights
+        self.engine = engine
+        self.cache = None
         if seed is not None:
             random.seed(seed)
             np.random.seed(seed)
+            if cache_dir is not None:
+                self.cache = DatasetCache(cache_dir, max_bytes=cache_max_bytes)
     
     def generate_tv_data(self, num_records=100):
         """
         Genera datos sintéticos para televisores.
         
+        Si hay caché, se reutiliza un conjunto almacenado cuando coinciden el
+        estado aleatorio, el número de registros y la huella del esquema.
+        
         Args:
             num_records (int): Número de registros a generar.
             
         Returns:
             pandas.DataFrame: DataFrame con los datos generados.
         """
-        return generate_television_data(num_records)
+        if self.cache is None:
+            return generate_television_data(num_records, weights=self.weights, engine=self.engine)
+        
+        key = self.cache.key(num_records, options={"weights": self.weights, "engine": self.engine})
+        data = self.cache.load(key)
+        if data is None:
+            data = generate_television_data(num_records, weights=self.weights, engine=self.engine)
+            self.cache.store(key, data)
+        return data
     
     def save_data(self, data, format="csv", filename="tv_data"):
         """
@@ -558,7 +709,8 @@ class TelevisionDataGenerator:
         """
         if format.lower() == "csv":
             file_path = f"{filename}.csv"
-            data.to_csv(file_path, index=False)
+            with open(file_path, "wb") as f:
+                f.write(encode_csv(data))
         elif format.lower() == "json":
             file_path = f"{filename}.json"
             data.to_json(file_path, orient="records", indent=4)
@@ -0,0 +1,275 @@
+"""
+Ordenación externa de conjuntos mayores que la memoria.
+
+Para escribir el catálogo agrupado por BRAND, PRICE_USD o RELEASE_DATE sin
+tenerlo entero en memoria:
+
+1. cada bloque generado se ordena en memoria (una *run*) y se vuelca a un
+   archivo temporal como registros binarios de ancho fijo (ver
+   binary_format.py), en varios hilos a la vez;
+2. las runs se mezclan en k vías leyendo de cada una una ventana pequeña
+   con ``numpy.memmap``. En cada paso se ordenan juntas las ventanas y se
+   emiten las filas que no superan a la última fila de la ventana que antes
+   se agota: ninguna fila pendiente de leer puede ir delante de ellas. Las
+   filas empatadas con esa última fila se emiten run a run sin volver a
+   ordenarlas, de modo que una clave con pocos valores (BRAND) necesita del
+   orden de un paso por valor y no uno por ventana.
+
+Los empates se resuelven por la posición original de la fila, así que el
+resultado es el mismo que ordenar todo el conjunto de forma estable. El
+texto se ordena alfabéticamente; SUPPLIER_ID y DIMENSIONS_CM, por su valor
+numérico.
+"""
+
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from .binary_format import (
+    CATEGORY_COLUMNS, RECORD_DTYPE, SET_COLUMNS, _set_table, decode_records, encode_records
+)
+from .constants import COLUMN_NAMES
+
+
+# Hilos que ordenan y vuelcan runs a la vez
+DEFAULT_SORT_WORKERS = min(4, os.cpu_count() or 1)
+
+# Filas mínimas de la ventana de lectura de cada run durante la mezcla
+MIN_MERGE_WINDOW = 1_024
+
+
+def parse_sort_by(spec):
+    """
+    Interpreta las columnas por las que ordenar.
+
+    Args:
+        spec (str or list): Columnas separadas por comas (por ejemplo
+            ``BRAND,PRICE_USD``) o lista de columnas, de más a menos prioritaria.
+
+    Returns:
+        list: Columnas validadas.
+    """
+    columns = [column.strip() for column in spec.split(",")] if isinstance(spec, str) else list(spec)
+    columns = [column for column in columns if column]
+    if not columns:
+        raise ValueError("Indique al menos una columna por la que ordenar")
+    unknown = [column for column in columns if column not in COLUMN_NAMES]
+    if unknown:
+        raise ValueError(f"Columnas desconocidas para ordenar: {unknown}")
+    if len(set(columns)) != len(columns):
+        raise ValueError("Las columnas por las que ordenar no pueden repetirse")
+    return columns
+
+
+def _rank_table(values):
+    """Posición alfabética de cada valor de una lista."""
+    return np.argsort(np.argsort(np.asarray(values, dtype=object), kind="stable"), kind="stable")
+
+
+# Posición alfabética de cada código de las columnas codificadas
+_RANKS = {column: _rank_table(values) for column, values in CATEGORY_COLUMNS.items()}
+_RANKS.update({column: _rank_table(_set_table(names)) for column, names in SET_COLUMNS.items()})
+
+
+def _sort_keys(records, by):
+    """
+    Claves de ordenación de unos registros, de más a menos prioritaria.
+
+    Se calculan sobre los registros binarios sin decodificarlos: los códigos
+    de texto se traducen a su posición alfabética y el resto de campos ya se
+    ordenan como sus valores.
+    """
+    keys = []
+    for column in by:
+        values = records[column]
+        if column in _RANKS:
+            keys.append(_RANKS[column][values])
+        elif values.ndim == 2:
+            # DIMENSIONS_CM: ancho, alto y profundidad
+            keys.extend(values[:, axis] for axis in range(values.shape[1]))
+        else:
+            keys.append(values)
+    return keys
+
+
+def _lexsort(keys):
+    """Orden estable según una lista de claves, de más a menos prioritaria."""
+    return np.lexsort(keys[::-1])
+
+
+def sort_frame(df, by):
+    """
+    Ordena un DataFrame completo con el mismo criterio que external_sort.
+
+    Args:
+        df (pd.DataFrame): Datos generados.
+        by (str or list): Columnas por las que ordenar (ver parse_sort_by).
+
+    Returns:
+        pd.DataFrame: Filas ordenadas con un índice nuevo.
+    """
+    order = _lexsort(_sort_keys(encode_records(df), parse_sort_by(by)))
+    return df.iloc[order].reset_index(drop=True)
+
+
+def _spill_run(chunk, by, path):
+    """Ordena un bloque y lo vuelca como registros binarios."""
+    records = encode_records(chunk)
+    records[_lexsort(_sort_keys(records, by))].tofile(path)
+    return len(records)
+
+
+def _key_at(run, index, by):
+    """Clave de ordenación de una fila de una run."""
+    return tuple(key[0] for key in _sort_keys(run[index:index + 1], by))
+
+
+def _stretch_end(run, start, key, by):
+    """
+    Fin del tramo de filas con clave ``key`` que empieza en ``start``.
+
+    Las filas desde ``start`` no son menores que ``key``, así que basta una
+    búsqueda binaria sobre el memmap, que solo lee O(log n) filas.
+    """
+    low, high = start, len(run)
+    while low < high:
+        middle = (low + high) // 2
+        if _key_at(run, middle, by) == key:
+            low = middle + 1
+        else:
+            high = middle
+    return low
+
+
+def _merge_runs(paths, lengths, by, window, batch_rows):
+    """
+    Mezcla runs ordenadas y produce los registros ordenados en lotes.
+
+    Cada paso ordena junto lo que hay en las ventanas y emite hasta la última
+    fila de la ventana que antes se agota. Con claves muy repetidas (BRAND,
+    tamaños...) esa ventana suele ser entera de un mismo valor ``v``; en lugar
+    de avanzar una ventana por paso, tras el corte ya no queda ninguna fila
+    menor que ``v`` y las filas iguales a ``v`` van run a run, así que se
+    emiten directamente, leyendo del memmap el resto del tramo de cada run.
+    """
+    runs = [np.memmap(path, dtype=RECORD_DTYPE, mode="r", shape=(length,)) for path, length in zip(paths, lengths)]
+    offsets = np.zeros(len(runs), dtype=np.int64)
+    buffers = [np.array(run[:window]) for run in runs]
+    offsets += [len(buffer) for buffer in buffers]
+    while True:
+        active = [i for i, buffer in enumerate(buffers) if len(buffer)]
+        if not active:
+            break
+        batch = np.concatenate([buffers[i] for i in active])
+        sizes = np.array([len(buffers[i]) for i in active])
+        run_ids = np.repeat(np.arange(len(active)), sizes)
+        # Posición de cada fila en su run, para desempatar como el orden original
+        positions = np.concatenate([np.arange(offsets[i] - len(buffers[i]), offsets[i]) for i in active])
+        keys = _sort_keys(batch, by)
+        order = _lexsort(keys + [run_ids, positions])
+
+        ranks = np.empty(len(order), dtype=np.int64)
+        ranks[order] = np.arange(len(order))
+        ends = np.cumsum(sizes) - 1
+        pending = [ends[j] for j, i in enumerate(active) if offsets[i] < len(runs[i])]
+        cut = ranks[pending].min() + 1 if pending else len(order)
+
+        emitted = order[:cut]
+        yield batch[emitted]
+
+        # De cada run se ha emitido un prefijo de su ventana
+        taken = np.bincount(run_ids[emitted], minlength=len(active))
+        remaining = np.ones(len(batch), dtype=bool)
+        remaining[emitted] = False
+        for j, i in enumerate(active):
+            buffers[i] = buffers[i][taken[j]:]
+
+        # Empates con la última fila emitida: son un prefijo de lo que queda de cada run
+        bound = order[cut - 1]
+        value = tuple(key[bound] for key in keys)
+        equal = np.ones(len(batch), dtype=bool)
+        for key, bound_key in zip(keys, value):
+            equal &= key == bound_key
+        tied = np.bincount(run_ids[equal & remaining], minlength=len(active))
+        for j, i in enumerate(active):
+            continues = equal[ends[j]] and offsets[i] < len(runs[i])
+            if not tied[j] and not continues:
+                continue
+            if tied[j]:
+                yield buffers[i][:tied[j]]
+                buffers[i] = buffers[i][tied[j]:]
+            if not len(buffers[i]) and continues:
+                stop = _stretch_end(runs[i], offsets[i], value, by)
+                for first in range(offsets[i], stop, batch_rows):
+                    yield np.array(runs[i][first:min(first + batch_rows, stop)])
+                offsets[i] = stop
+
+        # Se rellena cada ventana hasta su tamaño
+        for i in active:
+            rest = buffers[i]
+            refill = runs[i][offsets[i]:offsets[i] + window - len(rest)]
+            buffers[i] = np.concatenate([rest, refill]) if len(refill) else rest
+            offsets[i] += len(refill)
+        del batch, order, ranks, emitted, keys
+
+
+def _rebatch(batches, rows):
+    """Reagrupa lotes de registros en lotes de exactamente ``rows`` filas (salvo el último)."""
+    pieces, size = [], 0
+    for batch in batches:
+        if not len(batch):
+            continue
+        pieces.append(batch)
+        size += len(batch)
+        if size >= rows:
+            merged = np.concatenate(pieces)
+            for first in range(0, len(merged) - rows + 1, rows):
+                yield merged[first:first + rows]
+            tail = merged[len(merged) - len(merged) % rows:]
+            pieces, size = ([tail], len(tail)) if len(tail) else ([], 0)
+    if pieces:
+        yield np.concatenate(pieces)
+
+
+def external_sort(chunks, by, chunk_size, tmp_dir=None, max_workers=DEFAULT_SORT_WORKERS):
+    """
+    Ordena bloques de datos con memoria acotada.
+
+    Args:
+        chunks (iterable): Bloques de datos generados (pd.DataFrame).
+        by (str or list): Columnas por las que ordenar (ver parse_sort_by).
+        chunk_size (int): Filas por bloque de la entrada; acota las filas que
+            se leen a la vez de todas las runs durante la mezcla.
+        tmp_dir (str, optional): Directorio de los archivos temporales.
+        max_workers (int): Hilos que ordenan y vuelcan runs a la vez.
+
+    Yields:
+        pd.DataFrame: Bloques consecutivos de la salida ordenada, de
+        ``chunk_size`` filas salvo el último.
+    """
+    by = parse_sort_by(by)
+    with tempfile.TemporaryDirectory(prefix="tv-sort-", dir=tmp_dir) as directory:
+        paths = []
+        pending = []
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            for chunk in chunks:
+                if not len(chunk):
+                    continue
+                # Como mucho max_workers bloques esperan a volcarse
+                if len(pending) >= max_workers:
+                    pending.pop(0).result()
+                paths.append(os.path.join(directory, f"run-{len(paths):06d}.bin"))
+                pending.append(pool.submit(_spill_run, chunk, by, paths[-1]))
+                del chunk
+        # Propaga los errores de las últimas runs
+        for future in pending:
+            future.result()
+        if not paths:
+            return
+        lengths = [os.path.getsize(path) // RECORD_DTYPE.itemsize for path in paths]
+
+        window = max(chunk_size // len(paths), MIN_MERGE_WINDOW)
+        for records in _rebatch(_merge_runs(paths, lengths, by, window, chunk_size), chunk_size):
+            yield decode_records(records)
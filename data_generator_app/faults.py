@@ -0,0 +1,309 @@
+"""
+Inyección de fallos de calidad de datos.
+
+Sirve para probar procesos de limpieza: sobre los bloques generados se
+introducen nulos, SKUs duplicados, dimensiones mal formadas, valores
+numéricos fuera de rango y erratas en los textos, con una tasa por columna y
+tipo de fallo.
+
+Las celdas afectadas se eligen con máscaras vectorizadas. Los números
+aleatorios salen de un hash (splitmix64) de la semilla, el índice global de
+la fila y la columna, así que las filas corrompidas no dependen del tamaño de
+bloque y cada fragmento de una generación repartida corrompe las mismas filas
+que la generación completa. Solo el SKU que copia un duplicado depende del
+bloque, porque se toma de otra fila del mismo bloque. Cada celda recibe como mucho un fallo, y todos
+quedan registrados en un manifiesto con la fila, la columna, el tipo de fallo
+y los valores original y corrompido.
+"""
+
+import json
+
+import numpy as np
+import pandas as pd
+
+from .constants import COLUMN_NAMES
+from .csv_encoder import encode_csv
+from .price_history import _splitmix64
+
+
+# Tipos de fallo, en el orden en que se reparten las tasas de cada columna
+FAULT_TYPES = ("null", "duplicate_sku", "malformed_dimensions", "out_of_range", "typo")
+
+# Columnas numéricas a las que se puede aplicar out_of_range
+NUMERIC_COLUMNS = [
+    "SCREEN_SIZE_INCHES", "PRICE_USD", "QUALITY_RATING", "REFRESH_RATE_HZ", "HDMI_PORTS", "USB_PORTS",
+    "AUDIO_OUTPUT_WATTS", "MANUFACTURE_YEAR", "STOCK_QUANTITY", "CUSTOMER_RATING", "WEIGHT_KG", "WARRANTY_YEARS",
+    "POWER_CONSUMPTION_WATTS", "INPUT_LAG_MS",
+]
+
+# Columnas de texto a las que se puede aplicar typo
+TEXT_COLUMNS = [
+    "BRAND", "MODEL", "DISPLAY_TECHNOLOGY", "RESOLUTION", "SMART_TV_PLATFORM", "VOICE_ASSISTANT", "TUNER_TYPE",
+    "ENERGY_RATING", "COUNTRY_OF_ORIGIN", "SUPPLIER_ID", "WAREHOUSE_LOCATION", "COLOR",
+]
+
+# Columnas admitidas por cada tipo de fallo (None: todas)
+FAULT_COLUMNS = {
+    "null": None,
+    "duplicate_sku": ["PRODUCT_SKU"],
+    "malformed_dimensions": ["DIMENSIONS_CM"],
+    "out_of_range": NUMERIC_COLUMNS,
+    "typo": TEXT_COLUMNS,
+}
+
+# Tasas del perfil 'default'
+DEFAULT_FAULT_RATES = {
+    "PRODUCT_SKU": {"duplicate_sku": 0.005},
+    "BRAND": {"typo": 0.01},
+    "PRICE_USD": {"null": 0.005, "out_of_range": 0.005},
+    "CUSTOMER_RATING": {"null": 0.01},
+    "DIMENSIONS_CM": {"malformed_dimensions": 0.01},
+}
+
+MANIFEST_COLUMNS = ["ROW", "COLUMN", "FAULT", "ORIGINAL_VALUE", "CORRUPTED_VALUE"]
+
+# Variantes de las dimensiones mal formadas
+_DIMENSION_VARIANTS = 5
+
+# Propósitos de los números aleatorios de cada columna
+_PURPOSE_SELECT = 0
+_PURPOSE_VARIANT = 1
+_PURPOSE_POSITION = 2
+
+
+def parse_faults(spec):
+    """
+    Interpreta la configuración de fallos.
+
+    Args:
+        spec (str or dict): ``default``, ruta de un JSON, un diccionario
+            columna -> {tipo: tasa} o un texto ``COLUMNA:tipo=tasa,...``
+            (por ejemplo ``BRAND:typo=0.01,PRICE_USD:null=0.02``).
+
+    Returns:
+        dict: Tasas por columna y tipo de fallo, validadas.
+    """
+    if isinstance(spec, dict):
+        rates = spec
+    elif spec == "default":
+        rates = DEFAULT_FAULT_RATES
+    elif spec.endswith(".json"):
+        with open(spec, encoding="utf-8") as f:
+            rates = json.load(f)
+    else:
+        rates = {}
+        for item in spec.split(","):
+            try:
+                column, assignment = item.split(":")
+                fault, rate = assignment.split("=")
+                rates.setdefault(column.strip(), {})[fault.strip()] = float(rate)
+            except ValueError:
+                raise ValueError(f"Fallo no válido: '{item}' (formato COLUMNA:tipo=tasa)") from None
+
+    validated = {}
+    for column, faults in rates.items():
+        if column not in COLUMN_NAMES:
+            raise ValueError(f"Columna desconocida en la configuración de fallos: {column}")
+        for fault, rate in faults.items():
+            if fault not in FAULT_TYPES:
+                raise ValueError(f"Tipo de fallo desconocido: {fault} (tipos: {', '.join(FAULT_TYPES)})")
+            allowed = FAULT_COLUMNS[fault]
+            if allowed is not None and column not in allowed:
+                raise ValueError(f"El fallo {fault} no se puede aplicar a la columna {column}")
+            if not 0 <= rate <= 1:
+                raise ValueError(f"La tasa de {column}:{fault} debe estar entre 0 y 1")
+        if sum(faults.values()) > 1:
+            raise ValueError(f"Las tasas de la columna {column} suman más de 1")
+        validated[column] = {fault: float(faults[fault]) for fault in FAULT_TYPES if faults.get(fault)}
+    return {column: faults for column, faults in validated.items() if faults}
+
+
+def _uniform(seed_key, rows, stream):
+    """Uniformes en ``[0, 1)`` para cada fila global de un flujo."""
+    mixed = _splitmix64(seed_key ^ _splitmix64(rows.astype(np.uint64) * np.uint64(256) + np.uint64(stream)))
+    return (mixed >> np.uint64(11)).astype(np.float64) * (1.0 / (1 << 53))
+
+
+def _nullable(values):
+    """Convierte una columna a un tipo que admite nulos sin cambiar cómo se escriben sus valores."""
+    if pd.api.types.is_bool_dtype(values.dtype):
+        return values.astype("boolean")
+    if pd.api.types.is_integer_dtype(values.dtype):
+        return values.astype("Int64")
+    return values
+
+
+def _typo(text, variant, position):
+    """Introduce una errata: intercambio, omisión o repetición de un carácter."""
+    if len(text) < 2:
+        return text + text
+    index = int(position * (len(text) - 1))
+    if variant == 0:
+        return text[:index] + text[index + 1] + text[index] + text[index + 2:]
+    if variant == 1:
+        return text[:index] + text[index + 1:]
+    return text[:index + 1] + text[index:]
+
+
+def _malformed_dimensions(text, variant):
+    """Rompe el formato ``AnchoW x AltoH x FondoD`` de DIMENSIONS_CM."""
+    if variant == 0:
+        return text.rsplit(" x ", 1)[0]
+    if variant == 1:
+        return text.replace(" x ", "*")
+    if variant == 2:
+        return f"{text} cm"
+    if variant == 3:
+        return text.replace(".", ",")
+    return "N/A"
+
+
+def _out_of_range(values, variant):
+    """Valores negativos o mil veces mayores que los originales."""
+    values = np.asarray(values)
+    corrupted = np.where(variant == 0, -np.maximum(np.abs(values), 1), values * 1000)
+    if values.dtype.kind == "f":
+        return np.round(corrupted, 2)
+    return corrupted.astype(values.dtype)
+
+
+class FaultInjector:
+    """
+    Etapa de la generación por bloques que corrompe celdas y registra cuáles.
+
+    Los bloques deben llegar en orden: el primero empieza en la fila global
+    ``start`` y cada uno continúa donde acabó el anterior.
+    """
+
+    def __init__(self, rates, seed, start=0):
+        """
+        Inicializa la etapa.
+
+        Args:
+            rates (str or dict): Configuración de fallos (ver parse_faults).
+            seed (int): Semilla de la selección de celdas.
+            start (int): Índice global de la primera fila del primer bloque.
+        """
+        self.rates = parse_faults(rates)
+        self.seed = seed
+        self.next_row = start
+        self._seed_key = _splitmix64(np.array([seed & (2 ** 64 - 1)], dtype=np.uint64))
+        self._manifests = []
+
+    def _uniform(self, rows, column, purpose):
+        return _uniform(self._seed_key, rows, COLUMN_NAMES.index(column) * 4 + purpose)
+
+    def inject(self, chunk):
+        """
+        Corrompe un bloque.
+
+        Args:
+            chunk (pd.DataFrame): Bloque generado.
+
+        Returns:
+            pd.DataFrame: Copia del bloque con los fallos. Las columnas que
+            pueden recibir nulos pasan a tipos que los admiten en todos los
+            bloques, para que el esquema no cambie entre bloques.
+        """
+        rows = np.arange(self.next_row, self.next_row + len(chunk), dtype=np.uint64)
+        self.next_row += len(chunk)
+        # Solo se copian las columnas que se modifican
+        chunk = chunk.copy(deep=False)
+
+        for column, faults in self.rates.items():
+            original = chunk[column].to_numpy()
+            corrupted = _nullable(chunk[column]).array.copy() if "null" in faults else original.copy()
+
+            # Cada celda recibe el fallo cuyo tramo de [0, 1) contiene su uniforme
+            u = self._uniform(rows, column, _PURPOSE_SELECT)
+            selected = np.searchsorted(np.cumsum(list(faults.values())), u, side="right")
+            variant_u = self._uniform(rows, column, _PURPOSE_VARIANT)
+            position_u = self._uniform(rows, column, _PURPOSE_POSITION)
+
+            for code, fault in enumerate(faults):
+                positions = np.flatnonzero(selected == code)
+                if not len(positions):
+                    continue
+                previous = original[positions]
+                if fault == "null":
+                    values = None
+                elif fault == "duplicate_sku":
+                    # El SKU se copia de otra fila del bloque que no se modifica
+                    sources = np.flatnonzero(selected == len(faults))
+                    if not len(sources):
+                        continue
+                    values = original[sources[(position_u[positions] * len(sources)).astype(np.intp)]]
+                elif fault == "malformed_dimensions":
+                    variants = (variant_u[positions] * _DIMENSION_VARIANTS).astype(np.intp)
+                    values = [_malformed_dimensions(text, variant) for text, variant in zip(previous, variants)]
+                elif fault == "out_of_range":
+                    values = _out_of_range(previous, (variant_u[positions] * 2).astype(np.intp))
+                else:
+                    variants = (variant_u[positions] * 3).astype(np.intp)
+                    values = [_typo(text, variant, position)
+                              for text, variant, position in zip(previous, variants, position_u[positions])]
+
+                corrupted[positions] = values
+                self._manifests.append(pd.DataFrame({
+                    "ROW": rows[positions].astype(np.int64),
+                    "COLUMN": column,
+                    "FAULT": fault,
+                    "ORIGINAL_VALUE": pd.array(previous, dtype=object),
+                    "CORRUPTED_VALUE": pd.array(corrupted[positions], dtype=object),
+                }))
+            chunk[column] = pd.Series(corrupted, index=chunk.index, name=column)
+        return chunk
+
+    def apply(self, chunks):
+        """
+        Corrompe los bloques de un iterable según se consumen.
+
+        Args:
+            chunks (iterable): Bloques generados (pandas.DataFrame).
+
+        Yields:
+            pd.DataFrame: Bloques con los fallos.
+        """
+        for chunk in chunks:
+            chunk = self.inject(chunk)
+            yield chunk
+            # Sin esta referencia el bloque se libera antes de generar el siguiente
+            del chunk
+
+    @property
+    def manifest(self):
+        """pd.DataFrame: Celdas corrompidas hasta ahora, ordenadas por fila y columna."""
+        if not self._manifests:
+            return pd.DataFrame({name: pd.Series(dtype=object) for name in MANIFEST_COLUMNS}).astype({"ROW": np.int64})
+        manifest = pd.concat(self._manifests, ignore_index=True)
+        order = np.lexsort((manifest["COLUMN"].map(COLUMN_NAMES.index).to_numpy(), manifest["ROW"].to_numpy()))
+        return manifest.iloc[order].reset_index(drop=True)
+
+    def counts(self):
+        """
+        Resume el manifiesto.
+
+        Returns:
+            pd.Series: Número de celdas corrompidas por columna y tipo de fallo.
+        """
+        return self.manifest.groupby(["COLUMN", "FAULT"], sort=False).size()
+
+    def write_manifest(self, path, max_row=None):
+        """
+        Escribe el manifiesto como CSV.
+
+        Args:
+            path (str): Ruta del CSV.
+            max_row (int, optional): Solo se incluyen las filas globales
+                anteriores a esta, por ejemplo si no se llegaron a escribir
+                todos los bloques corrompidos.
+
+        Returns:
+            int: Número de celdas corrompidas escritas.
+        """
+        manifest = self.manifest
+        if max_row is not None:
+            manifest = manifest[manifest["ROW"] < max_row]
+        with open(path, "wb") as f:
+            f.write(encode_csv(manifest))
+        return len(manifest)
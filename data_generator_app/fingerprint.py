@@ -0,0 +1,293 @@
+"""
+Huellas por bloque y columna para verificar que una generación es reproducible.
+
+Mientras se escriben los datos se calcula un hash BLAKE2b incremental de
+cada columna en bloques de ``block_rows`` filas alineados con el índice
+global de fila. Los hashes se calculan sobre una representación canónica de
+los valores y no sobre el archivo escrito, así que no dependen del formato
+de salida, del tamaño de bloque de la escritura ni de los tipos de pandas:
+
+* los textos se codifican en UTF-8 terminados en ``\\n`` (los nulos, como
+  ``\\x00``);
+* los enteros, decimales y booleanos, como un byte de nulo seguido de su
+  valor en ``<i8``, ``<f8`` o ``u1`` (los NaN de los decimales cuentan como
+  nulos).
+
+Comparar los manifiestos de dos ejecuciones con la misma semilla dice en
+milisegundos si coinciden y, si no, el primer bloque y las columnas que
+difieren, sin volver a leer los datos.
+"""
+
+import hashlib
+import json
+import os
+import platform
+
+import numpy as np
+import pandas as pd
+
+
+# Filas por bloque de huella
+DEFAULT_FINGERPRINT_ROWS = 1_000_000
+
+MANIFEST_VERSION = 1
+
+# Bytes de cada hash
+DIGEST_SIZE = 16
+
+_NULL_TEXT = "\x00"
+
+
+def _kind(column):
+    """Tipo canónico de una columna: 'bool', 'int', 'float' o 'text'."""
+    dtype = column.dtype
+    if pd.api.types.is_bool_dtype(dtype):
+        return "bool"
+    if pd.api.types.is_integer_dtype(dtype):
+        return "int"
+    if pd.api.types.is_float_dtype(dtype):
+        return "float"
+    return "text"
+
+
+def _text_bytes(values):
+    """Textos en UTF-8 con un salto de línea tras cada fila."""
+    values = values.tolist()
+    try:
+        text = "\n".join(values)
+    except TypeError:
+        text = "\n".join(_NULL_TEXT if value is None or pd.isna(value) else str(value) for value in values)
+    return (text + "\n").encode("utf-8") if values else b""
+
+
+def _number_bytes(column, kind):
+    """Registros (nulo, valor) empaquetados de una columna numérica o booleana."""
+    dtype = {"bool": "u1", "int": "<i8", "float": "<f8"}[kind]
+    nulls = column.isna().to_numpy()
+    records = np.empty(len(column), dtype=[("null", "u1"), ("value", dtype)])
+    records["null"] = nulls
+    records["value"] = column.to_numpy(dtype=np.float64 if kind == "float" else None, na_value=0)
+    return records.tobytes()
+
+
+def canonical_bytes(column):
+    """
+    Representación canónica de una columna, concatenable fila a fila.
+
+    Args:
+        column (pd.Series): Valores de una columna.
+
+    Returns:
+        bytes: Bytes de las filas en orden; los de un conjunto de filas son
+        la concatenación de los de cualquier partición en tramos consecutivos.
+    """
+    kind = _kind(column)
+    if kind == "text":
+        return _text_bytes(column.to_numpy(dtype=object))
+    return _number_bytes(column, kind)
+
+
+def _hasher():
+    return hashlib.blake2b(digest_size=DIGEST_SIZE)
+
+
+class ChunkFingerprinter:
+    """
+    Calcula las huellas de los bloques según pasan hacia el escritor.
+
+    Args:
+        block_rows (int): Filas por bloque de huella.
+        start (int): Índice global de la primera fila, para alinear los
+            bloques de un fragmento con los del conjunto completo.
+    """
+
+    def __init__(self, block_rows=DEFAULT_FINGERPRINT_ROWS, start=0):
+        if block_rows <= 0:
+            raise ValueError("El tamaño de bloque de la huella debe ser positivo")
+        self.block_rows = block_rows
+        self.start = start
+        self.rows = 0
+        self.columns = None
+        self.blocks = []
+        self._hashers = None
+        self._block_start = start
+
+    def _current_block(self):
+        """Hashes del bloque en curso, o None si está vacío."""
+        rows = self.start + self.rows - self._block_start
+        if not rows:
+            return None
+        digests = {column: hasher.hexdigest() for column, hasher in zip(self.columns, self._hashers)}
+        return {"start": self._block_start, "rows": rows, "digests": digests}
+
+    def _close_block(self):
+        """Guarda los hashes del bloque en curso y empieza el siguiente."""
+        self.blocks.append(self._current_block())
+        self._hashers = [_hasher() for _ in self.columns]
+        self._block_start = self.start + self.rows
+
+    def update(self, chunk):
+        """
+        Añade las filas de un bloque, consecutivas a las anteriores.
+
+        Args:
+            chunk (pd.DataFrame): Filas a añadir.
+        """
+        if self.columns is None:
+            self.columns = list(chunk.columns)
+            self._hashers = [_hasher() for _ in self.columns]
+        elif list(chunk.columns) != self.columns:
+            raise ValueError("Las columnas del bloque no coinciden con las anteriores")
+
+        position = 0
+        while position < len(chunk):
+            # Se corta el bloque en los límites globales de block_rows filas
+            row = self.start + self.rows
+            take = min(len(chunk) - position, self.block_rows - row % self.block_rows)
+            piece = chunk.iloc[position:position + take]
+            for column, hasher in zip(self.columns, self._hashers):
+                hasher.update(canonical_bytes(piece[column]))
+            self.rows += take
+            position += take
+            if (self.start + self.rows) % self.block_rows == 0:
+                self._close_block()
+
+    def apply(self, chunks):
+        """
+        Calcula las huellas de un flujo de bloques sin modificarlos.
+
+        Args:
+            chunks (iterable): Bloques de datos (pd.DataFrame).
+
+        Yields:
+            pd.DataFrame: Los mismos bloques.
+        """
+        for chunk in chunks:
+            self.update(chunk)
+            yield chunk
+            del chunk
+
+    def manifest(self, metadata=None):
+        """
+        Manifiesto con las huellas calculadas hasta ahora.
+
+        Args:
+            metadata (dict, optional): Opciones de la generación (semilla,
+                motor, filas...) que se guardan para informar al comparar.
+
+        Returns:
+            dict: Manifiesto serializable como JSON.
+        """
+        # El último bloque puede estar incompleto
+        blocks = list(self.blocks)
+        if self.columns is not None and self._current_block() is not None:
+            blocks.append(self._current_block())
+        total = _hasher()
+        for block in blocks:
+            for column in self.columns:
+                total.update(bytes.fromhex(block["digests"][column]))
+        return {
+            "version": MANIFEST_VERSION,
+            "algorithm": f"blake2b-{DIGEST_SIZE * 8}",
+            "block_rows": self.block_rows,
+            "start": self.start,
+            "rows": self.rows,
+            "columns": self.columns or [],
+            "digest": total.hexdigest(),
+            "metadata": dict(metadata or {}, python=platform.python_version(), numpy=np.__version__,
+                             pandas=pd.__version__),
+            "blocks": blocks,
+        }
+
+    def write(self, path, metadata=None):
+        """
+        Escribe el manifiesto como JSON.
+
+        Args:
+            path (str): Ruta del manifiesto.
+            metadata (dict, optional): Opciones de la generación.
+
+        Returns:
+            dict: Manifiesto escrito.
+        """
+        manifest = self.manifest(metadata)
+        temporary = f"{path}.tmp"
+        with open(temporary, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=1)
+        os.replace(temporary, path)
+        return manifest
+
+
+def load_manifest(path):
+    """
+    Lee un manifiesto de huellas.
+
+    Args:
+        path (str): Ruta del manifiesto.
+
+    Returns:
+        dict: Manifiesto.
+    """
+    with open(path, encoding="utf-8") as f:
+        manifest = json.load(f)
+    if manifest.get("version") != MANIFEST_VERSION:
+        raise ValueError(f"{path} no es un manifiesto de huellas compatible")
+    return manifest
+
+
+def compare_manifests(first, second):
+    """
+    Compara dos manifiestos de huellas.
+
+    Los bloques se emparejan por su fila inicial, así que se puede comparar
+    un fragmento con la ejecución completa o dos fragmentos que se solapan:
+    se comparan los bloques que cubren las mismas filas en ambos.
+
+    Args:
+        first (dict): Manifiesto de referencia.
+        second (dict): Manifiesto a comprobar.
+
+    Returns:
+        dict or None: None si coinciden; si no, un diccionario con ``reason``
+        (explicación), ``start`` y ``rows`` (filas del primer bloque que
+        difiere o del primer tramo que no se ha podido comparar, si lo hay)
+        y ``columns`` (columnas que difieren en él).
+    """
+    for key in ("algorithm", "block_rows"):
+        if first[key] != second[key]:
+            return {"reason": f"Los manifiestos no son comparables: {key} es {first[key]} y {second[key]}",
+                    "start": None, "rows": None, "columns": []}
+    if first["columns"] != second["columns"]:
+        return {"reason": "Las columnas no coinciden", "start": None, "rows": None,
+                "columns": sorted(set(first["columns"]) ^ set(second["columns"]))}
+    if first["digest"] == second["digest"] and (first["start"], first["rows"]) == (second["start"], second["rows"]):
+        return None
+
+    others = {block["start"]: block for block in second["blocks"]}
+    compared = []
+    for block in first["blocks"]:
+        other = others.get(block["start"])
+        # En los extremos de un fragmento los bloques están incompletos y no cubren las mismas filas
+        if other is None or other["rows"] != block["rows"]:
+            continue
+        columns = [column for column in first["columns"] if block["digests"][column] != other["digests"][column]]
+        if columns:
+            end = block["start"] + block["rows"] - 1
+            return {"reason": f"Primera diferencia en las filas {block['start']}-{end}: {', '.join(columns)}",
+                    "start": block["start"], "rows": block["rows"], "columns": columns}
+        compared.append(block)
+
+    # Primer tramo de filas de alguno de los dos que no está en un bloque comparado
+    row = min(first["start"], second["start"])
+    end = max(first["start"] + first["rows"], second["start"] + second["rows"])
+    stop = end
+    for block in compared:
+        if block["start"] > row:
+            stop = block["start"]
+            break
+        row = block["start"] + block["rows"]
+    if row >= end:
+        return None
+    return {"reason": f"Coinciden los {len(compared)} bloques comunes, pero las filas {row}-{stop - 1} no se pueden "
+                      f"comparar: faltan en un manifiesto o caen en un bloque incompleto",
+            "start": row, "rows": stop - row, "columns": []}
@@ -0,0 +1,104 @@
+"""
+Conversión de las columnas generadas al tipo de resultado solicitado.
+
+Los motores de generación producen un diccionario de arrays de NumPy por
+columna. A partir de él se construye el resultado sin pasar por pandas salvo
+que se pida un DataFrame.
+"""
+
+import numpy as np
+import pandas as pd
+
+from .constants import COLUMN_NAMES
+
+
+# Tipos de resultado admitidos por generate_television_data
+RETURN_TYPES = ("pandas", "numpy", "structured", "arrow")
+
+
+def import_pyarrow():
+    """Importa pyarrow con un mensaje claro si no está instalado."""
+    try:
+        import pyarrow as pa
+    except ImportError as e:
+        raise ImportError("El formato arrow requiere pyarrow: pip install pyarrow") from e
+    return pa
+
+
+def check_return_type(return_type):
+    """
+    Comprueba que un tipo de resultado está soportado.
+
+    Raises:
+        ValueError: Si no está en RETURN_TYPES.
+    """
+    if return_type not in RETURN_TYPES:
+        raise ValueError(f"Tipo de resultado no soportado: {return_type}. Use uno de {', '.join(RETURN_TYPES)}.")
+
+
+def to_structured(columns):
+    """
+    Convierte columnas en un array estructurado de NumPy.
+
+    Las columnas de texto se guardan como cadenas ``U`` de ancho fijo igual a
+    la longitud máxima de la columna, de modo que el array no contiene
+    objetos de Python y se puede guardar o proyectar en memoria.
+
+    Args:
+        columns (dict): Array por columna.
+
+    Returns:
+        numpy.ndarray: Array estructurado con un campo por columna.
+    """
+    fields = {}
+    for name, values in columns.items():
+        if values.dtype == object:
+            values = values.astype(str) if len(values) else values.astype("U1")
+        fields[name] = values
+
+    length = len(next(iter(fields.values()))) if fields else 0
+    result = np.empty(length, dtype=[(name, values.dtype) for name, values in fields.items()])
+    for name, values in fields.items():
+        result[name] = values
+    return result
+
+
+def to_arrow(columns):
+    """
+    Convierte columnas en una tabla de pyarrow.
+
+    Args:
+        columns (dict): Array por columna.
+
+    Returns:
+        pyarrow.Table: Tabla con una columna por entrada.
+    """
+    pa = import_pyarrow()
+    arrays = [
+        pa.array(values, type=pa.string()) if values.dtype == object else pa.array(values)
+        for values in columns.values()
+    ]
+    return pa.Table.from_arrays(arrays, names=list(columns))
+
+
+def to_return_type(columns, return_type="pandas"):
+    """
+    Construye el resultado de una generación.
+
+    Args:
+        columns (dict): Array de NumPy por columna, en el orden de COLUMN_NAMES.
+        return_type (str): ``pandas`` (DataFrame), ``numpy`` (el propio
+            diccionario de arrays), ``structured`` (array estructurado) o
+            ``arrow`` (tabla de pyarrow).
+
+    Returns:
+        Datos generados en el tipo solicitado.
+    """
+    check_return_type(return_type)
+    if return_type == "numpy":
+        return columns
+    if return_type == "structured":
+        return to_structured(columns)
+    if return_type == "arrow":
+        return to_arrow(columns)
+    return pd.DataFrame(columns, columns=COLUMN_NAMES, copy=False)
@@ -0,0 +1,215 @@
+"""
+Tamaño de bloque adaptado a un presupuesto de memoria.
+
+En lugar de fijar a mano las filas por bloque para cada formato y esquema,
+se mide cuánta memoria cuesta de verdad generar y codificar una muestra con
+las mismas opciones (motor, pesos, condiciones y formato de salida) y se
+elige el bloque más grande que cabe en el presupuesto.
+
+La medición usa ``tracemalloc``, que registra tanto los objetos de Python
+como los arrays de NumPy, sobre dos muestras de distinto tamaño: la
+diferencia da el coste por fila y el resto el coste fijo (por ejemplo, los
+bloques completos de BLOCK_SIZE filas del motor vectorizado).
+"""
+
+import json
+import os
+import re
+import tracemalloc
+
+from .binary_format import encode_records
+from .cache import _rng_state, _set_rng_state
+from .columnar import BLOCK_SIZE
+from .data_generator import generate_television_data
+from .formats import import_pyarrow
+from .pacing import encode_chunk
+from .sku import SKU_INDEX_BYTES
+
+
+# Fracción del presupuesto libre que se usa, como margen para la
+# fragmentación del asignador y los objetos que no mide tracemalloc
+MEMORY_SAFETY_FACTOR = 0.7
+
+# Tamaño mínimo de bloque; por debajo el coste fijo domina el rendimiento
+MIN_CHUNK_SIZE = 1_000
+
+# Filas de la muestra pequeña de cada motor
+_SAMPLE_ROWS = {"legacy": 1_000, "vectorized": BLOCK_SIZE}
+
+# Costes ya medidos en este proceso, por opciones de generación
+_measured = {}
+
+_UNITS = {
+    "": 1, "B": 1,
+    "K": 1000, "KB": 1000, "KIB": 1 << 10,
+    "M": 1000 ** 2, "MB": 1000 ** 2, "MIB": 1 << 20,
+    "G": 1000 ** 3, "GB": 1000 ** 3, "GIB": 1 << 30,
+    "T": 1000 ** 4, "TB": 1000 ** 4, "TIB": 1 << 40,
+}
+
+
+def parse_memory(spec):
+    """
+    Convierte un tamaño de memoria en bytes.
+
+    Args:
+        spec (str or int): Bytes o texto como ``2GB``, ``512MiB`` o ``1.5G``.
+
+    Returns:
+        int: Número de bytes.
+    """
+    if isinstance(spec, int):
+        size = spec
+    else:
+        match = re.fullmatch(r"\s*([0-9]*\.?[0-9]+)\s*([A-Za-z]*)\s*", spec)
+        if match is None or match.group(2).upper() not in _UNITS:
+            raise ValueError(f"Tamaño de memoria no válido: {spec} (ejemplos: 2GB, 512MiB)")
+        size = int(float(match.group(1)) * _UNITS[match.group(2).upper()])
+    if size <= 0:
+        raise ValueError("El tamaño de memoria debe ser positivo")
+    return size
+
+
+def current_rss():
+    """
+    Memoria residente actual del proceso.
+
+    Returns:
+        int: Bytes, o 0 si el sistema no lo expone en ``/proc``.
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        return 0
+
+
+def _encode(chunk, format):
+    """
+    Codifica un bloque como lo haría el escritor del formato.
+
+    Returns:
+        tuple: (datos codificados, bytes reservados fuera de tracemalloc).
+    """
+    if format in ("csv", "json"):
+        return encode_chunk(chunk, format)[0], 0
+    if format == "binary":
+        return encode_records(chunk), 0
+    if format == "arrow":
+        # pyarrow reserva sus búferes en su propio pool, que tracemalloc no ve
+        pa = import_pyarrow()
+        batch = pa.RecordBatch.from_pandas(chunk, preserve_index=False)
+        return batch, batch.nbytes
+    return None, 0
+
+
+def _peak_bytes(rows, format, engine, weights, where):
+    """Pico de memoria de generar y codificar un bloque de ``rows`` filas."""
+    seed = 0 if engine == "vectorized" else None
+    # La muestra no debe alterar la secuencia aleatoria de la generación real
+    state = _rng_state()
+    tracemalloc.start()
+    try:
+        chunk = generate_television_data(rows, weights=weights, engine=engine, seed=seed, where=where)
+        encoded, untraced = _encode(chunk, format)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+        _set_rng_state(state)
+    del chunk, encoded
+    return peak + untraced
+
+
+def measure_row_cost(format=None, engine="vectorized", weights=None, where=None):
+    """
+    Mide el coste en memoria de generar y codificar filas.
+
+    Args:
+        format (str, optional): Formato de salida ('csv', 'json', 'arrow' o
+            'binary'); sin formato solo se mide la generación.
+        engine (str): Motor de generación ('legacy' o 'vectorized').
+        weights (dict or str, optional): Pesos de las columnas categóricas.
+        where (dict or str, optional): Condiciones del motor vectorizado.
+
+    Returns:
+        tuple: (bytes por fila, bytes fijos por bloque). Se mide una vez por
+        combinación de opciones y proceso.
+    """
+    key = json.dumps([format, engine, weights, where], sort_keys=True, default=str)
+    if key not in _measured:
+        rows = _SAMPLE_ROWS[engine]
+        small = _peak_bytes(rows, format, engine, weights, where)
+        large = _peak_bytes(2 * rows, format, engine, weights, where)
+        per_row = max((large - small) / rows, 1.0)
+        _measured[key] = (per_row, max(small - per_row * rows, 0.0))
+    return _measured[key]
+
+
+def chunk_size_for_budget(max_memory, rows=None, format=None, engine="vectorized", weights=None, where=None,
+                          in_flight=1, baseline=None):
+    """
+    Calcula el bloque más grande que cabe en un presupuesto de memoria.
+
+    Args:
+        max_memory (int or str): Presupuesto total del proceso (ver parse_memory).
+        rows (int, optional): Filas totales; el bloque no supera este número.
+        format (str, optional): Formato de salida (ver measure_row_cost).
+        engine (str): Motor de generación.
+        weights (dict or str, optional): Pesos de las columnas categóricas.
+        where (dict or str, optional): Condiciones del motor vectorizado.
+        in_flight (int): Bloques vivos a la vez, por ejemplo los que espera
+            un escritor con lectura anticipada.
+        baseline (int, optional): Memoria ya ocupada por el proceso. Por
+            defecto, su memoria residente actual.
+
+    Returns:
+        int: Filas por bloque.
+    """
+    budget = parse_memory(max_memory)
+    baseline = current_rss() if baseline is None else baseline
+    per_row, fixed = measure_row_cost(format, engine, weights, where)
+    if engine != "vectorized":
+        # El motor legacy recuerda los SKUs de todos los bloques en un SkuIndex
+        fixed += SKU_INDEX_BYTES
+    available = (budget - baseline) * MEMORY_SAFETY_FACTOR - fixed
+    chunk_size = int(available / (per_row * max(in_flight, 1)))
+    if chunk_size < MIN_CHUNK_SIZE:
+        needed = baseline + (fixed + per_row * MIN_CHUNK_SIZE * max(in_flight, 1)) / MEMORY_SAFETY_FACTOR
+        raise ValueError(
+            f"El presupuesto de memoria es insuficiente: se necesitan al menos {needed / 1e6:.0f} MB "
+            f"para bloques de {MIN_CHUNK_SIZE} filas"
+        )
+    if rows is not None:
+        chunk_size = min(chunk_size, max(rows, 1))
+    return chunk_size
+
+
+def check_fits(max_memory, rows, format=None, engine="vectorized", weights=None, where=None, baseline=None):
+    """
+    Comprueba que un conjunto completo cabe en memoria antes de generarlo.
+
+    Sirve para las salidas que necesitan todas las filas a la vez (JSON,
+    Excel o las tablas derivadas del catálogo).
+
+    Args:
+        max_memory (int or str): Presupuesto total del proceso.
+        rows (int): Filas a generar.
+        format (str, optional): Formato de salida (ver measure_row_cost).
+        engine (str): Motor de generación.
+        weights (dict or str, optional): Pesos de las columnas categóricas.
+        where (dict or str, optional): Condiciones del motor vectorizado.
+        baseline (int, optional): Memoria ya ocupada por el proceso.
+
+    Returns:
+        int: Bytes estimados, incluida la memoria ya ocupada.
+    """
+    budget = parse_memory(max_memory)
+    baseline = current_rss() if baseline is None else baseline
+    per_row, fixed = measure_row_cost(format, engine, weights, where)
+    needed = baseline + (fixed + per_row * rows) / MEMORY_SAFETY_FACTOR
+    if needed > budget:
+        raise ValueError(
+            f"Generar {rows} filas de una vez necesita unos {needed / 1e6:.0f} MB y el presupuesto es de "
+            f"{budget / 1e6:.0f} MB; use una salida en streaming (csv, arrow o binary) o menos filas"
+        )
+    return int(needed)
@@ -0,0 +1,173 @@
+"""
+Índice de desplazamientos por SKU para archivos de texto.
+
+Junto a un CSV o JSON Lines generado se puede escribir un índice con el
+código entero de cada PRODUCT_SKU (ver sku.encode_skus) y el byte en el que
+empieza su fila. El índice se guarda ordenado por código en un ``.npy`` de
+registros empaquetados, de modo que se abre con ``numpy.load(mmap_mode="r")``
+y una búsqueda binaria solo lee del disco las páginas que toca: encontrar un
+SKU en un archivo de varios GB cuesta O(log n) lecturas y un ``seek`` en
+lugar de recorrerlo entero.
+
+Mientras se escribe, el índice guarda 12 bytes por fila en memoria.
+"""
+
+import os
+
+import numpy as np
+
+from .sku import encode_sku, encode_skus
+
+
+# Código de SKU y byte de inicio de su fila
+INDEX_DTYPE = np.dtype([("sku", "<i4"), ("offset", "<u8")])
+
+# Sufijo del índice junto al archivo de datos
+INDEX_SUFFIX = ".skuidx.npy"
+
+
+def index_path(data_path):
+    """Ruta por defecto del índice de un archivo de datos."""
+    return f"{data_path}{INDEX_SUFFIX}"
+
+
+def row_starts(data, header=False):
+    """
+    Posición del comienzo de cada fila en un bloque de texto con una fila por línea.
+
+    Args:
+        data (bytes): Bloque codificado.
+        header (bool): Si la primera línea es una cabecera.
+
+    Returns:
+        numpy.ndarray: Posiciones dentro del bloque.
+    """
+    ends = np.flatnonzero(np.frombuffer(data, dtype=np.uint8) == ord("\n")) + 1
+    starts = np.concatenate([[0], ends[:-1]]).astype(np.uint64)
+    return starts[1:] if header else starts
+
+
+class SkuOffsetIndexWriter:
+    """
+    Acumula los desplazamientos de las filas según se escriben y guarda el índice.
+
+    Los bloques deben añadirse en el orden en que se escriben en el archivo.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.position = 0
+        self._codes = []
+        self._offsets = []
+
+    def add(self, skus, data, header=False):
+        """
+        Registra un bloque codificado que se acaba de escribir.
+
+        Args:
+            skus (array-like): PRODUCT_SKU de las filas del bloque.
+            data (bytes): Bloque codificado con una fila por línea.
+            header (bool): Si el bloque empieza con una cabecera.
+        """
+        starts = row_starts(data, header)
+        if len(starts) != len(skus):
+            raise ValueError("El número de líneas del bloque no coincide con el de filas")
+        self._codes.append(encode_skus(skus).astype(np.int32))
+        self._offsets.append(starts + np.uint64(self.position))
+        self.position += len(data)
+
+    def close(self, rows=None):
+        """
+        Ordena los desplazamientos por SKU y escribe el índice.
+
+        Args:
+            rows (int, optional): Filas que llegaron a escribirse; las
+                registradas después se descartan.
+
+        Returns:
+            int: Entradas del índice.
+        """
+        codes = np.concatenate(self._codes) if self._codes else np.zeros(0, dtype=np.int32)
+        offsets = np.concatenate(self._offsets) if self._offsets else np.zeros(0, dtype=np.uint64)
+        self._codes, self._offsets = [], []
+        if rows is not None:
+            codes, offsets = codes[:rows], offsets[:rows]
+
+        # Los SKUs no válidos (por ejemplo, nulos inyectados) no se pueden buscar
+        valid = codes >= 0
+        order = np.argsort(codes[valid], kind="stable")
+        entries = np.empty(len(order), dtype=INDEX_DTYPE)
+        entries["sku"] = codes[valid][order]
+        entries["offset"] = offsets[valid][order]
+
+        # Se escribe en un temporal para no dejar un índice a medias
+        temporary = f"{self.path}.tmp"
+        with open(temporary, "wb") as f:
+            np.save(f, entries)
+        os.replace(temporary, self.path)
+        return len(entries)
+
+
+class SkuOffsetIndex:
+    """
+    Índice de desplazamientos abierto con ``numpy.memmap``.
+
+    Args:
+        path (str): Ruta del índice.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._entries = np.load(path, mmap_mode="r")
+        if self._entries.dtype != INDEX_DTYPE:
+            raise ValueError(f"{path} no es un índice de SKUs")
+
+    def __len__(self):
+        return len(self._entries)
+
+    def offsets(self, sku):
+        """
+        Busca las filas de un SKU.
+
+        Args:
+            sku (str): SKU a buscar.
+
+        Returns:
+            numpy.ndarray: Bytes de inicio de sus filas, en el orden del
+            archivo (varios si el SKU está duplicado).
+        """
+        code = encode_sku(sku)
+        codes = self._entries["sku"]
+        low = np.searchsorted(codes, code, side="left")
+        high = np.searchsorted(codes, code, side="right")
+        return np.array(self._entries["offset"][low:high])
+
+
+def lookup_rows(data_path, sku, index=None):
+    """
+    Lee las filas de un SKU saltando directamente a ellas.
+
+    Args:
+        data_path (str): Archivo CSV o JSON Lines.
+        sku (str): SKU a buscar.
+        index (str or SkuOffsetIndex, optional): Índice del archivo. Por
+            defecto, el de index_path.
+
+    Returns:
+        list: Líneas de las filas, sin el salto de línea final.
+
+    Raises:
+        ValueError: Si el índice no corresponde al archivo.
+    """
+    if not isinstance(index, SkuOffsetIndex):
+        index = SkuOffsetIndex(index or index_path(data_path))
+    lines = []
+    with open(data_path, "rb") as f:
+        for offset in index.offsets(sku):
+            f.seek(int(offset))
+            line = f.readline().rstrip(b"\n").decode("utf-8")
+            # Una comprobación barata evita devolver filas de un índice desactualizado
+            if sku not in line:
+                raise ValueError(f"El índice {index.path} no corresponde a {data_path}")
+            lines.append(line)
+    return lines
@@ -0,0 +1,388 @@
+"""
+Emisión de datos a un ritmo controlado para pruebas de carga.
+
+Un perfil de ritmo indica cuántas filas deben haberse emitido en cada
+instante (constante, rampa o ráfagas). Un hilo genera y codifica los bloques
+por adelantado mientras el emisor, en cada tic de un reloj monótono, escribe
+justo las filas que tocan hasta ese momento. Los tics se programan respecto
+al instante inicial, de modo que los retrasos de un tic no se acumulan.
+
+Al terminar se informa del ritmo conseguido frente al objetivo y del
+*jitter*, medido como la desviación típica del retraso de cada tic sobre su
+hora programada.
+"""
+
+import math
+import queue
+import socket
+import sys
+import threading
+import time
+
+import numpy as np
+
+from .csv_encoder import encode_csv
+
+
+# Intervalo entre escrituras del emisor en segundos
+DEFAULT_TICK_SECONDS = 0.01
+
+# Bloques generados por adelantado
+DEFAULT_PREFETCH_CHUNKS = 4
+
+# Formatos de texto que se pueden emitir fila a fila
+PACED_FORMATS = ("csv", "json")
+
+
+class ConstantRate:
+    """Ritmo constante de ``rate`` filas por segundo."""
+
+    def __init__(self, rate):
+        if rate <= 0:
+            raise ValueError("El ritmo debe ser positivo")
+        self.rate = rate
+
+    def cumulative(self, elapsed):
+        """Filas que deben haberse emitido a los ``elapsed`` segundos."""
+        return self.rate * elapsed
+
+    def __str__(self):
+        return f"constante de {self.rate:g} filas/s"
+
+
+class RampRate:
+    """Rampa lineal de ``start_rate`` a ``end_rate`` en ``seconds`` segundos, que después se mantiene."""
+
+    def __init__(self, start_rate, end_rate, seconds):
+        if start_rate < 0 or end_rate <= 0 or seconds <= 0:
+            raise ValueError("La rampa necesita ritmos no negativos, ritmo final y duración positivos")
+        self.start_rate = start_rate
+        self.end_rate = end_rate
+        self.seconds = seconds
+
+    def cumulative(self, elapsed):
+        """Filas que deben haberse emitido a los ``elapsed`` segundos."""
+        ramp = min(elapsed, self.seconds)
+        slope = (self.end_rate - self.start_rate) / self.seconds
+        return self.start_rate * ramp + slope * ramp * ramp / 2 + self.end_rate * max(elapsed - self.seconds, 0)
+
+    def __str__(self):
+        return f"rampa de {self.start_rate:g} a {self.end_rate:g} filas/s en {self.seconds:g} s"
+
+
+class BurstRate:
+    """Ritmo base con ráfagas de ``burst_seconds`` a ``peak_rate`` al comienzo de cada ``period`` segundos."""
+
+    def __init__(self, base_rate, peak_rate, period, burst_seconds):
+        if base_rate < 0 or peak_rate <= 0 or period <= 0 or not 0 < burst_seconds <= period:
+            raise ValueError("Las ráfagas necesitan ritmos válidos y una duración entre 0 y el periodo")
+        self.base_rate = base_rate
+        self.peak_rate = peak_rate
+        self.period = period
+        self.burst_seconds = burst_seconds
+
+    def cumulative(self, elapsed):
+        """Filas que deben haberse emitido a los ``elapsed`` segundos."""
+        periods, remainder = divmod(elapsed, self.period)
+        burst_time = periods * self.burst_seconds + min(remainder, self.burst_seconds)
+        return self.base_rate * elapsed + (self.peak_rate - self.base_rate) * burst_time
+
+    def __str__(self):
+        return (f"ráfagas de {self.peak_rate:g} filas/s durante {self.burst_seconds:g} s "
+                f"cada {self.period:g} s sobre {self.base_rate:g} filas/s")
+
+
+def parse_rate(spec):
+    """
+    Interpreta una especificación de ritmo.
+
+    Formatos admitidos:
+
+    * ``50000`` o ``constant:50000``: filas por segundo constantes.
+    * ``ramp:INICIO:FIN:SEGUNDOS``: rampa lineal y después ritmo FIN.
+    * ``burst:BASE:PICO:PERIODO:DURACIÓN``: ráfagas al ritmo PICO durante
+      DURACIÓN segundos al comienzo de cada PERIODO.
+
+    Args:
+        spec (str): Especificación del ritmo.
+
+    Returns:
+        ConstantRate, RampRate o BurstRate: Perfil de ritmo.
+    """
+    kind, _, rest = spec.partition(":") if ":" in spec else ("constant", "", spec)
+    profiles = {"constant": (ConstantRate, 1), "ramp": (RampRate, 3), "burst": (BurstRate, 4)}
+    if kind not in profiles:
+        raise ValueError(f"Perfil de ritmo no soportado: {kind}. Use constant, ramp o burst.")
+    profile, arity = profiles[kind]
+    try:
+        values = [float(value) for value in rest.split(":")]
+    except ValueError:
+        raise ValueError(f"Ritmo no válido: {spec}") from None
+    if len(values) != arity or not all(math.isfinite(value) for value in values):
+        raise ValueError(f"El perfil {kind} necesita {arity} valores numéricos: {spec}")
+    return profile(*values)
+
+
+def encode_chunk(chunk, format="csv", header=False):
+    """
+    Codifica un bloque como texto con una fila por línea.
+
+    Args:
+        chunk (pd.DataFrame): Bloque de datos.
+        format (str): ``csv`` o ``json`` (JSON Lines).
+        header (bool): Si el CSV incluye la cabecera.
+
+    Returns:
+        tuple: (bytes codificados, array con la posición del final de cada fila).
+    """
+    if format == "csv":
+        data = encode_csv(chunk, header=header)
+    else:
+        text = chunk.to_json(orient="records", lines=True)
+        if text and not text.endswith("\n"):
+            text += "\n"
+        data = text.encode("utf-8")
+    ends = np.flatnonzero(np.frombuffer(data, dtype=np.uint8) == ord("\n")) + 1
+    if header:
+        # La primera línea es la cabecera y se emite con la primera fila
+        ends = ends[1:]
+    return data, ends
+
+
+def prefetch(iterable, depth=DEFAULT_PREFETCH_CHUNKS):
+    """
+    Recorre un iterable en un hilo aparte, ``depth`` elementos por delante.
+
+    Los errores del hilo se propagan al consumidor. Si el consumidor deja
+    de leer (fin de ``--duration``, error del destino), el hilo se detiene
+    sin bloquearse y se espera a que termine; los elementos ya preparados
+    y no consumidos se descartan.
+
+    Args:
+        iterable (iterable): Elementos a producir.
+        depth (int): Elementos preparados como máximo a la espera.
+
+    Yields:
+        Los elementos de ``iterable`` en orden.
+    """
+    items = queue.Queue(maxsize=depth)
+    done = object()
+    stop = threading.Event()
+
+    def put(item):
+        """Encola un elemento; devuelve False si el consumidor ya terminó."""
+        while not stop.is_set():
+            try:
+                items.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce():
+        iterator = iter(iterable)
+        try:
+            for item in iterator:
+                if not put(item):
+                    return
+            put(done)
+        except BaseException as e:
+            put(e)
+        finally:
+            # Cierra el generador en su propio hilo para liberar sus recursos
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                close()
+
+    thread = threading.Thread(target=produce, daemon=True)
+    thread.start()
+    try:
+        while True:
+            item = items.get()
+            if item is done:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        stop.set()
+        thread.join()
+
+
+class PacingReport:
+    """Resultado de una emisión a ritmo controlado."""
+
+    def __init__(self, profile):
+        self.profile = profile
+        self.rows = 0
+        self.elapsed = 0.0
+        self.ticks = 0
+        self._lag_sum = 0.0
+        self._lag_squares = 0.0
+        self.max_lag = 0.0
+
+    def record_tick(self, lag):
+        """Registra el retraso de un tic sobre su hora programada."""
+        self.ticks += 1
+        self._lag_sum += lag
+        self._lag_squares += lag * lag
+        self.max_lag = max(self.max_lag, lag)
+
+    @property
+    def achieved_rate(self):
+        """Filas por segundo emitidas."""
+        return self.rows / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def target_rate(self):
+        """Filas por segundo medias que pedía el perfil durante la emisión."""
+        return self.profile.cumulative(self.elapsed) / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def mean_lag(self):
+        """Retraso medio de los tics en segundos."""
+        return self._lag_sum / self.ticks if self.ticks else 0.0
+
+    @property
+    def jitter(self):
+        """Desviación típica del retraso de los tics en segundos."""
+        if not self.ticks:
+            return 0.0
+        return math.sqrt(max(self._lag_squares / self.ticks - self.mean_lag ** 2, 0.0))
+
+    def format(self):
+        """Devuelve el informe como texto."""
+        return "\n".join([
+            f"Perfil: {self.profile}",
+            f"Filas emitidas: {self.rows} en {self.elapsed:.2f} s",
+            f"Ritmo conseguido: {self.achieved_rate:,.0f} filas/s (objetivo: {self.target_rate:,.0f} filas/s)",
+            f"Jitter: {self.jitter * 1000:.2f} ms (retraso medio {self.mean_lag * 1000:.2f} ms, "
+            f"máximo {self.max_lag * 1000:.2f} ms)",
+        ])
+
+
+def emit_paced(encoded_chunks, sink, profile, tick=DEFAULT_TICK_SECONDS, duration=None,
+               clock=time.perf_counter, sleep=time.sleep):
+    """
+    Escribe bloques codificados al ritmo de un perfil.
+
+    En cada tic se escriben de una vez todas las filas que el perfil exige
+    hasta ese instante, cortando los bloques en finales de fila.
+
+    Args:
+        encoded_chunks (iterable): Pares (bytes, finales de fila) de encode_chunk.
+        sink (file): Archivo binario de destino.
+        profile: Perfil de ritmo (ver parse_rate).
+        tick (float): Segundos entre escrituras.
+        duration (float, optional): Segundos tras los que se detiene la emisión.
+        clock (callable): Reloj monótono en segundos.
+        sleep (callable): Función de espera en segundos.
+
+    Returns:
+        PacingReport: Informe de la emisión.
+    """
+    if tick <= 0:
+        raise ValueError("El intervalo entre escrituras debe ser positivo")
+    report = PacingReport(profile)
+    chunks = iter(encoded_chunks)
+    data, ends, position = b"", np.empty(0, dtype=np.int64), 0
+    exhausted = timed_out = False
+    start = clock()
+    tick_index = 0
+
+    while not exhausted:
+        deadline = start + tick_index * tick
+        now = clock()
+        if now < deadline:
+            sleep(deadline - now)
+            now = clock()
+        elapsed = now - start
+        if duration is not None and elapsed >= duration:
+            elapsed = duration
+            exhausted = timed_out = True
+
+        # Filas que el perfil exige hasta ahora, escritas en un solo bloque de bytes
+        due = int(profile.cumulative(elapsed))
+        pieces = []
+        while report.rows < due:
+            if position == len(ends):
+                try:
+                    data, ends = next(chunks)
+                except StopIteration:
+                    exhausted = True
+                    break
+                position = 0
+                continue
+            take = min(due - report.rows, len(ends) - position)
+            first_byte = ends[position - 1] if position else 0
+            position += take
+            pieces.append(data[first_byte:ends[position - 1]])
+            report.rows += take
+        if pieces:
+            sink.write(b"".join(pieces))
+            sink.flush()
+            report.elapsed = clock() - start
+
+        report.record_tick(max(now - deadline, 0.0))
+        # Si el emisor se retrasa, salta a la siguiente hora programada
+        tick_index = max(tick_index + 1, int((clock() - start) / tick) + 1)
+
+    if timed_out:
+        report.elapsed = duration
+    if hasattr(chunks, "close"):
+        chunks.close()
+    return report
+
+
+def open_sink(output):
+    """
+    Abre el destino binario de una emisión.
+
+    Args:
+        output (str): Ruta de archivo o FIFO, ``-`` para la salida estándar o
+            ``tcp://HOST:PUERTO`` para un socket TCP.
+
+    Returns:
+        file: Archivo binario de destino.
+    """
+    if output == "-":
+        return sys.stdout.buffer
+    if output.startswith("tcp://"):
+        host, _, port = output[len("tcp://"):].rpartition(":")
+        if not host or not port.isdigit():
+            raise ValueError(f"Dirección TCP no válida: {output}. Use tcp://HOST:PUERTO.")
+        connection = socket.create_connection((host, int(port)))
+        return connection.makefile("wb")
+    return open(output, "wb")
+
+
+def _encoded_chunks(chunks, format, index=None):
+    """Codifica los bloques y registra sus filas en el índice."""
+    for i, chunk in enumerate(chunks):
+        data, ends = encode_chunk(chunk, format, header=format == "csv" and i == 0)
+        if index is not None:
+            index.add(chunk["PRODUCT_SKU"], data, header=format == "csv" and i == 0)
+        yield data, ends
+
+
+def paced_chunks(chunks, format="csv", depth=DEFAULT_PREFETCH_CHUNKS, index=None):
+    """
+    Codifica bloques de datos en un hilo aparte, por delante del emisor.
+
+    Los bloques se generan hasta ``depth`` por delante de la emisión: con un
+    registro de SKUs, las filas generadas y no emitidas cuando la emisión se
+    detiene antes de tiempo conservan sus SKUs reservados en el registro.
+
+    Args:
+        chunks (iterable): Bloques de datos (pandas.DataFrame).
+        format (str): ``csv`` o ``json`` (JSON Lines).
+        depth (int): Bloques codificados como máximo a la espera.
+        index (SkuOffsetIndexWriter, optional): Índice en el que registrar
+            el byte de inicio de cada fila codificada.
+
+    Returns:
+        iterator: Pares (bytes, finales de fila) para emit_paced.
+    """
+    if format not in PACED_FORMATS:
+        raise ValueError(f"Formato no soportado a ritmo controlado: {format}. Use {' o '.join(PACED_FORMATS)}.")
+    return prefetch(_encoded_chunks(chunks, format, index), depth)
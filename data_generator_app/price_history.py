@@ -0,0 +1,229 @@
+"""
+Historial diario de precios por SKU.
+
+Cada SKU tiene una fila por día desde su RELEASE_DATE durante
+``lifetime_days`` días. El precio parte de PRICE_USD y combina:
+
+* una caída exponencial hacia ``PRICE_FLOOR`` del precio de lanzamiento;
+* un paseo aleatorio en escala logarítmica con pasos de ``WALK_TICK``;
+* promociones semanales con descuentos del 10 al 30 %.
+
+Los números aleatorios no salen de un generador con estado sino de un hash
+(splitmix64) de la semilla, el código del SKU y el día, así que cualquier
+tramo de cualquier serie se puede calcular de forma independiente. El paseo
+aleatorio suma pasos enteros, por lo que su valor es exacto con cualquier
+troceado. Esto permite generar el historial por bloques de SKUs y meses con
+memoria acotada y reproducir cada serie a partir de la semilla y el SKU.
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+from .csv_encoder import encode_csv
+from .sku import encode_skus
+
+
+# Días de historial por SKU
+DEFAULT_LIFETIME_DAYS = 730
+
+# SKUs procesados por bloque
+DEFAULT_SKU_CHUNK_SIZE = 10_000
+
+# Fracción del precio de lanzamiento a la que tiende el precio
+PRICE_FLOOR = 0.55
+
+# Días de la constante de tiempo de la caída de precio
+DECAY_DAYS = 365.0
+
+# Tamaño de un paso del paseo aleatorio (en logaritmo del precio)
+WALK_TICK = 0.0025
+
+# Probabilidad de promoción en cada semana y rango de descuentos (%)
+PROMOTION_PROBABILITY = 0.15
+PROMOTION_DISCOUNTS = (10, 30)
+
+PRICE_HISTORY_COLUMNS = ["DATE", "PRODUCT_SKU", "PRICE_USD", "IS_PROMOTION", "DISCOUNT_PCT"]
+
+# Flujos independientes del hash
+_STREAM_WALK = 1
+_STREAM_PROMOTION = 2
+_STREAM_DISCOUNT = 3
+
+
+def _splitmix64(values):
+    """Función de mezcla splitmix64 sobre un array ``uint64``."""
+    z = values + np.uint64(0x9E3779B97F4A7C15)
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return z ^ (z >> np.uint64(31))
+
+
+def _series_keys(seed, sku_codes):
+    """Clave de hash de la serie de cada SKU."""
+    seed_key = _splitmix64(np.array([seed & (2 ** 64 - 1)], dtype=np.uint64))
+    return _splitmix64(np.asarray(sku_codes, dtype=np.uint64) ^ seed_key)
+
+
+def _uniform(keys, counters, stream):
+    """Uniformes en ``[0, 1)`` para cada par (clave, contador) de un flujo."""
+    mixed = _splitmix64(keys ^ _splitmix64(counters.astype(np.uint64) * np.uint64(4) + np.uint64(stream)))
+    return (mixed >> np.uint64(11)).astype(np.float64) * (1.0 / (1 << 53))
+
+
+def _walk_steps(keys, days):
+    """Pasos del paseo aleatorio: -1, 0 o +1 con probabilidades 1/4, 1/2, 1/4."""
+    u = _uniform(keys, days, _STREAM_WALK)
+    return (u >= 0.75).astype(np.int64) - (u < 0.25).astype(np.int64)
+
+
+def _prices(keys, launch_prices, days, walk):
+    """
+    Precios y promociones de los días ``days`` (desde el lanzamiento).
+
+    Args:
+        keys (numpy.ndarray): Clave de cada serie, con forma compatible con days.
+        launch_prices (numpy.ndarray): Precio de lanzamiento.
+        days (numpy.ndarray): Días desde el lanzamiento.
+        walk (numpy.ndarray): Valor acumulado del paseo aleatorio en pasos.
+
+    Returns:
+        tuple: (precios, máscara de promoción, descuentos en %).
+    """
+    decay = PRICE_FLOOR + (1 - PRICE_FLOOR) * np.exp(-days / DECAY_DAYS)
+    weeks = days // 7
+    promotion = _uniform(keys, weeks, _STREAM_PROMOTION) < PROMOTION_PROBABILITY
+    low, high = PROMOTION_DISCOUNTS
+    discount = np.where(
+        promotion, low + np.floor(_uniform(keys, weeks, _STREAM_DISCOUNT) * (high - low + 1)).astype(np.int64), 0
+    )
+    prices = launch_prices * decay * np.exp(walk * WALK_TICK) * (1 - discount / 100)
+    return np.round(prices, 2), promotion, discount
+
+
+def price_series(sku, release_date, launch_price, seed, lifetime_days=DEFAULT_LIFETIME_DAYS):
+    """
+    Calcula la serie completa de precios de un SKU.
+
+    Args:
+        sku (str): SKU del producto.
+        release_date (str): Fecha de lanzamiento (``YYYY-MM-DD``).
+        launch_price (float): PRICE_USD del catálogo.
+        seed (int): Semilla del catálogo.
+        lifetime_days (int): Número de días de la serie.
+
+    Returns:
+        pd.DataFrame: Una fila por día con las columnas de PRICE_HISTORY_COLUMNS.
+    """
+    days = np.arange(lifetime_days, dtype=np.int64)
+    keys = np.repeat(_series_keys(seed, encode_skus([sku])), lifetime_days)
+    walk = np.cumsum(np.where(days > 0, _walk_steps(keys, days), 0))
+    prices, promotion, discount = _prices(keys, float(launch_price), days, walk)
+    dates = np.datetime64(release_date, "D") + days
+    return pd.DataFrame({
+        "DATE": np.datetime_as_string(dates, unit="D").astype(object),
+        "PRODUCT_SKU": sku,
+        "PRICE_USD": prices,
+        "IS_PROMOTION": promotion,
+        "DISCOUNT_PCT": discount,
+    }, columns=PRICE_HISTORY_COLUMNS)
+
+
+def _month_windows(first_day, last_day):
+    """Meses naturales que cubren ``[first_day, last_day]`` como días absolutos."""
+    month = first_day.astype("datetime64[M]")
+    while month <= last_day.astype("datetime64[M]"):
+        start = month.astype("datetime64[D]")
+        end = (month + 1).astype("datetime64[D]")
+        yield str(month), max(start, first_day), min(end, last_day + 1)
+        month += 1
+
+
+def iter_price_history(catalog, seed, lifetime_days=DEFAULT_LIFETIME_DAYS, sku_chunk_size=DEFAULT_SKU_CHUNK_SIZE):
+    """
+    Genera el historial de precios por bloques de SKUs y meses.
+
+    Los SKUs se agrupan por fecha de lanzamiento, de modo que los SKUs de un
+    bloque están activos casi en los mismos días. Para cada bloque se recorren
+    los meses en orden y el valor del paseo aleatorio se arrastra de un mes al
+    siguiente, así que la memoria usada es proporcional a ``sku_chunk_size``
+    por los días de un mes.
+
+    Args:
+        catalog (pd.DataFrame): Catálogo con PRODUCT_SKU, RELEASE_DATE y PRICE_USD.
+        seed (int): Semilla del catálogo.
+        lifetime_days (int): Días de historial por SKU.
+        sku_chunk_size (int): SKUs por bloque.
+
+    Yields:
+        tuple: (mes ``YYYY-MM``, número de bloque, DataFrame del bloque en ese
+        mes ordenado por fecha y SKU).
+    """
+    if lifetime_days <= 0 or sku_chunk_size <= 0:
+        raise ValueError("La duración y el tamaño de bloque deben ser positivos")
+
+    all_release = pd.to_datetime(catalog["RELEASE_DATE"]).to_numpy().astype("datetime64[D]")
+    by_release = np.argsort(all_release, kind="stable")
+    all_skus = catalog["PRODUCT_SKU"].to_numpy(dtype=object)
+    all_prices = catalog["PRICE_USD"].to_numpy(dtype=np.float64)
+    for chunk_index, start in enumerate(range(0, len(catalog), sku_chunk_size)):
+        positions = by_release[start:start + sku_chunk_size]
+        skus = all_skus[positions]
+        keys = _series_keys(seed, encode_skus(skus))
+        launch_prices = all_prices[positions]
+        release = all_release[positions]
+        walk = np.zeros(len(positions), dtype=np.int64)
+
+        for month, window_start, window_end in _month_windows(release.min(), release.max() + lifetime_days - 1):
+            dates = np.arange(window_start, window_end, dtype="datetime64[D]")
+            # Matriz días x SKUs con los días transcurridos desde cada lanzamiento
+            days = (dates[:, None] - release[None, :]).astype(np.int64)
+            active = (days >= 0) & (days < lifetime_days)
+            if not active.any():
+                continue
+
+            grid_keys = np.broadcast_to(keys, days.shape)
+            steps = np.where(active & (days > 0), _walk_steps(grid_keys, np.maximum(days, 0)), 0)
+            grid_walk = walk + np.cumsum(steps, axis=0)
+            walk = grid_walk[-1]
+
+            prices, promotion, discount = _prices(grid_keys, launch_prices, np.maximum(days, 0), grid_walk)
+            rows, columns = np.nonzero(active)
+            yield month, chunk_index, pd.DataFrame({
+                "DATE": np.datetime_as_string(dates, unit="D").astype(object)[rows],
+                "PRODUCT_SKU": skus[columns],
+                "PRICE_USD": prices[rows, columns],
+                "IS_PROMOTION": promotion[rows, columns],
+                "DISCOUNT_PCT": discount[rows, columns],
+            }, columns=PRICE_HISTORY_COLUMNS)
+
+
+def write_price_history(catalog, output_dir, seed, lifetime_days=DEFAULT_LIFETIME_DAYS,
+                        sku_chunk_size=DEFAULT_SKU_CHUNK_SIZE, part_prefix="part"):
+    """
+    Escribe el historial de precios particionado por mes.
+
+    Cada bloque de SKUs escribe un archivo ``month=YYYY-MM/part-NNNNN.csv``
+    en cada mes que cubre. Varios procesos pueden escribir en el mismo
+    directorio si usan prefijos distintos.
+
+    Args:
+        catalog (pd.DataFrame): Catálogo con PRODUCT_SKU, RELEASE_DATE y PRICE_USD.
+        output_dir (str): Directorio de salida.
+        seed (int): Semilla del catálogo.
+        lifetime_days (int): Días de historial por SKU.
+        sku_chunk_size (int): SKUs por bloque.
+        part_prefix (str): Prefijo de los archivos de cada partición.
+
+    Returns:
+        int: Número de filas escritas.
+    """
+    rows = 0
+    for month, chunk_index, frame in iter_price_history(catalog, seed, lifetime_days, sku_chunk_size):
+        partition = os.path.join(output_dir, f"month={month}")
+        os.makedirs(partition, exist_ok=True)
+        with open(os.path.join(partition, f"{part_prefix}-{chunk_index:05d}.csv"), "wb") as f:
+            f.write(encode_csv(frame))
+        rows += len(frame)
+    return rows
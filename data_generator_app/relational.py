@@ -0,0 +1,220 @@
+"""
+Generación de un esquema en estrella alrededor del catálogo de televisiones.
+
+El catálogo generado por :func:`generate_television_data` actúa como tabla
+de productos. A partir de él se generan:
+
+* ``suppliers``: una fila por cada SUPPLIER_ID que puede asignar el
+  generador (``SUP1000``-``SUP9999``).
+* ``warehouses``: una fila por cada ubicación de ``WAREHOUSE_LOCATION``.
+* ``orders``: tabla de hechos con pedidos que referencian PRODUCT_SKU con
+  una popularidad de tipo Zipf.
+
+Las claves foráneas se toman siempre de las tablas de dimensiones, por lo
+que son válidas por construcción. Los pedidos se generan por bloques con
+operaciones vectorizadas de NumPy, ya que la tabla de hechos suele ser
+cientos de veces mayor que el catálogo.
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+from .constants import (
+    COUNTRY_OF_ORIGIN, WAREHOUSE_LOCATION, WAREHOUSE_REGIONS,
+    SUPPLIER_NAME_PREFIXES, SUPPLIER_NAME_SUFFIXES
+)
+
+
+# Rango de identificadores de proveedor que asigna generate_tv_data_row
+SUPPLIER_ID_RANGE = (1000, 9999)
+
+# Pedidos generados por bloque
+DEFAULT_CHUNK_SIZE = 1_000_000
+
+# Exponente de la distribución de popularidad de los productos
+DEFAULT_ZIPF_EXPONENT = 1.1
+
+# Días máximos entre el lanzamiento de un producto y un pedido
+MAX_ORDER_DAYS_AFTER_RELEASE = 730
+
+SUPPLIER_COLUMNS = ["SUPPLIER_ID", "SUPPLIER_NAME", "COUNTRY", "LEAD_TIME_DAYS", "RELIABILITY_SCORE"]
+WAREHOUSE_COLUMNS = ["WAREHOUSE_ID", "WAREHOUSE_LOCATION", "REGION", "CAPACITY_UNITS"]
+ORDER_COLUMNS = [
+    "ORDER_ID", "ORDER_DATE", "PRODUCT_SKU", "SUPPLIER_ID", "WAREHOUSE_ID",
+    "QUANTITY", "UNIT_PRICE_USD", "DISCOUNT_PCT", "TOTAL_USD"
+]
+
+
+def generate_suppliers(seed=None):
+    """
+    Genera la tabla de proveedores.
+
+    Args:
+        seed (int, optional): Semilla para reproducir la tabla.
+
+    Returns:
+        pd.DataFrame: Un proveedor por cada SUPPLIER_ID posible.
+    """
+    rng = np.random.default_rng(seed)
+    ids = np.arange(SUPPLIER_ID_RANGE[0], SUPPLIER_ID_RANGE[1] + 1)
+    count = len(ids)
+
+    prefixes = np.array(SUPPLIER_NAME_PREFIXES, dtype=object)[rng.integers(0, len(SUPPLIER_NAME_PREFIXES), count)]
+    suffixes = np.array(SUPPLIER_NAME_SUFFIXES, dtype=object)[rng.integers(0, len(SUPPLIER_NAME_SUFFIXES), count)]
+
+    return pd.DataFrame({
+        "SUPPLIER_ID": np.char.add("SUP", ids.astype(str)).astype(object),
+        "SUPPLIER_NAME": prefixes + " " + suffixes,
+        "COUNTRY": np.array(COUNTRY_OF_ORIGIN, dtype=object)[rng.integers(0, len(COUNTRY_OF_ORIGIN), count)],
+        "LEAD_TIME_DAYS": rng.integers(5, 61, count),
+        "RELIABILITY_SCORE": np.round(rng.beta(8, 2, count), 2),
+    }, columns=SUPPLIER_COLUMNS)
+
+
+def generate_warehouses(seed=None):
+    """
+    Genera la tabla de almacenes.
+
+    Args:
+        seed (int, optional): Semilla para reproducir la tabla.
+
+    Returns:
+        pd.DataFrame: Un almacén por cada ubicación de WAREHOUSE_LOCATION.
+    """
+    rng = np.random.default_rng(seed)
+    count = len(WAREHOUSE_LOCATION)
+    return pd.DataFrame({
+        "WAREHOUSE_ID": [f"WH{i:02d}" for i in range(1, count + 1)],
+        "WAREHOUSE_LOCATION": WAREHOUSE_LOCATION,
+        "REGION": [WAREHOUSE_REGIONS[location] for location in WAREHOUSE_LOCATION],
+        "CAPACITY_UNITS": rng.integers(5, 51, count) * 1000,
+    }, columns=WAREHOUSE_COLUMNS)
+
+
+def _zipf_cdf(count, exponent):
+    """Función de distribución acumulada de una Zipf acotada a ``count`` rangos."""
+    weights = np.arange(1, count + 1, dtype=np.float64) ** -exponent
+    cdf = np.cumsum(weights)
+    return cdf / cdf[-1]
+
+
+def iter_orders(catalog, rows, chunk_size=DEFAULT_CHUNK_SIZE, zipf_exponent=DEFAULT_ZIPF_EXPONENT, seed=None):
+    """
+    Genera la tabla de pedidos por bloques.
+
+    Cada producto recibe un rango de popularidad aleatorio y los pedidos se
+    reparten entre los rangos según una Zipf de exponente ``zipf_exponent``.
+    El proveedor y el almacén de cada pedido son los del producto, y la fecha
+    es posterior a su lanzamiento.
+
+    Args:
+        catalog (pd.DataFrame): Catálogo generado con generate_television_data.
+        rows (int): Número total de pedidos.
+        chunk_size (int): Pedidos por bloque.
+        zipf_exponent (float): Exponente de la distribución de popularidad.
+        seed (int, optional): Semilla para reproducir los pedidos.
+
+    Yields:
+        pd.DataFrame: Bloques consecutivos de pedidos.
+    """
+    if len(catalog) == 0:
+        raise ValueError("El catálogo no puede estar vacío")
+    if chunk_size <= 0:
+        raise ValueError("El tamaño de bloque debe ser positivo")
+
+    rng = np.random.default_rng(seed)
+
+    # Columnas del catálogo como arrays para indexarlas por posición
+    skus = catalog["PRODUCT_SKU"].to_numpy(dtype=object)
+    suppliers = catalog["SUPPLIER_ID"].to_numpy(dtype=object)
+    warehouse_ids = generate_warehouses()["WAREHOUSE_ID"].to_numpy(dtype=object)
+    locations = pd.Categorical(catalog["WAREHOUSE_LOCATION"], categories=WAREHOUSE_LOCATION)
+    if (locations.codes < 0).any():
+        unknown = sorted(set(catalog["WAREHOUSE_LOCATION"][locations.codes < 0].astype(str)))
+        raise ValueError(f"Ubicaciones de almacén desconocidas en el catálogo: {', '.join(unknown)}")
+    warehouses = warehouse_ids[locations.codes]
+    prices = catalog["PRICE_USD"].to_numpy(dtype=np.float64)
+    release_dates = pd.to_datetime(catalog["RELEASE_DATE"]).to_numpy().astype("datetime64[D]")
+
+    # Rango de popularidad -> posición del producto en el catálogo
+    popularity = rng.permutation(len(catalog))
+    cdf = _zipf_cdf(len(catalog), zipf_exponent)
+
+    for start in range(0, rows, chunk_size):
+        size = min(chunk_size, rows - start)
+        products = popularity[np.minimum(np.searchsorted(cdf, rng.random(size), side="right"), len(cdf) - 1)]
+
+        order_dates = release_dates[products] + rng.integers(0, MAX_ORDER_DAYS_AFTER_RELEASE + 1, size)
+        quantity = rng.geometric(0.6, size)
+        discount = rng.choice([0, 0, 0, 5, 10, 15, 20], size)
+        unit_price = prices[products]
+
+        yield pd.DataFrame({
+            "ORDER_ID": np.arange(start + 1, start + size + 1, dtype=np.int64),
+            "ORDER_DATE": np.datetime_as_string(order_dates, unit="D").astype(object),
+            "PRODUCT_SKU": skus[products],
+            "SUPPLIER_ID": suppliers[products],
+            "WAREHOUSE_ID": warehouses[products],
+            "QUANTITY": quantity,
+            "UNIT_PRICE_USD": unit_price,
+            "DISCOUNT_PCT": discount,
+            "TOTAL_USD": np.round(unit_price * quantity * (1 - discount / 100), 2),
+        }, columns=ORDER_COLUMNS)
+
+
+def generate_orders(catalog, rows, zipf_exponent=DEFAULT_ZIPF_EXPONENT, seed=None):
+    """
+    Genera la tabla de pedidos completa en memoria.
+
+    Args:
+        catalog (pd.DataFrame): Catálogo generado con generate_television_data.
+        rows (int): Número de pedidos.
+        zipf_exponent (float): Exponente de la distribución de popularidad.
+        seed (int, optional): Semilla para reproducir los pedidos.
+
+    Returns:
+        pd.DataFrame: Pedidos generados.
+    """
+    chunks = list(iter_orders(catalog, rows, chunk_size=max(rows, 1), zipf_exponent=zipf_exponent, seed=seed))
+    if not chunks:
+        return pd.DataFrame(columns=ORDER_COLUMNS)
+    return chunks[0]
+
+
+def write_star_schema(catalog, output_dir, order_rows, chunk_size=DEFAULT_CHUNK_SIZE,
+                      zipf_exponent=DEFAULT_ZIPF_EXPONENT, seed=None):
+    """
+    Escribe las tablas de proveedores, almacenes y pedidos en CSV.
+
+    Los pedidos se escriben bloque a bloque, sin mantener la tabla de
+    hechos completa en memoria.
+
+    Args:
+        catalog (pd.DataFrame): Catálogo generado con generate_television_data.
+        output_dir (str): Directorio de salida.
+        order_rows (int): Número de pedidos.
+        chunk_size (int): Pedidos por bloque.
+        zipf_exponent (float): Exponente de la distribución de popularidad.
+        seed (int, optional): Semilla para reproducir las tablas.
+
+    Returns:
+        dict: Ruta de cada tabla escrita.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    seeds = np.random.SeedSequence(seed).spawn(3)
+    paths = {
+        "suppliers": os.path.join(output_dir, "suppliers.csv"),
+        "warehouses": os.path.join(output_dir, "warehouses.csv"),
+        "orders": os.path.join(output_dir, "orders.csv"),
+    }
+
+    generate_suppliers(seeds[0]).to_csv(paths["suppliers"], index=False)
+    generate_warehouses(seeds[1]).to_csv(paths["warehouses"], index=False)
+
+    pd.DataFrame(columns=ORDER_COLUMNS).to_csv(paths["orders"], index=False)
+    for chunk in iter_orders(catalog, order_rows, chunk_size, zipf_exponent, seeds[2]):
+        chunk.to_csv(paths["orders"], mode="a", header=False, index=False)
+
+    return paths
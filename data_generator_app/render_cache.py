@@ -0,0 +1,217 @@
+"""
+Caché de las gráficas renderizadas.
+
+Cada gráfica se identifica por una clave formada por una huella barata del
+archivo de entrada (tamaño, fecha de modificación y hash de bloques
+muestreados), el código que calcula los agregados (el módulo de agregados y el
+script que los carga, con sus parámetros), el código de la función que la
+dibuja y sus parámetros. Las
+claves de las gráficas ya generadas se guardan en un manifiesto junto a las
+imágenes; una gráfica solo se vuelve a dibujar si su clave ha cambiado o si
+falta la imagen.
+"""
+
+import hashlib
+import inspect
+import json
+import os
+import sys
+import tempfile
+
+from . import aggregates as aggregates_module
+from .rendering import render_charts
+
+
+# Nombre del manifiesto que se guarda en el directorio de las gráficas
+MANIFEST_NAME = ".render_cache.json"
+
+# Bloques del archivo de entrada que se leen para la huella
+FINGERPRINT_SAMPLES = 16
+FINGERPRINT_SAMPLE_BYTES = 64 * 1024
+
+
+def input_fingerprint(path, samples=FINGERPRINT_SAMPLES, sample_bytes=FINGERPRINT_SAMPLE_BYTES):
+    """
+    Calcula una huella barata de un archivo sin leerlo entero.
+
+    Combina el tamaño, la fecha de modificación y el hash de ``samples``
+    bloques repartidos uniformemente, incluidos el primero y el último.
+
+    Args:
+        path (str): Archivo de entrada.
+        samples (int): Número de bloques muestreados.
+        sample_bytes (int): Tamaño de cada bloque.
+
+    Returns:
+        str: Hash hexadecimal.
+    """
+    stat = os.stat(path)
+    digest = hashlib.sha256(f"{stat.st_size}:{stat.st_mtime_ns}".encode())
+    last = max(stat.st_size - sample_bytes, 0)
+    offsets = sorted({last * i // max(samples - 1, 1) for i in range(samples)})
+    with open(path, "rb") as f:
+        for offset in offsets:
+            f.seek(offset)
+            digest.update(f.read(sample_bytes))
+    return digest.hexdigest()
+
+
+def _function_source(function):
+    """Código fuente de una función, o su nombre si no está disponible."""
+    try:
+        return inspect.getsource(function)
+    except (OSError, TypeError):
+        return f"{function.__module__}.{function.__qualname__}"
+
+
+def _module_source(module):
+    """Código fuente de un módulo, o su nombre si no está disponible."""
+    try:
+        return inspect.getsource(module)
+    except (OSError, TypeError):
+        return getattr(module, "__name__", str(module))
+
+
+def code_fingerprint(load_aggregates):
+    """
+    Calcula la huella del código que produce los agregados.
+
+    Combina el módulo de agregados y el módulo que define ``load_aggregates``
+    (el script de las gráficas, con sus columnas y parámetros), de modo que
+    cambiar cualquiera de ellos invalida todas las gráficas.
+
+    Args:
+        load_aggregates (callable): Función que calcula los agregados.
+
+    Returns:
+        str: Hash hexadecimal.
+    """
+    digest = hashlib.sha256(_module_source(aggregates_module).encode())
+    module = sys.modules.get(getattr(load_aggregates, "__module__", None))
+    digest.update(_module_source(module if module is not None else load_aggregates).encode())
+    return digest.hexdigest()
+
+
+def chart_key(fingerprint, plot_function, kwargs=None):
+    """
+    Calcula la clave de una gráfica.
+
+    De la gráfica solo se usa el código de la propia función, así que
+    modificar una gráfica no invalida las demás del mismo script.
+
+    Args:
+        fingerprint (str): Huella de los datos de entrada y del código de los
+            agregados.
+        plot_function (callable): Función que dibuja la gráfica.
+        kwargs (dict, optional): Parámetros adicionales de la función.
+
+    Returns:
+        str: Hash hexadecimal.
+    """
+    digest = hashlib.sha256(fingerprint.encode())
+    digest.update(f"{plot_function.__module__}.{plot_function.__qualname__}".encode())
+    digest.update(_function_source(plot_function).encode())
+    digest.update(json.dumps(kwargs or {}, sort_keys=True, default=str).encode())
+    return digest.hexdigest()
+
+
+class RenderCache:
+    """Manifiesto con la clave de cada gráfica generada en un directorio."""
+
+    def __init__(self, output_dir):
+        """
+        Inicializa la caché y carga el manifiesto si existe.
+
+        Args:
+            output_dir (str): Directorio de las gráficas.
+        """
+        self.output_dir = output_dir
+        self.manifest_path = os.path.join(output_dir, MANIFEST_NAME)
+        try:
+            with open(self.manifest_path, encoding="utf-8") as f:
+                self.entries = json.load(f)
+        except (OSError, ValueError):
+            self.entries = {}
+
+    def _name(self, output_path):
+        return os.path.relpath(output_path, self.output_dir)
+
+    def is_fresh(self, output_path, key):
+        """
+        Indica si la gráfica existe y se generó con la misma clave.
+
+        Args:
+            output_path (str): Ruta de la imagen.
+            key (str): Clave calculada con :func:`chart_key`.
+
+        Returns:
+            bool: True si no hace falta volver a dibujarla.
+        """
+        return self.entries.get(self._name(output_path)) == key and os.path.exists(output_path)
+
+    def store(self, output_path, key):
+        """Registra la clave de una gráfica recién generada."""
+        self.entries[self._name(output_path)] = key
+
+    def save(self):
+        """Escribe el manifiesto de forma atómica."""
+        os.makedirs(self.output_dir, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=self.output_dir, prefix=".tmp-", suffix=".json")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(self.entries, f, indent=2, sort_keys=True)
+            os.replace(temp_path, self.manifest_path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+
+def render_cached(charts, input_path, load_aggregates, output_dir, max_workers=None, force=False):
+    """
+    Renderiza solo las gráficas cuya clave ha cambiado.
+
+    Los agregados se calculan únicamente si hay alguna gráfica pendiente, de
+    modo que una ejecución sin cambios no vuelve a leer los datos.
+
+    Args:
+        charts (list): Tuplas ``(plot_function, output_path)`` o
+            ``(plot_function, output_path, kwargs)``.
+        input_path (str): Archivo de datos del que salen los agregados.
+        load_aggregates (callable): Función sin argumentos que devuelve los
+            agregados, o None si no se pudieron cargar.
+        output_dir (str): Directorio de las gráficas y del manifiesto.
+        max_workers (int, optional): Procesos de renderizado.
+        force (bool): Si se vuelven a dibujar todas las gráficas.
+
+    Returns:
+        tuple: Listas de rutas ``(renderizadas, omitidas)``, o None si no se
+        pudieron cargar los agregados.
+    """
+    charts = [chart if len(chart) == 3 else (*chart, {}) for chart in charts]
+    cache = RenderCache(output_dir)
+    fingerprint = f"{input_fingerprint(input_path)}:{code_fingerprint(load_aggregates)}"
+    keys = [chart_key(fingerprint, function, kwargs) for function, _, kwargs in charts]
+
+    stale, skipped = [], []
+    for chart, key in zip(charts, keys):
+        if not force and cache.is_fresh(chart[1], key):
+            skipped.append(chart[1])
+        else:
+            stale.append((chart, key))
+    for path in skipped:
+        print(f"Gráfica sin cambios: {path}")
+    if not stale:
+        return [], skipped
+
+    aggregates = load_aggregates()
+    if aggregates is None:
+        return None
+
+    rendered = render_charts(
+        [(function, aggregates, path, kwargs) for (function, path, kwargs), _ in stale],
+        max_workers=max_workers,
+    )
+    for ((_, path, _), key) in stale:
+        cache.store(path, key)
+    cache.save()
+    return rendered, skipped
@@ -0,0 +1,54 @@
+"""
+Renderizado en paralelo de gráficas.
+
+Cada gráfica se dibuja en un proceso independiente con el backend ``Agg`` de
+matplotlib, que no necesita pantalla y evita compartir estado global de
+pyplot entre gráficas.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import matplotlib
+
+
+# Puntos a partir de los cuales un diagrama de dispersión se sustituye por
+# una muestra estratificada o por un histograma hexagonal
+DEFAULT_MAX_SCATTER_POINTS = 20_000
+
+
+def _use_agg_backend():
+    """Inicializador de los procesos de renderizado."""
+    matplotlib.use("Agg")
+
+
+def _render(plot_function, aggregates, output_path, kwargs):
+    plot_function(aggregates, output_path, **kwargs)
+    return output_path
+
+
+def render_charts(jobs, max_workers=None):
+    """
+    Renderiza varias gráficas de forma concurrente.
+
+    Args:
+        jobs (list): Tuplas ``(plot_function, aggregates, output_path)`` o
+            ``(plot_function, aggregates, output_path, kwargs)``. Las
+            funciones deben poder importarse desde otro proceso.
+        max_workers (int, optional): Número de procesos. Con 1 se renderiza
+            en el proceso actual. Por defecto, el número de CPUs.
+
+    Returns:
+        list: Rutas de las gráficas generadas, en el orden de ``jobs``.
+    """
+    jobs = [job if len(job) == 4 else (*job, {}) for job in jobs]
+    if max_workers is None:
+        max_workers = min(len(jobs), os.cpu_count() or 1)
+
+    if max_workers <= 1:
+        _use_agg_backend()
+        return [_render(*job) for job in jobs]
+
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_use_agg_backend) as pool:
+        futures = [pool.submit(_render, *job) for job in jobs]
+        return [future.result() for future in futures]
@@ -0,0 +1,146 @@
+"""
+Muestreo de valores categóricos con pesos mediante tablas alias de Walker.
+
+Una tabla alias se construye una vez en O(n) y después cada muestra cuesta
+O(1): un único número aleatorio elige una columna de la tabla y decide entre
+su valor propio y su alias. El muestreo por lotes aplica la misma regla con
+operaciones vectorizadas de NumPy.
+"""
+
+import random
+
+import numpy as np
+
+from .constants import CATEGORICAL_VALUES, MARKET_SHARE_WEIGHTS
+
+
+class AliasTable:
+    """Tabla alias de Walker para muestrear una lista de valores con pesos."""
+
+    def __init__(self, values, weights):
+        """
+        Construye la tabla.
+
+        Args:
+            values (list): Valores posibles.
+            weights (list): Peso no negativo de cada valor.
+        """
+        weights = np.asarray(weights, dtype=np.float64)
+        if len(values) == 0 or len(weights) != len(values):
+            raise ValueError("Debe haber un peso por cada valor")
+        if np.any(weights < 0) or not np.isfinite(weights).all() or weights.sum() <= 0:
+            raise ValueError("Los pesos deben ser finitos, no negativos y con suma positiva")
+
+        count = len(values)
+        prob = weights * count / weights.sum()
+        alias = np.arange(count)
+        small = [i for i in range(count) if prob[i] < 1.0]
+        large = [i for i in range(count) if prob[i] >= 1.0]
+
+        # Cada columna pequeña se completa con masa de una columna grande
+        while small and large:
+            less, more = small.pop(), large.pop()
+            alias[less] = more
+            prob[more] -= 1.0 - prob[less]
+            (small if prob[more] < 1.0 else large).append(more)
+
+        # Lo que queda solo difiere de 1 por errores de redondeo
+        for i in small + large:
+            prob[i] = 1.0
+
+        self.values = list(values)
+        self.prob = prob
+        self.alias = alias
+        self._values_array = np.asarray(self.values)
+        self._prob_list = prob.tolist()
+        self._alias_list = alias.tolist()
+
+    def __len__(self):
+        return len(self.values)
+
+    def sample(self):
+        """
+        Muestrea un valor con un único ``random.random()``.
+
+        Returns:
+            Valor elegido.
+        """
+        count = len(self.values)
+        u = random.random() * count
+        column = min(int(u), count - 1)
+        if u - column < self._prob_list[column]:
+            return self.values[column]
+        return self.values[self._alias_list[column]]
+
+    def sample_batch(self, size, rng=None):
+        """
+        Muestrea ``size`` valores de forma vectorizada.
+
+        Args:
+            size (int): Número de muestras.
+            rng (numpy.random.Generator, optional): Generador a utilizar.
+
+        Returns:
+            numpy.ndarray: Valores elegidos.
+        """
+        return self._values_array[self.sample_indices(size, rng)]
+
+    def sample_indices(self, size, rng=None):
+        """
+        Muestrea ``size`` posiciones de ``values`` de forma vectorizada.
+
+        Args:
+            size (int): Número de muestras.
+            rng (numpy.random.Generator, optional): Generador a utilizar.
+
+        Returns:
+            numpy.ndarray: Posiciones elegidas.
+        """
+        rng = np.random.default_rng() if rng is None else rng
+        count = len(self.values)
+        u = rng.random(size) * count
+        columns = np.minimum(u.astype(np.intp), count - 1)
+        return np.where(u - columns < self.prob[columns], columns, self.alias[columns])
+
+
+def _resolve_weights(values, spec):
+    """
+    Convierte una especificación de pesos en una lista alineada con ``values``.
+
+    Admite una secuencia con un peso por valor o un diccionario valor -> peso,
+    en el que los valores omitidos tienen peso 0 y las claves pueden ser
+    cadenas (como en JSON).
+    """
+    if isinstance(spec, dict):
+        by_text = {str(key): weight for key, weight in spec.items()}
+        unknown = set(by_text) - {str(value) for value in values}
+        if unknown:
+            raise ValueError(f"Valores desconocidos en los pesos: {sorted(unknown)}")
+        return [by_text.get(str(value), 0) for value in values]
+    return list(spec)
+
+
+def build_samplers(weights):
+    """
+    Construye las tablas alias de las columnas con pesos.
+
+    Args:
+        weights (dict or str): Diccionario columna -> pesos (secuencia alineada
+            con CATEGORICAL_VALUES o diccionario valor -> peso), o
+            ``"realistic"`` para usar MARKET_SHARE_WEIGHTS.
+
+    Returns:
+        dict: Tabla alias por columna.
+    """
+    if isinstance(weights, str):
+        if weights != "realistic":
+            raise ValueError(f"Pesos predefinidos no soportados: {weights}. Use 'realistic'.")
+        weights = MARKET_SHARE_WEIGHTS
+
+    samplers = {}
+    for column, spec in weights.items():
+        if column not in CATEGORICAL_VALUES:
+            raise ValueError(f"La columna {column} no admite pesos")
+        values = CATEGORICAL_VALUES[column]
+        samplers[column] = AliasTable(values, _resolve_weights(values, spec))
+    return samplers
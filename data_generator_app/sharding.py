@@ -0,0 +1,101 @@
+"""
+Reparto de un conjunto de datos entre varias máquinas sin coordinación.
+
+Con el motor vectorizado cada fila depende solo de la semilla y de su índice
+global: sus columnas salen del bloque de BLOCK_SIZE filas que la contiene y su
+SKU de una permutación de los índices (ver columnar.py). Así, el fragmento
+``k`` de ``N`` genera las filas de un rango contiguo de índices sin compartir
+estado con los demás, sus SKUs no se repiten con los de otros fragmentos y la
+concatenación de todos los fragmentos en orden es igual a generar todas las
+filas en una sola ejecución con la misma semilla.
+"""
+
+import os
+
+from .data_generator import generate_television_data
+from .streaming import DEFAULT_STREAM_CHUNK_SIZE, iter_television_chunks
+
+
+def shard_bounds(rows, num_shards, shard_index):
+    """
+    Calcula el rango de filas de un fragmento.
+
+    Las filas se reparten en rangos contiguos cuyo tamaño difiere como mucho
+    en una fila; los primeros ``rows % num_shards`` fragmentos llevan una más.
+
+    Args:
+        rows (int): Número total de filas del conjunto.
+        num_shards (int): Número de fragmentos.
+        shard_index (int): Fragmento, de 0 a ``num_shards - 1``.
+
+    Returns:
+        tuple: (primera fila, fila siguiente a la última).
+    """
+    if rows < 0:
+        raise ValueError("El número de filas no puede ser negativo")
+    if num_shards <= 0:
+        raise ValueError("El número de fragmentos debe ser positivo")
+    if not 0 <= shard_index < num_shards:
+        raise ValueError(f"El índice de fragmento debe estar entre 0 y {num_shards - 1}")
+
+    size, extra = divmod(rows, num_shards)
+    start = shard_index * size + min(shard_index, extra)
+    return start, start + size + (1 if shard_index < extra else 0)
+
+
+def shard_path(path, shard_index, num_shards):
+    """
+    Añade el fragmento al nombre de un archivo de salida.
+
+    Args:
+        path (str): Ruta de salida del conjunto completo.
+        shard_index (int): Fragmento.
+        num_shards (int): Número de fragmentos.
+
+    Returns:
+        str: Ruta con el sufijo ``-shard-KKKKK-of-NNNNN`` antes de la extensión.
+    """
+    root, ext = os.path.splitext(path)
+    return f"{root}-shard-{shard_index:05d}-of-{num_shards:05d}{ext}"
+
+
+def generate_shard(rows, seed, num_shards=1, shard_index=0, weights=None, return_type="pandas"):
+    """
+    Genera un fragmento del conjunto de datos.
+
+    Args:
+        rows (int): Número total de filas del conjunto.
+        seed (int): Semilla común a todos los fragmentos.
+        num_shards (int): Número de fragmentos.
+        shard_index (int): Fragmento a generar.
+        weights (dict or str, optional): Pesos de las columnas categóricas.
+        return_type (str): Tipo de resultado (ver generate_television_data).
+
+    Returns:
+        pd.DataFrame: Filas del fragmento, o el tipo indicado en ``return_type``.
+    """
+    start, stop = shard_bounds(rows, num_shards, shard_index)
+    return generate_television_data(
+        stop - start, weights=weights, engine="vectorized", return_type=return_type, seed=seed, start=start
+    )
+
+
+def iter_shard_chunks(rows, seed, num_shards=1, shard_index=0, chunk_size=DEFAULT_STREAM_CHUNK_SIZE, weights=None):
+    """
+    Genera un fragmento del conjunto de datos en bloques consecutivos.
+
+    Args:
+        rows (int): Número total de filas del conjunto.
+        seed (int): Semilla común a todos los fragmentos.
+        num_shards (int): Número de fragmentos.
+        shard_index (int): Fragmento a generar.
+        chunk_size (int): Filas por bloque.
+        weights (dict or str, optional): Pesos de las columnas categóricas.
+
+    Returns:
+        iterator: Bloques del fragmento (pandas.DataFrame).
+    """
+    start, stop = shard_bounds(rows, num_shards, shard_index)
+    return iter_television_chunks(
+        stop - start, chunk_size, weights=weights, engine="vectorized", seed=seed, start=start
+    )
@@ -0,0 +1,396 @@
+"""
+Codificación compacta de SKUs, índices de exclusión y registro persistente.
+
+Un SKU tiene la forma ``AB123456``: dos letras mayúsculas seguidas de un
+número de seis dígitos entre 100000 y 999999. Ese espacio tiene
+26 * 26 * 900000 valores, por lo que cada SKU se puede representar como un
+entero en ``[0, SKU_SPACE)`` y un conjunto de SKUs como un mapa de bits.
+"""
+
+from contextlib import contextmanager
+
+import numpy as np
+import pandas as pd
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+    import msvcrt
+
+
+SKU_LETTERS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+SKU_NUMBER_MIN = 100000
+SKU_NUMBER_RANGE = 900000
+SKU_SPACE = len(SKU_LETTERS) ** 2 * SKU_NUMBER_RANGE
+
+# Bytes del mapa de bits de SkuIndex, uno por cada 8 SKUs posibles
+SKU_INDEX_BYTES = (SKU_SPACE + 7) // 8
+
+# Filas leídas por bloque al construir índices desde archivos
+SKU_READ_CHUNK_SIZE = 1_000_000
+
+# Número de bits a 1 de cada valor de byte
+_POPCOUNT = np.array([bin(value).count("1") for value in range(256)], dtype=np.uint8)
+
+
+def encode_sku(sku):
+    """
+    Convierte un SKU en su código entero.
+
+    Args:
+        sku (str): SKU con formato ``AB123456``.
+
+    Returns:
+        int: Código en el rango ``[0, SKU_SPACE)``.
+
+    Raises:
+        ValueError: Si el SKU no tiene un formato válido.
+    """
+    if (
+        not isinstance(sku, str)
+        or len(sku) != 8
+        or sku[0] not in SKU_LETTERS
+        or sku[1] not in SKU_LETTERS
+        or not sku[2:].isdigit()
+        or sku[2] == "0"
+    ):
+        raise ValueError(f"SKU inválido: {sku!r}")
+
+    letters = SKU_LETTERS.index(sku[0]) * 26 + SKU_LETTERS.index(sku[1])
+    return letters * SKU_NUMBER_RANGE + int(sku[2:]) - SKU_NUMBER_MIN
+
+
+def decode_sku(code):
+    """
+    Convierte un código entero en el SKU correspondiente.
+
+    Args:
+        code (int): Código en el rango ``[0, SKU_SPACE)``.
+
+    Returns:
+        str: SKU con formato ``AB123456``.
+    """
+    letters, number = divmod(int(code), SKU_NUMBER_RANGE)
+    first, second = divmod(letters, 26)
+    return f"{SKU_LETTERS[first]}{SKU_LETTERS[second]}{number + SKU_NUMBER_MIN}"
+
+
+def encode_skus(skus):
+    """
+    Versión vectorizada de :func:`encode_sku`.
+
+    Args:
+        skus (array-like): Secuencia de SKUs.
+
+    Returns:
+        numpy.ndarray: Códigos ``int64``; los SKUs inválidos o nulos se
+        codifican como -1.
+    """
+    # Un array 'U' guarda cada carácter como un entero de 32 bits, lo que
+    # permite validar y codificar sin recorrer las filas en Python
+    chars = np.asarray(skus, dtype="U9").view(np.uint32).reshape(-1, 9).astype(np.int64)
+
+    letters = chars[:, :2] - ord("A")
+    digits = chars[:, 2:8] - ord("0")
+    valid = (
+        (chars[:, 8] == 0)
+        & np.all((letters >= 0) & (letters < 26), axis=1)
+        & np.all((digits >= 0) & (digits <= 9), axis=1)
+        & (digits[:, 0] > 0)
+    )
+
+    number = digits @ (10 ** np.arange(5, -1, -1, dtype=np.int64))
+    codes = (letters[:, 0] * 26 + letters[:, 1]) * SKU_NUMBER_RANGE + number - SKU_NUMBER_MIN
+    return np.where(valid, codes, -1)
+
+
+def decode_skus(codes):
+    """
+    Versión vectorizada de :func:`decode_sku`.
+
+    Escribe los caracteres en un búfer de bytes de ancho fijo, sin formatear
+    cadenas fila a fila.
+
+    Args:
+        codes (array-like): Códigos en el rango ``[0, SKU_SPACE)``.
+
+    Returns:
+        numpy.ndarray: SKUs como array ``U8``.
+    """
+    codes = np.asarray(codes, dtype=np.int64)
+    letters, number = np.divmod(codes, SKU_NUMBER_RANGE)
+    number = number + SKU_NUMBER_MIN
+
+    buffer = np.empty((len(codes), 8), dtype=np.uint8)
+    buffer[:, 0] = letters // 26 + ord("A")
+    buffer[:, 1] = letters % 26 + ord("A")
+    for position in range(7, 1, -1):
+        number, digit = np.divmod(number, 10)
+        buffer[:, position] = digit + ord("0")
+    return buffer.view("S8").ravel().astype("U8")
+
+
+class SkuIndex:
+    """
+    Conjunto de SKUs representado como un mapa de bits sobre ``SKU_SPACE``.
+
+    Ocupa unos 76 MB de memoria virtual con independencia del número de SKUs
+    y ofrece comprobaciones de pertenencia en O(1). Implementa ``in`` y
+    ``add`` para poder usarse en lugar del ``set`` que recibe
+    :func:`~data_generator_app.data_generator.generate_unique_sku`.
+    """
+
+    def __init__(self):
+        self._bits = np.zeros(SKU_INDEX_BYTES, dtype=np.uint8)
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    def __contains__(self, sku):
+        try:
+            code = encode_sku(sku)
+        except ValueError:
+            return False
+        return bool(self._bits[code >> 3] & (1 << (code & 7)))
+
+    def add(self, sku):
+        """Añade un SKU al índice."""
+        code = encode_sku(sku)
+        mask = 1 << (code & 7)
+        if not self._bits[code >> 3] & mask:
+            self._bits[code >> 3] |= mask
+            self._count += 1
+
+    def contains_codes(self, codes):
+        """
+        Comprueba la pertenencia de un array de códigos.
+
+        Args:
+            codes (numpy.ndarray): Códigos de SKU; los negativos se ignoran.
+
+        Returns:
+            numpy.ndarray: Array booleano con la pertenencia de cada código.
+        """
+        codes = np.asarray(codes, dtype=np.int64)
+        valid = codes >= 0
+        safe = np.where(valid, codes, 0)
+        found = (self._bits[safe >> 3] >> (safe & 7).astype(np.uint8)) & 1
+        return valid & found.astype(bool)
+
+    def reserve_codes(self, codes):
+        """
+        Añade los códigos que no estaban en el índice.
+
+        Args:
+            codes (numpy.ndarray): Códigos de SKU a reservar.
+
+        Returns:
+            numpy.ndarray: Array booleano; True para los códigos que estaban
+            libres y quedan reservados (solo la primera aparición de cada uno).
+        """
+        codes = np.asarray(codes, dtype=np.int64)
+        free = ~self.contains_codes(codes)
+        _, first = np.unique(codes, return_index=True)
+        is_first = np.zeros(len(codes), dtype=bool)
+        is_first[first] = True
+        reserved = free & is_first & (codes >= 0)
+        self.add_codes(codes[reserved])
+        return reserved
+
+    def add_codes(self, codes):
+        """
+        Añade un array de códigos al índice.
+
+        Args:
+            codes (numpy.ndarray): Códigos de SKU; los negativos se ignoran.
+        """
+        codes = np.unique(np.asarray(codes, dtype=np.int64))
+        codes = codes[codes >= 0]
+        codes = codes[~self.contains_codes(codes)]
+        if len(codes) == 0:
+            return
+
+        # Agrupar los bits que caen en el mismo byte para que la asignación
+        # con índices no pierda actualizaciones
+        byte_index = codes >> 3
+        bits = np.left_shift(1, codes & 7).astype(np.uint8)
+        starts = np.flatnonzero(np.r_[True, byte_index[1:] != byte_index[:-1]])
+        self._bits[byte_index[starts]] |= np.bitwise_or.reduceat(bits, starts)
+        self._count += len(codes)
+
+    @classmethod
+    def from_csv(cls, file_path, chunksize=SKU_READ_CHUNK_SIZE):
+        """
+        Construye un índice leyendo solo la columna PRODUCT_SKU de un CSV.
+
+        Args:
+            file_path (str): Ruta del archivo CSV.
+            chunksize (int): Filas leídas por bloque.
+
+        Returns:
+            SkuIndex: Índice con todos los SKUs válidos del archivo.
+        """
+        index = cls()
+        index.add_csv(file_path, chunksize=chunksize)
+        return index
+
+    def add_csv(self, file_path, chunksize=SKU_READ_CHUNK_SIZE):
+        """
+        Añade al índice los SKUs de un CSV leyendo solo la columna PRODUCT_SKU.
+
+        Args:
+            file_path (str): Ruta del archivo CSV.
+            chunksize (int): Filas leídas por bloque.
+        """
+        reader = pd.read_csv(
+            file_path,
+            usecols=["PRODUCT_SKU"],
+            dtype={"PRODUCT_SKU": str},
+            chunksize=chunksize,
+        )
+        for chunk in reader:
+            self.add_codes(encode_skus(chunk["PRODUCT_SKU"].to_numpy()))
+
+
+
+def _lock_exclusive(f):
+    """Espera a tener el bloqueo exclusivo de un archivo abierto."""
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        return
+    f.seek(0)
+    while True:
+        try:
+            # LK_LOCK reintenta durante unos 10 segundos antes de fallar
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+            return
+        except OSError:
+            continue
+
+
+def _unlock(f):
+    """Libera el bloqueo tomado con _lock_exclusive."""
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+    else:
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class SkuRegistry(SkuIndex):
+    """
+    Registro persistente de SKUs compartido entre procesos y ejecuciones.
+
+    El mapa de bits vive en un archivo proyectado en memoria con
+    ``numpy.memmap``, por lo que las comprobaciones de pertenencia son O(1)
+    y el sistema operativo solo carga las páginas que se consultan. Cada
+    escritura (:meth:`add`, :meth:`add_codes`, :meth:`reserve_codes`) toma
+    durante un momento un bloqueo exclusivo sobre el archivo, así que varios
+    procesos pueden generar a la vez: los generadores reservan los SKUs de
+    cada lote con :meth:`reserve_codes` y vuelven a sortear los que otro
+    proceso reservó antes.
+
+    Ejemplo::
+
+        registry = SkuRegistry("skus.registry")
+        df = generate_television_data(1000, existing_skus=registry)
+    """
+
+    def __init__(self, file_path):
+        """
+        Abre el registro, creándolo vacío si no existe.
+
+        Args:
+            file_path (str): Ruta del archivo del registro.
+        """
+        self.file_path = file_path
+        size = SKU_INDEX_BYTES
+
+        # El archivo se crea disperso: solo ocupa disco lo que se escribe
+        with open(file_path, "ab") as f:
+            if f.tell() < size:
+                f.truncate(size)
+
+        self._bits = np.memmap(file_path, dtype=np.uint8, mode="r+", shape=(size,))
+        self._count = 0
+        self._lock_file = None
+        self._lock_depth = 0
+
+    def __len__(self):
+        # El número de SKUs puede cambiar desde otros procesos, así que se
+        # cuenta recorriendo el mapa de bits por bloques
+        total = 0
+        block = 1 << 23
+        for start in range(0, len(self._bits), block):
+            total += int(_POPCOUNT[self._bits[start:start + block]].sum(dtype=np.int64))
+        return total
+
+    @contextmanager
+    def lock(self):
+        """
+        Bloqueo exclusivo entre procesos sobre el registro.
+
+        Es reentrante dentro del mismo objeto. Al liberarlo se vuelcan a
+        disco los SKUs reservados. Usa ``flock`` en POSIX y
+        ``msvcrt.locking`` sobre el primer byte del archivo en Windows.
+        """
+        if self._lock_depth == 0:
+            self._lock_file = open(self.file_path, "rb")
+            _lock_exclusive(self._lock_file)
+        self._lock_depth += 1
+        try:
+            yield self
+        finally:
+            self._lock_depth -= 1
+            if self._lock_depth == 0:
+                self._bits.flush()
+                _unlock(self._lock_file)
+                self._lock_file.close()
+                self._lock_file = None
+
+    def add(self, sku):
+        """Añade un SKU al registro bajo el bloqueo."""
+        with self.lock():
+            super().add(sku)
+
+    def add_codes(self, codes):
+        """Añade un array de códigos al registro bajo el bloqueo."""
+        with self.lock():
+            super().add_codes(codes)
+
+    def reserve(self, sku):
+        """
+        Reserva un SKU de forma atómica entre procesos.
+
+        Args:
+            sku (str): SKU a reservar.
+
+        Returns:
+            bool: True si el SKU estaba libre y queda reservado.
+        """
+        with self.lock():
+            if sku in self:
+                return False
+            self.add(sku)
+            return True
+
+    def reserve_codes(self, codes):
+        """
+        Reserva un array de códigos de forma atómica entre procesos.
+
+        Args:
+            codes (numpy.ndarray): Códigos de SKU a reservar.
+
+        Returns:
+            numpy.ndarray: Array booleano; True para los códigos que estaban
+            libres y quedan reservados por esta llamada.
+        """
+        with self.lock():
+            return super().reserve_codes(codes)
+
+    def close(self):
+        """Vuelca los cambios pendientes y libera la proyección en memoria."""
+        self._bits.flush()
+        self._bits = None
@@ -0,0 +1,400 @@
+"""
+Estadísticas resumidas en una sola pasada y fusionables.
+
+:class:`SummaryAccumulator` procesa bloques de datos y mantiene recuentos
+exactos, momentos (media, varianza, mínimo y máximo), bocetos de cuantiles
+para la mediana y bocetos HyperLogLog para el número de valores distintos.
+Los acumuladores de distintos bloques, procesos o fragmentos se combinan con
+:meth:`SummaryAccumulator.merge`, por lo que la memoria usada no depende del
+número de filas.
+"""
+
+import math
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from .constants import COLUMN_NAMES, PRICE_USD
+
+
+# Filas leídas por bloque al resumir un archivo
+DEFAULT_CHUNK_SIZE = 500_000
+
+# Columnas numéricas con momentos y cuantiles
+NUMERIC_COLUMNS = [
+    "SCREEN_SIZE_INCHES", "PRICE_USD", "QUALITY_RATING", "REFRESH_RATE_HZ",
+    "HDMI_PORTS", "USB_PORTS", "AUDIO_OUTPUT_WATTS", "MANUFACTURE_YEAR",
+    "STOCK_QUANTITY", "CUSTOMER_RATING", "WEIGHT_KG", "WARRANTY_YEARS",
+    "POWER_CONSUMPTION_WATTS", "INPUT_LAG_MS",
+]
+
+# Columnas con demasiados valores distintos para contarlos de forma exacta
+HIGH_CARDINALITY_COLUMNS = ["PRODUCT_SKU", "MODEL", "SUPPLIER_ID", "DIMENSIONS_CM", "RELEASE_DATE"]
+
+# Columnas con recuento exacto de valores
+COUNTED_COLUMNS = [
+    column for column in COLUMN_NAMES
+    if column not in HIGH_CARDINALITY_COLUMNS
+    and column not in ("PRICE_USD", "CUSTOMER_RATING", "WEIGHT_KG", "STOCK_QUANTITY",
+                       "POWER_CONSUMPTION_WATTS", "INPUT_LAG_MS")
+]
+
+# Segmentos de precio derivados de los rangos de constants.PRICE_USD; los
+# extremos se abren para que todos los precios caigan en algún segmento
+SEGMENT_LABELS = list(PRICE_USD)
+SEGMENT_BINS = [0.0] + [high for _, high in list(PRICE_USD.values())[:-1]] + [math.inf]
+
+
+class QuantileSketch:
+    """
+    Boceto de cuantiles con error relativo acotado (estilo DDSketch).
+
+    Cada valor se asigna a un intervalo logarítmico de razón ``gamma``; el
+    cuantil estimado tiene un error relativo de como mucho
+    ``relative_accuracy``. Dos bocetos se fusionan sumando sus recuentos.
+    """
+
+    def __init__(self, relative_accuracy=0.005):
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.positive = Counter()
+        self.negative = Counter()
+        self.zero_count = 0
+        self.count = 0
+
+    def update(self, values):
+        """Añade un array de valores (se ignoran los NaN)."""
+        values = np.asarray(values, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        self.count += len(values)
+        self.zero_count += int(np.count_nonzero(values == 0))
+        for store, part in ((self.positive, values[values > 0]), (self.negative, -values[values < 0])):
+            if len(part):
+                keys, counts = np.unique(np.ceil(np.log(part) / self._log_gamma).astype(np.int64),
+                                         return_counts=True)
+                store.update(dict(zip(keys.tolist(), counts.tolist())))
+
+    def merge(self, other):
+        """Incorpora otro boceto con la misma precisión."""
+        self.positive.update(other.positive)
+        self.negative.update(other.negative)
+        self.zero_count += other.zero_count
+        self.count += other.count
+
+    def quantile(self, q):
+        """
+        Estima un cuantil.
+
+        Args:
+            q (float): Cuantil entre 0 y 1.
+
+        Returns:
+            float: Valor estimado, o NaN si el boceto está vacío.
+        """
+        if self.count == 0:
+            return math.nan
+
+        rank = q * (self.count - 1)
+        seen = 0
+        for key in sorted(self.negative, reverse=True):
+            seen += self.negative[key]
+            if seen > rank:
+                return -self._bucket_value(key)
+        seen += self.zero_count
+        if seen > rank:
+            return 0.0
+        for key in sorted(self.positive):
+            seen += self.positive[key]
+            if seen > rank:
+                return self._bucket_value(key)
+        return self._bucket_value(max(self.positive))
+
+    def _bucket_value(self, key):
+        return 2 * self.gamma ** key / (self.gamma + 1)
+
+
+def _hash_values(values):
+    """
+    Hashes de 64 bits de unos valores, iguales para un entero y el mismo valor decimal.
+
+    Una columna entera pasa a decimal en los bloques con nulos (un campo vacío
+    de un CSV, un fallo inyectado) y ``pd.util.hash_array`` no da el mismo
+    hash a 5 que a 5.0, así que los decimales enteros se hashean como int64.
+    """
+    values = np.asarray(values)
+    if values.dtype == object and pd.api.types.infer_dtype(values, skipna=False) in (
+            "integer", "floating", "mixed-integer-float"):
+        values = values.astype(np.float64)
+    if values.dtype.kind != "f":
+        return pd.util.hash_array(values)
+
+    values = values.astype(np.float64)
+    with np.errstate(invalid="ignore"):
+        integral = np.isfinite(values) & (values == np.trunc(values)) & (np.abs(values) < 2.0 ** 63)
+    hashes = np.empty(len(values), dtype=np.uint64)
+    hashes[integral] = pd.util.hash_array(values[integral].astype(np.int64))
+    hashes[~integral] = pd.util.hash_array(values[~integral])
+    return hashes
+
+
+class HyperLogLog:
+    """
+    Boceto HyperLogLog para estimar el número de valores distintos.
+
+    Con ``precision`` p usa 2**p registros de un byte; el error típico es
+    ``1.04 / sqrt(2**p)`` (un 0,8 % con p=14). Dos bocetos se fusionan con el
+    máximo de sus registros.
+    """
+
+    def __init__(self, precision=14):
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.uint8)
+
+    def update(self, values):
+        """Añade un array de valores."""
+        if len(values) == 0:
+            return
+        hashes = _hash_values(values)
+        index = (hashes >> np.uint64(64 - self.precision)).astype(np.int64)
+        rest_bits = 64 - self.precision
+        rest = hashes & np.uint64((1 << rest_bits) - 1)
+
+        # Longitud en bits del resto; frexp puede redondear hacia arriba al
+        # convertir a float, así que se corrige comprobando con desplazamientos
+        _, bit_length = np.frexp(rest.astype(np.float64))
+        bit_length = bit_length.astype(np.int64)
+        too_long = (bit_length > 0) & (
+            (bit_length > rest_bits)
+            | ((rest >> np.maximum(bit_length - 1, 0).astype(np.uint64)) == 0)
+        )
+        bit_length -= too_long
+
+        rank = (rest_bits - bit_length + 1).astype(np.uint8)
+        np.maximum.at(self.registers, index, rank)
+
+    def merge(self, other):
+        """Incorpora otro boceto con la misma precisión."""
+        np.maximum(self.registers, other.registers, out=self.registers)
+
+    def estimate(self):
+        """int: Número estimado de valores distintos."""
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m * m / np.sum(np.ldexp(1.0, -self.registers.astype(np.int64)))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if raw <= 2.5 * m and zeros:
+            # Corrección para cardinalidades pequeñas (linear counting)
+            return int(round(m * math.log(m / zeros)))
+        return int(round(raw))
+
+
+class NumericMoments:
+    """Recuento, media, varianza, mínimo y máximo fusionables (algoritmo de Chan)."""
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def update(self, values):
+        """Añade un array de valores (se ignoran los NaN)."""
+        values = np.asarray(values, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return
+        other = NumericMoments()
+        other.count = len(values)
+        other.mean = float(values.mean())
+        other.m2 = float(((values - other.mean) ** 2).sum())
+        other.min = float(values.min())
+        other.max = float(values.max())
+        self.merge(other)
+
+    def merge(self, other):
+        """Incorpora otros momentos."""
+        if other.count == 0:
+            return
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.m2 += other.m2 + delta * delta * self.count * other.count / total
+        self.mean += delta * other.count / total
+        self.count = total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    @property
+    def std(self):
+        """float: Desviación típica muestral."""
+        return math.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else math.nan
+
+
+class SummaryAccumulator:
+    """
+    Resumen en streaming de las columnas de ``COLUMN_NAMES``.
+
+    Ejemplo::
+
+        accumulator = SummaryAccumulator()
+        for chunk in pd.read_csv("tv.csv", chunksize=100_000):
+            accumulator.update(chunk)
+        summary = accumulator.result()
+    """
+
+    def __init__(self, relative_accuracy=0.005, hll_precision=14):
+        self.total_records = 0
+        self.null_counts = Counter()
+        self.moments = {column: NumericMoments() for column in NUMERIC_COLUMNS}
+        self.quantiles = {column: QuantileSketch(relative_accuracy) for column in NUMERIC_COLUMNS}
+        self.distinct = {column: HyperLogLog(hll_precision) for column in COLUMN_NAMES}
+        self.value_counts = {column: Counter() for column in COUNTED_COLUMNS + ["PRICE_SEGMENT"]}
+
+    def update(self, chunk):
+        """
+        Incorpora un bloque de datos.
+
+        Args:
+            chunk (pandas.DataFrame): Bloque con columnas de ``COLUMN_NAMES``;
+                las que falten se ignoran.
+        """
+        self.total_records += len(chunk)
+        for column in COLUMN_NAMES:
+            if column not in chunk:
+                continue
+            values = chunk[column]
+            nulls = int(values.isna().sum())
+            if nulls:
+                self.null_counts[column] += nulls
+                values = values.dropna()
+
+            self.distinct[column].update(values.to_numpy())
+            if column in self.moments:
+                self.moments[column].update(values.to_numpy())
+                self.quantiles[column].update(values.to_numpy())
+            if column in self.value_counts:
+                self.value_counts[column].update(values.value_counts().to_dict())
+
+        if "PRICE_USD" in chunk:
+            segments = pd.cut(chunk["PRICE_USD"], bins=SEGMENT_BINS, labels=SEGMENT_LABELS)
+            self.value_counts["PRICE_SEGMENT"].update(segments.value_counts().to_dict())
+
+    def merge(self, other):
+        """
+        Incorpora el resumen parcial de otro bloque, proceso o fragmento.
+
+        Args:
+            other (SummaryAccumulator): Resumen parcial con la misma configuración.
+        """
+        self.total_records += other.total_records
+        self.null_counts.update(other.null_counts)
+        for column in NUMERIC_COLUMNS:
+            self.moments[column].merge(other.moments[column])
+            self.quantiles[column].merge(other.quantiles[column])
+        for column in COLUMN_NAMES:
+            self.distinct[column].merge(other.distinct[column])
+        for column, counts in other.value_counts.items():
+            self.value_counts[column].update(counts)
+
+    def column_stats(self):
+        """
+        Estadísticas por columna.
+
+        Returns:
+            dict: Para cada columna, ``nulls`` y ``distinct`` (exacto si se
+            cuentan sus valores, estimado en otro caso) y, en las numéricas,
+            ``mean``, ``std``, ``min``, ``max`` y ``median`` (aproximada).
+        """
+        stats = {}
+        for column in COLUMN_NAMES:
+            column_stats = {"nulls": self.null_counts[column]}
+            if column in self.value_counts:
+                column_stats["distinct"] = sum(1 for count in self.value_counts[column].values() if count)
+            else:
+                column_stats["distinct"] = self.distinct[column].estimate()
+            if column in self.moments:
+                moments = self.moments[column]
+                column_stats.update({
+                    "mean": moments.mean if moments.count else math.nan,
+                    "std": moments.std,
+                    "min": moments.min if moments.count else math.nan,
+                    "max": moments.max if moments.count else math.nan,
+                    "median": self.quantiles[column].quantile(0.5),
+                })
+            stats[column] = column_stats
+        return stats
+
+    def result(self):
+        """
+        Devuelve el resumen en el formato de ``utils.generate_summary_stats``.
+
+        Returns:
+            dict: Resumen con las claves que usa ``utils.export_summary`` y
+            las estadísticas de todas las columnas en ``columns``.
+        """
+        columns = self.column_stats()
+        price = columns["PRICE_USD"]
+
+        def distribution(column, sort_by_value=False):
+            counts = {value: count for value, count in self.value_counts[column].items() if count}
+            if sort_by_value:
+                return dict(sorted(counts.items()))
+            return dict(sorted(counts.items(), key=lambda item: -item[1]))
+
+        return {
+            "total_records": self.total_records,
+            "brands_count": columns["BRAND"]["distinct"],
+            "avg_price": price["mean"],
+            "median_price": price["median"],
+            "min_price": price["min"],
+            "max_price": price["max"],
+            "avg_quality": columns["QUALITY_RATING"]["mean"],
+            "size_distribution": distribution("SCREEN_SIZE_INCHES", sort_by_value=True),
+            "resolution_distribution": distribution("RESOLUTION"),
+            "segment_distribution": {
+                label: self.value_counts["PRICE_SEGMENT"][label]
+                for label in SEGMENT_LABELS if self.value_counts["PRICE_SEGMENT"][label]
+            },
+            "columns": columns,
+        }
+
+
+def summarize_csv(file_path, chunksize=DEFAULT_CHUNK_SIZE):
+    """
+    Resume un CSV generado leyéndolo por bloques.
+
+    Args:
+        file_path (str): Ruta del archivo CSV.
+        chunksize (int): Filas leídas por bloque.
+
+    Returns:
+        SummaryAccumulator: Resumen parcial del archivo, fusionable con otros.
+    """
+    accumulator = SummaryAccumulator()
+    # El generador solo escribe los nulos como campos vacíos; "None" es un
+    # valor válido de HDR_FORMATS, VOICE_ASSISTANT y ECO_CERTIFICATIONS
+    for chunk in pd.read_csv(file_path, chunksize=chunksize, keep_default_na=False, na_values=[""]):
+        accumulator.update(chunk)
+    return accumulator
+
+
+def summarize_files(file_paths, chunksize=DEFAULT_CHUNK_SIZE, max_workers=None):
+    """
+    Resume varios CSV (por ejemplo, fragmentos) en paralelo y fusiona el resultado.
+
+    Args:
+        file_paths (list): Rutas de los archivos CSV.
+        chunksize (int): Filas leídas por bloque.
+        max_workers (int, optional): Número de procesos.
+
+    Returns:
+        SummaryAccumulator: Resumen combinado de todos los archivos.
+    """
+    total = SummaryAccumulator()
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        for partial in pool.map(summarize_csv, file_paths, [chunksize] * len(file_paths)):
+            total.merge(partial)
+    return total
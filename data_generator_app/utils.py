@@ -7,6 +7,8 @@ import pandas as pd
 import seaborn as sns
 import os
 
+from .summary import DEFAULT_CHUNK_SIZE, SummaryAccumulator, summarize_csv
+
 
 def create_output_dir(dir_name="output"):
     """
@@ -68,26 +70,22 @@ def generate_summary_stats(data):
     """
     Genera estadísticas resumidas del conjunto de datos.
     
+    Se calculan en una sola pasada con
+    :class:`~data_generator_app.summary.SummaryAccumulator`, así que ``data``
+    puede ser un iterable de bloques (por ejemplo, el lector de
+    ``pd.read_csv`` con ``chunksize``) además de un DataFrame.
+    
     Args:
-        data (pandas.DataFrame): DataFrame con los datos.
+        data (pandas.DataFrame or iterable): DataFrame o bloques de DataFrame.
         
     Returns:
         dict: Diccionario con estadísticas resumidas.
     """
-    summary = {
-        "total_records": len(data),
-        "brands_count": data["brand"].nunique(),
-        "avg_price": data["price"].mean(),
-        "median_price": data["price"].median(),
-        "min_price": data["price"].min(),
-        "max_price": data["price"].max(),
-        "avg_quality": data["quality_rating"].mean(),
-        "size_distribution": data["screen_size"].value_counts().to_dict(),
-        "resolution_distribution": data["resolution"].value_counts().to_dict(),
-        "segment_distribution": data["segment"].value_counts().to_dict()
-    }
-    
-    return summary
+    accumulator = SummaryAccumulator()
+    chunks = [data] if isinstance(data, pd.DataFrame) else data
+    for chunk in chunks:
+        accumulator.update(chunk)
+    return accumulator.result()
 
 
 def export_summary(summary, output_file="summary.txt"):
@@ -121,3 +119,32 @@ def export_summary(summary, output_file="summary.txt"):
         f.write("\nDistribución por segmento:\n")
         for seg, count in summary["segment_distribution"].items():
             f.write(f"  {seg}: {count} ({count/summary['total_records']*100:.1f}%)\n")
+        
+        if "columns" in summary:
+            f.write("\nEstadísticas por columna:\n")
+            for column, stats in summary["columns"].items():
+                line = f"  {column}: distintos={stats['distinct']}, nulos={stats['nulls']}"
+                if "mean" in stats:
+                    line += (f", media={stats['mean']:.2f}, desv={stats['std']:.2f}, "
+                             f"mín={stats['min']:.2f}, mediana~{stats['median']:.2f}, máx={stats['max']:.2f}")
+                f.write(line + "\n")
+
+
+def export_file_summary(data_file, output_file="summary.txt", chunksize=DEFAULT_CHUNK_SIZE):
+    """
+    Resume un CSV generado por bloques y exporta el resumen.
+    
+    El archivo no se carga entero en memoria, así que sirve para salidas de
+    cualquier tamaño.
+    
+    Args:
+        data_file (str): Ruta del CSV con los datos.
+        output_file (str): Ruta del archivo de salida.
+        chunksize (int): Filas leídas por bloque.
+        
+    Returns:
+        dict: Resumen exportado.
+    """
+    summary = summarize_csv(data_file, chunksize=chunksize).result()
+    export_summary(summary, output_file)
+    return summary
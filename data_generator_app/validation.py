@@ -0,0 +1,275 @@
+"""
+Validación vectorizada de las invariantes de los datos generados.
+
+Las reglas reproducen las restricciones que impone el propio generador
+(rangos de fechas, puertos por gama de precio, coherencia entre
+calificaciones, formato y unicidad de los SKUs...). Cada regla es una
+función que recibe un bloque y devuelve una máscara booleana con las filas
+que la incumplen, por lo que los archivos se validan por bloques sin
+cargarlos enteros.
+"""
+
+import numpy as np
+import pandas as pd
+
+from .constants import (
+    BRANDS, DISPLAY_TECHNOLOGIES, RESOLUTIONS, SCREEN_SIZES_INCHES,
+    NUMBER_OF_HDMI_PORTS, NUMBER_OF_USB_PORTS, MANUFACTURE_YEAR
+)
+from .sku import SkuIndex, encode_skus
+
+
+# Filas leídas por bloque al validar un archivo
+DEFAULT_CHUNK_SIZE = 500_000
+
+# Filas de ejemplo guardadas por regla incumplida
+DEFAULT_SAMPLE_ROWS = 5
+
+# Tolerancia para comparar valores redondeados a un decimal
+_TOLERANCE = 1e-9
+
+
+def _ports_violation(price, ports, ports_list):
+    """Puertos fuera de la gama que asigna ``_get_ports`` según el precio."""
+    price = price.to_numpy()
+    ports = ports.to_numpy()
+    allowed_low = np.isin(ports, ports_list[:2])
+    allowed_mid = np.isin(ports, ports_list[1:3])
+    allowed_high = np.isin(ports, ports_list[2:])
+    allowed = np.where(price < 500, allowed_low, np.where(price < 1500, allowed_mid, allowed_high))
+    return ~allowed
+
+
+def _release_date_violation(chunk):
+    dates = pd.to_datetime(chunk["RELEASE_DATE"], format="%Y-%m-%d", errors="coerce")
+    return (
+        dates.isna()
+        | (dates.dt.year != chunk["MANUFACTURE_YEAR"])
+        | (dates.dt.month > 6)
+    ).to_numpy()
+
+
+def _customer_rating_violation(chunk):
+    customer = chunk["CUSTOMER_RATING"].to_numpy(dtype=np.float64)
+    quality = chunk["QUALITY_RATING"].to_numpy(dtype=np.float64)
+    return (
+        np.isnan(customer)
+        | (np.abs(customer - quality) > 0.8 + _TOLERANCE)
+        | (customer < 1.0) | (customer > 5.0)
+    )
+
+
+def _refresh_rate_violation(chunk):
+    price = chunk["PRICE_USD"].to_numpy()
+    rate = chunk["REFRESH_RATE_HZ"].to_numpy()
+    premium = (price > 2000) | chunk["DISPLAY_TECHNOLOGY"].isin(["OLED", "QLED", "MicroLED"]).to_numpy()
+    allowed = np.where(
+        premium,
+        np.isin(rate, [60, 75, 120, 144, 240]),
+        np.where(price > 1000, np.isin(rate, [60, 75, 120, 144]), np.isin(rate, [60, 75])),
+    )
+    return ~allowed
+
+
+# Reglas: nombre, descripción, columnas usadas y función de incumplimiento
+RULES = [
+    (
+        "sku_format",
+        "PRODUCT_SKU no tiene el formato AB123456",
+        ["PRODUCT_SKU"],
+        lambda chunk: encode_skus(chunk["PRODUCT_SKU"].to_numpy()) < 0,
+    ),
+    (
+        "release_date",
+        "RELEASE_DATE fuera de enero-junio de MANUFACTURE_YEAR",
+        ["RELEASE_DATE", "MANUFACTURE_YEAR"],
+        _release_date_violation,
+    ),
+    (
+        "manufacture_year",
+        "MANUFACTURE_YEAR fuera del rango de fabricación",
+        ["MANUFACTURE_YEAR"],
+        lambda chunk: ~chunk["MANUFACTURE_YEAR"].isin(MANUFACTURE_YEAR).to_numpy(),
+    ),
+    (
+        "hdmi_ports",
+        "HDMI_PORTS no corresponde a la gama de precio",
+        ["PRICE_USD", "HDMI_PORTS"],
+        lambda chunk: _ports_violation(chunk["PRICE_USD"], chunk["HDMI_PORTS"], NUMBER_OF_HDMI_PORTS),
+    ),
+    (
+        "usb_ports",
+        "USB_PORTS no corresponde a la gama de precio",
+        ["PRICE_USD", "USB_PORTS"],
+        lambda chunk: _ports_violation(chunk["PRICE_USD"], chunk["USB_PORTS"], NUMBER_OF_USB_PORTS),
+    ),
+    (
+        "customer_rating",
+        "CUSTOMER_RATING a más de 0.8 de QUALITY_RATING o fuera de 1-5",
+        ["CUSTOMER_RATING", "QUALITY_RATING"],
+        _customer_rating_violation,
+    ),
+    (
+        "quality_rating",
+        "QUALITY_RATING fuera de 1-5",
+        ["QUALITY_RATING"],
+        lambda chunk: ~chunk["QUALITY_RATING"].between(1, 5).to_numpy(),
+    ),
+    (
+        "refresh_rate",
+        "REFRESH_RATE_HZ no corresponde a la tecnología y el precio",
+        ["PRICE_USD", "REFRESH_RATE_HZ", "DISPLAY_TECHNOLOGY"],
+        _refresh_rate_violation,
+    ),
+    (
+        "price",
+        "PRICE_USD no es positivo",
+        ["PRICE_USD"],
+        lambda chunk: ~(chunk["PRICE_USD"] > 0).to_numpy(),
+    ),
+    (
+        "categories",
+        "BRAND, DISPLAY_TECHNOLOGY, RESOLUTION o SCREEN_SIZE_INCHES fuera de las constantes",
+        ["BRAND", "DISPLAY_TECHNOLOGY", "RESOLUTION", "SCREEN_SIZE_INCHES"],
+        lambda chunk: ~(
+            chunk["BRAND"].isin(BRANDS)
+            & chunk["DISPLAY_TECHNOLOGY"].isin(DISPLAY_TECHNOLOGIES)
+            & chunk["RESOLUTION"].isin(RESOLUTIONS)
+            & chunk["SCREEN_SIZE_INCHES"].isin(SCREEN_SIZES_INCHES)
+        ).to_numpy(),
+    ),
+    (
+        "dimensions_format",
+        "DIMENSIONS_CM no tiene el formato 'W x H x D'",
+        ["DIMENSIONS_CM"],
+        lambda chunk: ~chunk["DIMENSIONS_CM"].str.fullmatch(r"\d+W x \d+H x \d+\.?\d*D", na=False).to_numpy(),
+    ),
+]
+
+# Regla de unicidad, que necesita estado entre bloques
+SKU_UNIQUE_RULE = ("sku_unique", "PRODUCT_SKU repetido", ["PRODUCT_SKU"])
+
+
+class ValidationReport:
+    """Recuento de incumplimientos por regla con filas de ejemplo."""
+
+    def __init__(self, sample_rows=DEFAULT_SAMPLE_ROWS):
+        self.sample_rows = sample_rows
+        self.total_rows = 0
+        descriptions = [(name, description) for name, description, _, _ in RULES]
+        descriptions.append(SKU_UNIQUE_RULE[:2])
+        self.descriptions = dict(descriptions)
+        self.violations = {name: 0 for name in self.descriptions}
+        self.samples = {name: [] for name in self.descriptions}
+
+    @property
+    def ok(self):
+        """bool: True si no hay ningún incumplimiento."""
+        return not any(self.violations.values())
+
+    def record(self, name, mask, chunk, offset):
+        """
+        Registra las filas de un bloque que incumplen una regla.
+
+        Args:
+            name (str): Nombre de la regla.
+            mask (numpy.ndarray): Filas del bloque que la incumplen.
+            chunk (pandas.DataFrame): Bloque validado.
+            offset (int): Posición de la primera fila del bloque en el archivo.
+        """
+        count = int(np.count_nonzero(mask))
+        if not count:
+            return
+        self.violations[name] += count
+        missing = self.sample_rows - len(self.samples[name])
+        if missing > 0:
+            positions = np.flatnonzero(mask)[:missing]
+            for position, row in zip(positions, chunk.iloc[positions].to_dict("records")):
+                self.samples[name].append({"ROW": offset + int(position), **row})
+
+    def format(self):
+        """str: Informe legible de la validación."""
+        lines = [f"Filas validadas: {self.total_rows}"]
+        for name, count in self.violations.items():
+            status = "OK" if count == 0 else f"{count} incumplimientos"
+            lines.append(f"  [{name}] {self.descriptions[name]}: {status}")
+            for row in self.samples[name]:
+                lines.append(f"      fila {row['ROW']}: {row}")
+        return "\n".join(lines)
+
+
+class DatasetValidator:
+    """Valida bloques consecutivos de un mismo conjunto de datos."""
+
+    def __init__(self, sample_rows=DEFAULT_SAMPLE_ROWS):
+        self.report = ValidationReport(sample_rows)
+        self._skus = SkuIndex()
+
+    def update(self, chunk):
+        """
+        Valida un bloque y acumula sus incumplimientos en :attr:`report`.
+
+        Args:
+            chunk (pandas.DataFrame): Bloque de datos generados.
+        """
+        offset = self.report.total_rows
+        self.report.total_rows += len(chunk)
+        chunk = chunk.reset_index(drop=True)
+
+        for name, _, _, rule in RULES:
+            self.report.record(name, rule(chunk), chunk, offset)
+
+        # Un SKU válido está repetido si ya apareció en bloques anteriores o
+        # antes dentro del mismo bloque
+        codes = encode_skus(chunk["PRODUCT_SKU"].to_numpy())
+        repeated = (codes >= 0) & (self._skus.contains_codes(codes) | pd.Series(codes).duplicated().to_numpy())
+        self.report.record(SKU_UNIQUE_RULE[0], repeated, chunk, offset)
+        self._skus.add_codes(codes)
+
+
+def validation_columns():
+    """list: Columnas que leen las reglas de validación."""
+    columns = [column for _, _, rule_columns, _ in RULES for column in rule_columns]
+    return list(dict.fromkeys(columns))
+
+
+def validate_frame(df, sample_rows=DEFAULT_SAMPLE_ROWS):
+    """
+    Valida un DataFrame en memoria.
+
+    Args:
+        df (pandas.DataFrame): Datos generados.
+        sample_rows (int): Filas de ejemplo por regla.
+
+    Returns:
+        ValidationReport: Resultado de la validación.
+    """
+    validator = DatasetValidator(sample_rows)
+    validator.update(df)
+    return validator.report
+
+
+def validate_file(file_path, chunksize=DEFAULT_CHUNK_SIZE, sample_rows=DEFAULT_SAMPLE_ROWS):
+    """
+    Valida un CSV generado leyéndolo por bloques.
+
+    Solo se leen las columnas que usan las reglas.
+
+    Args:
+        file_path (str): Ruta del archivo CSV.
+        chunksize (int): Filas leídas por bloque.
+        sample_rows (int): Filas de ejemplo por regla.
+
+    Returns:
+        ValidationReport: Resultado de la validación.
+    """
+    validator = DatasetValidator(sample_rows)
+    reader = pd.read_csv(
+        file_path,
+        usecols=validation_columns(),
+        dtype={"PRODUCT_SKU": str, "RELEASE_DATE": str, "DIMENSIONS_CM": str},
+        chunksize=chunksize,
+    )
+    for chunk in reader:
+        validator.update(chunk)
+    return validator.report
@@ -2,12 +2,19 @@
 Script para generar visualizaciones adicionales a partir de los datos de televisiones.
 """
 
+import argparse
 import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
 import os
 import numpy as np
 
+from data_generator_app.aggregates import ChartAggregates, compute_chart_aggregates
+from data_generator_app.render_cache import render_cached
+
+# Columnas cuyos recuentos necesitan las gráficas de este script
+COUNT_COLUMNS = ["DISPLAY_TECHNOLOGY", "BRAND", "RESOLUTION", "VOICE_ASSISTANT", "MANUFACTURE_YEAR"]
+
 # Crear directorio para gráficos si no existe
 def create_visualizations_dir():
     vis_dir = "visualizations"
@@ -15,22 +22,25 @@ def create_visualizations_dir():
         os.makedirs(vis_dir)
     return vis_dir
 
-# Cargar datos
-def load_data(file_path="television_data.csv"):
+# Calcular en una sola pasada los recuentos que necesitan las gráficas
+def load_aggregates(file_path="television_data.csv"):
     try:
-        return pd.read_csv(file_path)
+        return compute_chart_aggregates(file_path, ChartAggregates(value_count_columns=COUNT_COLUMNS))
     except Exception as e:
         print(f"Error al cargar datos CSV: {e}")
         try:
-            return pd.read_json(file_path)
+            # El JSON generado es un único array, así que se carga entero
+            aggregates = ChartAggregates(value_count_columns=COUNT_COLUMNS)
+            aggregates.update(pd.read_json(file_path)[COUNT_COLUMNS])
+            return aggregates
         except Exception as e:
             print(f"Error al cargar datos JSON: {e}")
             return None
 
 # Gráfico 1: Distribución tipo pastel (pie) de tecnologías de pantalla
-def plot_display_tech_pie(data, output_path):
+def plot_display_tech_pie(aggregates, output_path):
     plt.figure(figsize=(10, 8))
-    tech_counts = data["DISPLAY_TECHNOLOGY"].value_counts()
+    tech_counts = aggregates.counts("DISPLAY_TECHNOLOGY")
     
     # Resaltar las tecnologías más populares
     explode = [0.1 if i == tech_counts.index[0] else 0.05 if i == tech_counts.index[1] else 0 for i in tech_counts.index]
@@ -50,9 +60,9 @@ def plot_display_tech_pie(data, output_path):
     print(f"Gráfica guardada en {output_path}")
 
 # Gráfico 2: Distribución de marcas 
-def plot_brand_distribution(data, output_path):
+def plot_brand_distribution(aggregates, output_path):
     plt.figure(figsize=(12, 8))
-    brand_counts = data["BRAND"].value_counts()
+    brand_counts = aggregates.counts("BRAND")
     
     # Crear gráfico de barras horizontales
     ax = brand_counts.plot(kind='barh', color=plt.cm.plasma(np.linspace(0, 0.8, len(brand_counts))))
@@ -73,9 +83,9 @@ def plot_brand_distribution(data, output_path):
     print(f"Gráfica guardada en {output_path}")
 
 # Gráfico 3: Distribución de resoluciones
-def plot_resolution_pie(data, output_path):
+def plot_resolution_pie(aggregates, output_path):
     plt.figure(figsize=(10, 8))
-    resolution_counts = data["RESOLUTION"].value_counts()
+    resolution_counts = aggregates.counts("RESOLUTION")
     
     # Crear gráfico de pastel con formato de rosquilla (donut)
     _, ax = plt.subplots(figsize=(10, 8))
@@ -108,9 +118,9 @@ def plot_resolution_pie(data, output_path):
     print(f"Gráfica guardada en {output_path}")
 
 # Gráfico 4: Distribución de asistentes de voz
-def plot_voice_assistant_distribution(data, output_path):
+def plot_voice_assistant_distribution(aggregates, output_path):
     plt.figure(figsize=(12, 6))
-    voice_counts = data["VOICE_ASSISTANT"].value_counts()
+    voice_counts = aggregates.counts("VOICE_ASSISTANT")
     
     # Crear un gráfico de barras apiladas
     ax = voice_counts.plot(
@@ -135,11 +145,11 @@ def plot_voice_assistant_distribution(data, output_path):
     print(f"Gráfica guardada en {output_path}")
 
 # Gráfico 5: Distribución de TVs por año de fabricación (tendencia temporal)
-def plot_manufacture_year_trend(data, output_path):
+def plot_manufacture_year_trend(aggregates, output_path):
     plt.figure(figsize=(12, 6))
     
     # Agrupar por año de fabricación
-    year_counts = data["MANUFACTURE_YEAR"].value_counts().sort_index()
+    year_counts = aggregates.counts("MANUFACTURE_YEAR", sort_index=True)
     
     # Crear gráfico de línea con marcadores
     ax = year_counts.plot(
@@ -167,26 +177,40 @@ def plot_manufacture_year_trend(data, output_path):
     print(f"Gráfica guardada en {output_path}")
 
 def main():
+    parser = argparse.ArgumentParser(description='Visualizaciones adicionales de los datos de televisiones')
+    parser.add_argument('--workers', type=int, default=None, help='Procesos de renderizado')
+    parser.add_argument('--force', action='store_true', help='Volver a dibujar también las gráficas sin cambios')
+    args = parser.parse_args()
+    
     # Crear directorio
     vis_dir = create_visualizations_dir()
     
-    # Cargar datos (primero intenta CSV, luego JSON)
-    data = load_data("television_data.csv")
-    if data is None:
-        data = load_data("television_data.json")
-        if data is None:
-            print("No se pudo cargar los datos. Verifique que existe el archivo television_data.csv o television_data.json")
-            return
-    
-    # Imprimir información general
-    print(f"Total de registros cargados: {len(data)}")
+    # Datos de entrada (primero CSV, luego JSON)
+    input_path = next((path for path in ("television_data.csv", "television_data.json") if os.path.exists(path)), None)
+    if input_path is None:
+        print("No se pudo cargar los datos. Verifique que existe el archivo television_data.csv o television_data.json")
+        return
     
-    # Generar gráficas
-    plot_display_tech_pie(data, os.path.join(vis_dir, "display_tech_pie.png"))
-    plot_brand_distribution(data, os.path.join(vis_dir, "brand_distribution.png"))
-    plot_resolution_pie(data, os.path.join(vis_dir, "resolution_pie.png"))
-    plot_voice_assistant_distribution(data, os.path.join(vis_dir, "voice_assistant_distribution.png"))
-    plot_manufacture_year_trend(data, os.path.join(vis_dir, "manufacture_year_trend.png"))
+    # Cargar datos solo si alguna gráfica está desactualizada
+    def load():
+        aggregates = load_aggregates(input_path)
+        if aggregates is None:
+            print("No se pudo cargar los datos. Verifique que existe el archivo television_data.csv o television_data.json")
+        else:
+            # Imprimir información general
+            print(f"Total de registros cargados: {aggregates.total_records}")
+        return aggregates
+    
+    # Generar en paralelo las gráficas desactualizadas
+    result = render_cached([
+        (plot_display_tech_pie, os.path.join(vis_dir, "display_tech_pie.png")),
+        (plot_brand_distribution, os.path.join(vis_dir, "brand_distribution.png")),
+        (plot_resolution_pie, os.path.join(vis_dir, "resolution_pie.png")),
+        (plot_voice_assistant_distribution, os.path.join(vis_dir, "voice_assistant_distribution.png")),
+        (plot_manufacture_year_trend, os.path.join(vis_dir, "manufacture_year_trend.png")),
+    ], input_path, load, vis_dir, max_workers=args.workers, force=args.force)
+    if result is None:
+        return
     
     print("\nSe han generado todas las gráficas adicionales en el directorio 'visualizations'")
 
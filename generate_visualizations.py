@@ -2,12 +2,16 @@
 Script para generar visualizaciones a partir de los datos de televisiones.
 """
 
-import pandas as pd
+import argparse
 import matplotlib.pyplot as plt
 import seaborn as sns
 import os
 import numpy as np
 
+from data_generator_app.aggregates import ChartAggregates, compute_chart_aggregates
+from data_generator_app.render_cache import render_cached
+from data_generator_app.rendering import DEFAULT_MAX_SCATTER_POINTS
+
 # Crear directorio para gráficos si no existe
 def create_visualizations_dir():
     vis_dir = "visualizations"
@@ -15,18 +19,31 @@ def create_visualizations_dir():
         os.makedirs(vis_dir)
     return vis_dir
 
-# Cargar datos
-def load_data(file_path="television_data.csv"):
+# Calcular en una sola pasada los agregados que necesitan las gráficas
+def load_aggregates(file_path="television_data.csv"):
+    aggregates = ChartAggregates(
+        value_count_columns=["SCREEN_SIZE_INCHES"],
+        price_by_brand=True,
+        tech_by_segment=True,
+        correlation=True,
+        scatter_sample=True,
+    )
     try:
-        return pd.read_csv(file_path)
+        return compute_chart_aggregates(file_path, aggregates)
     except Exception as e:
         print(f"Error al cargar datos: {e}")
         return None
 
 # Gráfica 1: Distribución de precios por marca
-def plot_price_by_brand(data, output_path):
+def plot_price_by_brand(aggregates, output_path):
+    stats = aggregates.price_box_stats()
     plt.figure(figsize=(14, 8))
-    sns.boxplot(x="BRAND", y="PRICE_USD", data=data, palette="viridis")
+    ax = plt.gca()
+    boxes = ax.bxp(stats, showfliers=False, patch_artist=True)
+    for box, color in zip(boxes["boxes"], sns.color_palette("viridis", len(stats))):
+        box.set_facecolor(color)
+    for median in boxes["medians"]:
+        median.set_color("black")
     plt.title("Distribución de Precios por Marca", fontsize=16)
     plt.xlabel("Marca", fontsize=14)
     plt.ylabel("Precio (USD)", fontsize=14)
@@ -38,9 +55,9 @@ def plot_price_by_brand(data, output_path):
     print(f"Gráfica guardada en {output_path}")
 
 # Gráfica 2: Distribución de tamaños de pantalla
-def plot_screen_size_distribution(data, output_path):
+def plot_screen_size_distribution(aggregates, output_path):
     plt.figure(figsize=(12, 6))
-    screen_size_counts = data["SCREEN_SIZE_INCHES"].value_counts().sort_index()
+    screen_size_counts = aggregates.counts("SCREEN_SIZE_INCHES", sort_index=True)
     ax = screen_size_counts.plot(kind="bar", color="skyblue")
     
     # Añadir etiquetas de datos
@@ -57,17 +74,25 @@ def plot_screen_size_distribution(data, output_path):
     print(f"Gráfica guardada en {output_path}")
 
 # Gráfica 3: Relación entre precio y calificación
-def plot_price_vs_rating(data, output_path):
+def plot_price_vs_rating(aggregates, output_path, max_points=DEFAULT_MAX_SCATTER_POINTS, large_mode="hexbin"):
     plt.figure(figsize=(10, 6))
-    sns.scatterplot(
-        x="PRICE_USD", 
-        y="QUALITY_RATING", 
-        hue="DISPLAY_TECHNOLOGY", 
-        size="SCREEN_SIZE_INCHES",
-        sizes=(20, 200),
-        alpha=0.7,
-        data=data
-    )
+    if aggregates.total_records > max_points and large_mode == "hexbin":
+        # Con muchos puntos se dibuja la densidad de todas las filas
+        prices, ratings, counts = aggregates.price_rating_histogram()
+        plt.hexbin(prices, ratings, C=counts, reduce_C_function=np.sum,
+                   gridsize=(60, 8), bins='log', cmap="viridis")
+        plt.colorbar(label="Número de Televisores")
+    else:
+        # Muestra estratificada por tecnología: son todas las filas si hay pocas
+        sns.scatterplot(
+            x="PRICE_USD", 
+            y="QUALITY_RATING", 
+            hue="DISPLAY_TECHNOLOGY", 
+            size="SCREEN_SIZE_INCHES",
+            sizes=(20, 200),
+            alpha=0.7,
+            data=aggregates.scatter_points(max_points)
+        )
     plt.title("Relación entre Precio y Calificación de Calidad", fontsize=16)
     plt.xlabel("Precio (USD)", fontsize=14)
     plt.ylabel("Calificación de Calidad", fontsize=14)
@@ -78,14 +103,9 @@ def plot_price_vs_rating(data, output_path):
     print(f"Gráfica guardada en {output_path}")
 
 # Gráfica 4: Tecnologías de pantalla por segmento de precio
-def plot_display_tech_by_price_segment(data, output_path):
-    # Crear segmentos de precio
-    price_bins = [0, 500, 1000, 2000, 5000, 20000]
-    price_labels = ['Económico', 'Básico', 'Medio', 'Premium', 'Gama Alta']
-    data['PRICE_SEGMENT'] = pd.cut(data['PRICE_USD'], bins=price_bins, labels=price_labels)
-    
-    # Crear tabla cruzada
-    tech_segment = pd.crosstab(data['DISPLAY_TECHNOLOGY'], data['PRICE_SEGMENT'])
+def plot_display_tech_by_price_segment(aggregates, output_path):
+    # Tabla cruzada de tecnología por segmento de precio ya acumulada
+    tech_segment = aggregates.crosstab()
     
     # Graficar
     plt.figure(figsize=(12, 8))
@@ -101,17 +121,9 @@ def plot_display_tech_by_price_segment(data, output_path):
     print(f"Gráfica guardada en {output_path}")
 
 # Gráfica 5: Mapa de calor de correlación entre variables numéricas
-def plot_correlation_heatmap(data, output_path):
-    # Seleccionar variables numéricas
-    numeric_cols = ['PRICE_USD', 'QUALITY_RATING', 'SCREEN_SIZE_INCHES', 
-                    'REFRESH_RATE_HZ', 'HDMI_PORTS', 'USB_PORTS', 
-                    'AUDIO_OUTPUT_WATTS', 'CUSTOMER_RATING', 'WEIGHT_KG',
-                    'POWER_CONSUMPTION_WATTS', 'INPUT_LAG_MS']
-    
-    numeric_data = data[numeric_cols]
-    
-    # Calcular matriz de correlación
-    corr_matrix = numeric_data.corr()
+def plot_correlation_heatmap(aggregates, output_path):
+    # Matriz de correlación a partir de las sumas acumuladas
+    corr_matrix = aggregates.correlation_matrix()
     
     # Graficar
     plt.figure(figsize=(12, 10))
@@ -128,24 +140,50 @@ def plot_correlation_heatmap(data, output_path):
     print(f"Gráfica guardada en {output_path}")
 
 def main():
+    parser = argparse.ArgumentParser(description='Visualizaciones de los datos de televisiones')
+    parser.add_argument('--input', type=str, default='television_data.csv', help='CSV de entrada')
+    parser.add_argument(
+        '--max-scatter-points', 
+        type=int, 
+        default=DEFAULT_MAX_SCATTER_POINTS, 
+        help='Puntos a partir de los cuales no se dibuja la dispersión completa'
+    )
+    parser.add_argument(
+        '--scatter-mode', 
+        choices=['hexbin', 'sample'], 
+        default='hexbin', 
+        help='Gráfica usada por encima de --max-scatter-points'
+    )
+    parser.add_argument('--workers', type=int, default=None, help='Procesos de renderizado')
+    parser.add_argument('--force', action='store_true', help='Volver a dibujar también las gráficas sin cambios')
+    args = parser.parse_args()
+    
     # Crear directorio
     vis_dir = create_visualizations_dir()
-    
-    # Cargar datos
-    data = load_data()
-    if data is None:
+    if not os.path.exists(args.input):
+        print(f"Error al cargar datos: no existe {args.input}")
         return
     
-    # Imprimir información general
-    print(f"Total de registros: {len(data)}")
-    print(f"Columnas disponibles: {data.columns.tolist()}")
+    # Cargar datos solo si alguna gráfica está desactualizada
+    def load():
+        aggregates = load_aggregates(args.input)
+        if aggregates is not None:
+            # Imprimir información general
+            print(f"Total de registros: {aggregates.total_records}")
+            print(f"Columnas utilizadas: {aggregates.columns}")
+        return aggregates
     
-    # Generar gráficas
-    plot_price_by_brand(data, os.path.join(vis_dir, "price_by_brand.png"))
-    plot_screen_size_distribution(data, os.path.join(vis_dir, "screen_size_distribution.png"))
-    plot_price_vs_rating(data, os.path.join(vis_dir, "price_vs_rating.png"))
-    plot_display_tech_by_price_segment(data, os.path.join(vis_dir, "tech_by_price_segment.png"))
-    plot_correlation_heatmap(data, os.path.join(vis_dir, "correlation_heatmap.png"))
+    # Generar en paralelo las gráficas desactualizadas
+    scatter_options = {"max_points": args.max_scatter_points, "large_mode": args.scatter_mode}
+    result = render_cached([
+        (plot_price_by_brand, os.path.join(vis_dir, "price_by_brand.png")),
+        (plot_screen_size_distribution, os.path.join(vis_dir, "screen_size_distribution.png")),
+        (plot_price_vs_rating, os.path.join(vis_dir, "price_vs_rating.png"), scatter_options),
+        (plot_display_tech_by_price_segment, os.path.join(vis_dir, "tech_by_price_segment.png")),
+        (plot_correlation_heatmap, os.path.join(vis_dir, "correlation_heatmap.png")),
+    ], args.input, load, vis_dir, max_workers=args.workers, force=args.force)
+    if result is None:
+        return
     
     print("\nSe han generado todas las gráficas en el directorio 'visualizations'")
 
@@ -0,0 +1,45 @@
+"""
+Script para buscar un SKU en un archivo generado usando su índice de desplazamientos.
+"""
+
+import argparse
+import sys
+
+from data_generator_app.offset_index import index_path, lookup_rows
+
+
+def main():
+    """Función principal del programa."""
+    parser = argparse.ArgumentParser(description='Búsqueda de SKUs en datos de televisiones generados')
+    parser.add_argument('input', type=str, help='Archivo CSV o JSON Lines generado con --sku-index')
+    parser.add_argument('skus', type=str, nargs='+', help='SKUs a buscar')
+    parser.add_argument(
+        '--index',
+        type=str,
+        default=None,
+        help='Índice del archivo (por defecto: <input>.skuidx.npy)'
+    )
+    args = parser.parse_args()
+
+    try:
+        with open(args.input, 'rb') as f:
+            header = f.readline().rstrip(b'\n').decode('utf-8')
+        found = {sku: lookup_rows(args.input, sku, args.index or index_path(args.input)) for sku in args.skus}
+    except (ValueError, OSError) as e:
+        parser.error(str(e))
+
+    # La cabecera del CSV acompaña a las filas encontradas
+    if not header.startswith('{') and any(found.values()):
+        print(header)
+    for sku, lines in found.items():
+        for line in lines:
+            print(line)
+        if not lines:
+            print(f"No se ha encontrado el SKU {sku}", file=sys.stderr)
+
+    if not all(found.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,14 +3,283 @@ Script principal para generar datos de televisiones.
 """
 
 import argparse
+import json
+import os
+import random
+import sys
+from functools import partial
+
+import numpy as np
 import pandas as pd
 
+from data_generator_app.binary_format import write_binary_stream
+from data_generator_app.conditions import parse_where
+from data_generator_app.constants import COLUMN_NAMES
+from data_generator_app.csv_encoder import encode_csv
 from data_generator_app.data_generator import generate_television_data
+from data_generator_app.external_sort import DEFAULT_SORT_WORKERS, external_sort, parse_sort_by, sort_frame
+from data_generator_app.faults import FaultInjector
+from data_generator_app.fingerprint import DEFAULT_FINGERPRINT_ROWS, ChunkFingerprinter
+from data_generator_app.offset_index import SkuOffsetIndexWriter, index_path
+from data_generator_app.memory import check_fits, chunk_size_for_budget, parse_memory
+from data_generator_app.pacing import (
+    DEFAULT_PREFETCH_CHUNKS, PACED_FORMATS, emit_paced, open_sink, paced_chunks, parse_rate
+)
+from data_generator_app.price_history import DEFAULT_LIFETIME_DAYS, write_price_history
+from data_generator_app.relational import write_star_schema
+from data_generator_app.sharding import shard_bounds, shard_path
+from data_generator_app.sku import SkuIndex, SkuRegistry
+from data_generator_app.streaming import (
+    DEFAULT_STREAM_CHUNK_SIZE, STREAM_FORMATS, iter_television_chunks, write_arrow_stream, write_csv_stream
+)
 
 
+def load_weights(spec):
+    """
+    Carga los pesos de las columnas categóricas.
+    
+    Args:
+        spec (str): ``realistic`` o ruta de un JSON con un diccionario
+            columna -> {valor: peso} o columna -> [pesos].
+        
+    Returns:
+        dict or str: Pesos para generate_television_data.
+    """
+    if spec is None or spec == 'realistic':
+        return spec
+    with open(spec, encoding='utf-8') as f:
+        return json.load(f)
 
-def main():
-    """Función principal del programa."""
+
+def generate_with_registry(rows, registry=None, weights=None, engine='legacy', seed=None, start=0, where=None):
+    """
+    Genera filas reservando sus SKUs en un registro compartido.
+    
+    Args:
+        rows (int): Número de filas a generar.
+        registry (SkuRegistry, optional): Registro persistente de SKUs.
+        weights (dict or str, optional): Pesos de las columnas categóricas.
+        engine (str): Motor de generación ('legacy' o 'vectorized').
+        seed (int, optional): Semilla del motor vectorizado.
+        start (int): Índice global de la primera fila con el motor vectorizado.
+        where (dict, optional): Condiciones de generación del motor vectorizado.
+        
+    Returns:
+        pd.DataFrame: DataFrame con los datos generados.
+    """
+    # Los SKUs se reservan por lotes con un bloqueo breve, sin bloquear a
+    # otros procesos durante toda la generación
+    return generate_television_data(
+        rows, existing_skus=registry, weights=weights, engine=engine, seed=seed, start=start, where=where
+    )
+
+
+def append_to_csv(file_path, rows, registry=None, weights=None, engine='legacy', where=None):
+    """
+    Añade filas nuevas a un CSV existente sin repetir sus SKUs.
+    
+    Args:
+        file_path (str): Ruta del CSV generado previamente.
+        rows (int): Número de filas a añadir.
+        registry (SkuRegistry, optional): Registro persistente de SKUs en el
+            que se registran también los SKUs del archivo.
+        weights (dict or str, optional): Pesos de las columnas categóricas.
+        engine (str): Motor de generación ('legacy' o 'vectorized').
+        where (dict, optional): Condiciones de generación del motor vectorizado.
+        
+    Returns:
+        pd.DataFrame: Filas añadidas.
+    """
+    columns = pd.read_csv(file_path, nrows=0).columns.tolist()
+    if columns != COLUMN_NAMES:
+        raise ValueError(f"Las columnas de {file_path} no coinciden con las del generador")
+    
+    # Solo se lee la columna de SKUs y se guarda como mapa de bits
+    if registry is None:
+        existing_skus = SkuIndex.from_csv(file_path)
+    else:
+        existing_skus = registry
+        registry.add_csv(file_path)
+    df = generate_television_data(rows, existing_skus=existing_skus, weights=weights, engine=engine, where=where)
+    with open(file_path, 'ab') as f:
+        f.write(encode_csv(df, header=False))
+    return df
+
+
+def stream_to_output(output, format, rows, chunk_size=DEFAULT_STREAM_CHUNK_SIZE, registry=None, weights=None,
+                     engine='legacy', seed=None, start=0, faults=None, where=None, sort_by=None, sort_tmp_dir=None,
+                     sku_index=None, fingerprint=None):
+    """
+    Genera y escribe los datos bloque a bloque.
+    
+    Args:
+        output (str): Ruta de salida o ``-`` para la salida estándar.
+        format (str): Formato de salida ('csv', 'arrow' o 'binary').
+        rows (int): Número de filas a generar.
+        chunk_size (int): Filas por bloque.
+        registry (SkuRegistry, optional): Registro persistente de SKUs.
+        weights (dict or str, optional): Pesos de las columnas categóricas.
+        engine (str): Motor de generación ('legacy' o 'vectorized').
+        seed (int, optional): Semilla del motor vectorizado.
+        start (int): Índice global de la primera fila con el motor vectorizado.
+        faults (FaultInjector, optional): Etapa que corrompe los bloques antes de escribirlos.
+        where (dict, optional): Condiciones de generación del motor vectorizado.
+        sort_by (list, optional): Columnas por las que ordenar la salida con
+            una ordenación externa.
+        sort_tmp_dir (str, optional): Directorio de las runs de la ordenación.
+        sku_index (SkuOffsetIndexWriter, optional): Índice de desplazamientos
+            de las filas del CSV.
+        fingerprint (ChunkFingerprinter, optional): Huellas de los bloques escritos.
+        
+    Returns:
+        int: Número de filas escritas.
+    """
+    writer = {'arrow': write_arrow_stream, 'binary': write_binary_stream}.get(format, write_csv_stream)
+    if sku_index is not None:
+        writer = partial(write_csv_stream, index=sku_index)
+    if output == '-':
+        sink = sys.stdout.buffer
+    else:
+        sink = output
+    
+    # Con registro, los SKUs de cada bloque se reservan al generarlo
+    chunks = iter_television_chunks(
+        rows, chunk_size, existing_skus=registry, weights=weights, engine=engine, seed=seed, start=start,
+        where=where
+    )
+    if sort_by:
+        chunks = external_sort(chunks, sort_by, chunk_size, tmp_dir=sort_tmp_dir)
+    if faults is not None:
+        chunks = faults.apply(chunks)
+    if fingerprint is not None:
+        chunks = fingerprint.apply(chunks)
+    written = writer(chunks, sink)
+    if output == '-':
+        sink.flush()
+    return written
+
+
+def emit_at_rate(output, format, rows, profile, chunk_size=DEFAULT_STREAM_CHUNK_SIZE, registry=None, weights=None,
+                 engine='legacy', seed=None, start=0, duration=None, faults=None, where=None, sort_by=None,
+                 sort_tmp_dir=None, sku_index=None, fingerprint=None):
+    """
+    Genera los datos por adelantado y los emite al ritmo de un perfil.
+    
+    Args:
+        output (str): Ruta de archivo o FIFO, ``-`` para la salida estándar o
+            ``tcp://HOST:PUERTO``.
+        format (str): Formato de salida ('csv' o 'json', como JSON Lines).
+        rows (int): Número de filas a emitir como máximo.
+        profile: Perfil de ritmo (ver parse_rate).
+        chunk_size (int): Filas por bloque generado.
+        registry (SkuRegistry, optional): Registro persistente de SKUs.
+        weights (dict or str, optional): Pesos de las columnas categóricas.
+        engine (str): Motor de generación ('legacy' o 'vectorized').
+        seed (int, optional): Semilla del motor vectorizado.
+        start (int): Índice global de la primera fila con el motor vectorizado.
+        duration (float, optional): Segundos tras los que se detiene la emisión.
+        faults (FaultInjector, optional): Etapa que corrompe los bloques antes de emitirlos.
+        where (dict, optional): Condiciones de generación del motor vectorizado.
+        sort_by (list, optional): Columnas por las que ordenar la emisión.
+        sort_tmp_dir (str, optional): Directorio de las runs de la ordenación.
+        sku_index (SkuOffsetIndexWriter, optional): Índice de desplazamientos
+            de las filas codificadas.
+        fingerprint (ChunkFingerprinter, optional): Huellas de los bloques emitidos.
+        
+    Returns:
+        PacingReport: Informe con el ritmo conseguido y el jitter.
+    """
+    sink = open_sink(output)
+    try:
+        chunks = iter_television_chunks(
+            rows, chunk_size, existing_skus=registry, weights=weights, engine=engine, seed=seed, start=start,
+            where=where
+        )
+        if sort_by:
+            chunks = external_sort(chunks, sort_by, chunk_size, tmp_dir=sort_tmp_dir)
+        if faults is not None:
+            chunks = faults.apply(chunks)
+        if fingerprint is not None:
+            chunks = fingerprint.apply(chunks)
+        return emit_paced(paced_chunks(chunks, format, index=sku_index), sink, profile, duration=duration)
+    finally:
+        if output != '-':
+            sink.close()
+
+
+def write_fault_manifest(faults, path, log, max_row=None):
+    """
+    Escribe el manifiesto de fallos e informa de cuántas celdas se corrompieron.
+    
+    Args:
+        faults (FaultInjector): Etapa de inyección ya aplicada.
+        path (str): Ruta del manifiesto.
+        log (file): Destino de los mensajes.
+        max_row (int, optional): Primera fila global que no se llegó a escribir.
+    """
+    written = faults.write_manifest(path, max_row=max_row)
+    print(f"Se han corrompido {written} celdas (semilla {faults.seed}); manifiesto en {path}", file=log)
+
+
+def write_sku_index(sku_index, log, rows=None):
+    """
+    Guarda el índice de desplazamientos de los SKUs e informa de su ruta.
+    
+    Args:
+        sku_index (SkuOffsetIndexWriter): Índice con las filas escritas.
+        log (file): Destino de los mensajes.
+        rows (int, optional): Filas que llegaron a escribirse.
+    """
+    entries = sku_index.close(rows=rows)
+    print(f"Índice de {entries} SKUs en {sku_index.path}", file=log)
+
+
+def write_fingerprint(fingerprint, args, log):
+    """
+    Escribe el manifiesto de huellas con las opciones de la ejecución.
+    
+    Args:
+        fingerprint (ChunkFingerprinter): Huellas de los datos escritos.
+        args (argparse.Namespace): Argumentos del programa.
+        log (file): Destino de los mensajes.
+    """
+    options = ('rows', 'seed', 'engine', 'format', 'weights', 'where', 'faults', 'sort_by', 'num_shards', 'shard_index')
+    manifest = fingerprint.write(args.fingerprint, {option: getattr(args, option) for option in options})
+    print(f"Huella {manifest['digest']} de {manifest['rows']} filas en {args.fingerprint}", file=log)
+
+
+def plan_chunk_size(args, rows, format, weights, where, log, in_flight=1):
+    """
+    Elige el tamaño de bloque: el de --chunk-size o el que cabe en --max-memory.
+    
+    Args:
+        args (argparse.Namespace): Argumentos del programa.
+        rows (int): Filas a generar.
+        format (str): Formato de salida.
+        weights (dict or str, optional): Pesos de las columnas categóricas.
+        where (dict, optional): Condiciones de generación.
+        log (file): Destino de los mensajes.
+        in_flight (int): Bloques vivos a la vez.
+        
+    Returns:
+        int: Filas por bloque.
+    """
+    if not args.max_memory:
+        return args.chunk_size
+    chunk_size = chunk_size_for_budget(
+        args.max_memory, rows, format, args.engine, weights, where, in_flight=in_flight
+    )
+    print(f"Bloques de {chunk_size} filas para no superar --max-memory {args.max_memory}", file=log)
+    return chunk_size
+
+
+def build_parser():
+    """
+    Crea el analizador de argumentos del programa.
+    
+    Returns:
+        argparse.ArgumentParser: Analizador con todas las opciones.
+    """
     # Configurar el analizador de argumentos
     parser = argparse.ArgumentParser(description='Generador de datos de televisiones')
     parser.add_argument(
@@ -23,39 +292,489 @@ def main():
         '--output', 
         type=str, 
         default='television_data.csv', 
-        help='Nombre del archivo de salida (por defecto: television_data.csv)'
+        help="Nombre del archivo de salida o '-' para la salida estándar (por defecto: television_data.csv)"
     )
     parser.add_argument(
         '--format', 
         type=str, 
-        choices=['csv', 'json', 'excel'], 
+        choices=['csv', 'json', 'excel', 'arrow', 'binary'], 
         default='json', 
         help='Formato del archivo de salida (por defecto: csv)'
     )
+    parser.add_argument(
+        '--chunk-size', 
+        type=int, 
+        default=DEFAULT_STREAM_CHUNK_SIZE, 
+        help=f'Filas por bloque en la salida en streaming (por defecto: {DEFAULT_STREAM_CHUNK_SIZE})'
+    )
+    parser.add_argument(
+        '--append', 
+        type=str, 
+        default=None, 
+        help='CSV existente al que añadir --rows filas con SKUs no repetidos'
+    )
+    parser.add_argument(
+        '--sku-registry', 
+        type=str, 
+        default=None, 
+        help='Registro de SKUs compartido entre ejecuciones para evitar colisiones'
+    )
+    parser.add_argument(
+        '--weights', 
+        type=str, 
+        default=None, 
+        help="Pesos de las columnas categóricas: 'realistic' o un archivo JSON (por defecto: uniformes)"
+    )
+    parser.add_argument(
+        '--engine', 
+        type=str, 
+        choices=['legacy', 'vectorized'], 
+        default='legacy', 
+        help='Motor de generación: fila a fila o vectorizado con NumPy (por defecto: legacy)'
+    )
+    parser.add_argument(
+        '--orders', 
+        type=int, 
+        default=0, 
+        help='Número de pedidos a generar junto con las tablas de proveedores y almacenes (por defecto: 0)'
+    )
+    parser.add_argument(
+        '--tables-dir', 
+        type=str, 
+        default='star_schema', 
+        help='Directorio de las tablas de proveedores, almacenes y pedidos (por defecto: star_schema)'
+    )
+    parser.add_argument(
+        '--price-history', 
+        type=str, 
+        default=None, 
+        help='Directorio en el que escribir el historial diario de precios, particionado por mes'
+    )
+    parser.add_argument(
+        '--price-history-days', 
+        type=int, 
+        default=DEFAULT_LIFETIME_DAYS, 
+        help=f'Días de historial de precios por SKU (por defecto: {DEFAULT_LIFETIME_DAYS})'
+    )
+    parser.add_argument(
+        '--rate', 
+        type=str, 
+        default=None, 
+        help="Emite las filas a ritmo controlado: filas/s constantes, 'ramp:INICIO:FIN:SEGUNDOS' o "
+             "'burst:BASE:PICO:PERIODO:DURACIÓN'"
+    )
+    parser.add_argument(
+        '--duration', 
+        type=float, 
+        default=None, 
+        help='Segundos tras los que se detiene la emisión con --rate (por defecto: hasta emitir --rows filas)'
+    )
+    parser.add_argument(
+        '--where', 
+        type=str, 
+        default=None, 
+        help="Genera solo filas que cumplen condiciones separadas por ';', p. ej. "
+             "'DISPLAY_TECHNOLOGY=OLED;BRAND=Samsung,LG,Sony;PRICE_USD>=2000' (requiere --engine vectorized)"
+    )
+    parser.add_argument(
+        '--faults', 
+        type=str, 
+        default=None, 
+        help="Fallos de calidad a inyectar: 'default', un archivo JSON o 'COLUMNA:tipo=tasa,...' "
+             "(tipos: null, duplicate_sku, malformed_dimensions, out_of_range, typo)"
+    )
+    parser.add_argument(
+        '--fault-manifest', 
+        type=str, 
+        default=None, 
+        help='CSV con las celdas corrompidas por --faults (por defecto: <salida>.faults.csv)'
+    )
+    parser.add_argument(
+        '--max-memory', 
+        type=str, 
+        default=None, 
+        help='Memoria máxima del proceso (p. ej. 2GB); el tamaño de bloque se calcula midiendo el coste por fila '
+             'del formato y sustituye a --chunk-size'
+    )
+    parser.add_argument(
+        '--sort-by', 
+        type=str, 
+        default=None, 
+        help="Columnas por las que ordenar la salida, separadas por comas (p. ej. 'BRAND,PRICE_USD'); los formatos "
+             "en streaming usan una ordenación externa con memoria acotada"
+    )
+    parser.add_argument(
+        '--sort-tmp-dir', 
+        type=str, 
+        default=None, 
+        help='Directorio de los archivos temporales de --sort-by (por defecto: el del sistema)'
+    )
+    parser.add_argument(
+        '--sku-index', 
+        action='store_true', 
+        help='Escribe junto al CSV o JSON Lines un índice <salida>.skuidx.npy con el byte de cada SKU '
+             '(ver lookup_sku.py)'
+    )
+    parser.add_argument(
+        '--fingerprint', 
+        type=str, 
+        default=None, 
+        help='Manifiesto JSON con un hash por bloque y columna de los datos escritos (ver compare_fingerprints.py)'
+    )
+    parser.add_argument(
+        '--fingerprint-rows', 
+        type=int, 
+        default=DEFAULT_FINGERPRINT_ROWS, 
+        help=f'Filas por bloque de --fingerprint (por defecto: {DEFAULT_FINGERPRINT_ROWS})'
+    )
+    parser.add_argument(
+        '--seed', 
+        type=int, 
+        default=None, 
+        help='Semilla para reproducir la generación (por defecto: aleatoria)'
+    )
+    parser.add_argument(
+        '--num-shards', 
+        type=int, 
+        default=1, 
+        help='Número de fragmentos en que se reparte el conjunto entre varias ejecuciones (por defecto: 1)'
+    )
+    parser.add_argument(
+        '--shard-index', 
+        type=int, 
+        default=0, 
+        help='Fragmento que genera esta ejecución, de 0 a --num-shards - 1 (por defecto: 0)'
+    )
+    return parser
+
+
+def streams_output(args):
+    """
+    Indica si la salida se escribe por bloques según se genera.
     
-    # Analizar argumentos
-    args = parser.parse_args()
+    Los formatos en streaming escriben cada bloque según se genera; con
+    --max-memory o --sort-by el CSV también se escribe por bloques si no hacen
+    falta tablas derivadas.
+    
+    Args:
+        args (argparse.Namespace): Argumentos del programa.
+        
+    Returns:
+        bool: True si la salida se escribe en streaming.
+    """
+    whole_catalog = args.orders > 0 or args.price_history
+    bounded_csv = (args.max_memory or args.sort_by) and args.format == 'csv' and not whole_catalog
+    stdout_stream = args.output == '-' and args.format in STREAM_FORMATS
+    return bool(args.format in ('arrow', 'binary') or stdout_stream or bounded_csv)
+
+
+def validate_args(args, parser):
+    """
+    Valida las combinaciones de opciones e interpreta sus valores.
+    
+    Los errores terminan el programa con ``parser.error``. Ajusta además
+    ``args.output`` al nombre del fragmento y ``args.fault_manifest`` a su
+    ruta por defecto.
+    
+    Args:
+        args (argparse.Namespace): Argumentos del programa.
+        parser (argparse.ArgumentParser): Analizador con el que informar de los errores.
+        
+    Returns:
+        dict: Opciones interpretadas: ``registry``, ``weights``, ``start``,
+        ``rows``, ``seed``, ``where``, ``sort_by``, ``faults``,
+        ``fingerprint`` y ``profile``.
+    """
+    registry = SkuRegistry(args.sku_registry) if args.sku_registry else None
+    weights = load_weights(args.weights)
+    
+    # Cada fragmento genera su rango de filas del conjunto completo
+    try:
+        start, stop = shard_bounds(args.rows, args.num_shards, args.shard_index)
+    except ValueError as e:
+        parser.error(str(e))
+    if args.num_shards > 1:
+        if args.seed is None or args.engine != 'vectorized':
+            parser.error('--num-shards necesita --seed y --engine vectorized')
+        if args.append or registry is not None or args.orders > 0:
+            parser.error('--num-shards no admite --append, --sku-registry ni --orders')
+        if args.output != '-' and not args.output.startswith('tcp://'):
+            args.output = shard_path(args.output, args.shard_index, args.num_shards)
+    
+    if args.max_memory:
+        try:
+            parse_memory(args.max_memory)
+        except ValueError as e:
+            parser.error(str(e))
+    
+    sort_by = None
+    if args.sort_by:
+        if args.append:
+            parser.error('--sort-by no admite --append')
+        try:
+            sort_by = parse_sort_by(args.sort_by)
+        except ValueError as e:
+            parser.error(str(e))
+    
+    # Las condiciones se validan antes de generar nada
+    where = None
+    if args.where:
+        if args.engine != 'vectorized':
+            parser.error('--where necesita --engine vectorized')
+        try:
+            where = parse_where(args.where)
+        except ValueError as e:
+            parser.error(str(e))
+    
+    # El motor vectorizado recibe la semilla; el motor fila a fila usa la de random
+    seed = args.seed if args.engine == 'vectorized' else None
+    if args.seed is not None and args.engine == 'legacy':
+        random.seed(args.seed)
+        np.random.seed(args.seed % 2 ** 32)
+    
+    # Los fallos se inyectan sobre los bloques generados y se registran en un manifiesto
+    faults = None
+    if args.faults:
+        if args.append or args.format == 'binary':
+            parser.error('--faults no admite --append ni el formato binary')
+        fault_seed = args.seed if args.seed is not None else random.getrandbits(64)
+        try:
+            faults = FaultInjector(args.faults, fault_seed, start=start)
+        except (ValueError, OSError) as e:
+            parser.error(str(e))
+        if args.fault_manifest is None:
+            local = args.output != '-' and not args.output.startswith('tcp://')
+            args.fault_manifest = f"{os.path.splitext(args.output)[0]}.faults.csv" if local else 'faults.csv'
+    
+    # El índice de SKUs guarda desplazamientos dentro de un archivo de texto
+    if args.sku_index:
+        if args.output == '-' or args.output.startswith('tcp://') or args.append:
+            parser.error('--sku-index necesita un archivo de salida y no admite --append')
+        if args.format != 'csv' and not (args.rate and args.format == 'json'):
+            parser.error('--sku-index solo admite CSV o JSON Lines (--format json con --rate)')
+    
+    # Las huellas se alinean con el índice global de fila para comparar fragmentos
+    fingerprint = None
+    if args.fingerprint:
+        if args.append or (args.rate and args.duration):
+            parser.error('--fingerprint no admite --append ni --duration')
+        try:
+            fingerprint = ChunkFingerprinter(args.fingerprint_rows, start=start)
+        except ValueError as e:
+            parser.error(str(e))
+    
+    profile = None
+    if args.rate:
+        if args.append or args.orders > 0 or args.price_history:
+            parser.error('--rate no admite --append, --orders ni --price-history')
+        if args.format not in PACED_FORMATS:
+            parser.error(f"--rate solo admite los formatos {', '.join(PACED_FORMATS)}")
+        try:
+            profile = parse_rate(args.rate)
+        except ValueError as e:
+            parser.error(str(e))
+    elif args.append:
+        if not args.append.endswith('.csv'):
+            parser.error('--append solo admite archivos CSV')
+    elif streams_output(args):
+        if args.orders > 0 or args.price_history:
+            parser.error('--orders y --price-history necesitan el catálogo completo y no admiten salida en streaming')
+    elif args.output == '-':
+        parser.error(f"--output - solo admite los formatos {', '.join(STREAM_FORMATS)}")
+    
+    return {
+        'registry': registry, 'weights': weights, 'start': start, 'rows': stop - start, 'seed': seed,
+        'where': where, 'sort_by': sort_by, 'faults': faults, 'fingerprint': fingerprint, 'profile': profile,
+    }
+
+
+def run_paced(args, parser, options):
+    """
+    Emite los datos a ritmo controlado (``--rate``).
+    
+    Args:
+        args (argparse.Namespace): Argumentos del programa.
+        parser (argparse.ArgumentParser): Analizador con el que informar de los errores.
+        options (dict): Opciones interpretadas por validate_args.
+    """
+    rows, start, profile = options['rows'], options['start'], options['profile']
+    faults, fingerprint = options['faults'], options['fingerprint']
+    log = sys.stderr if args.output == '-' else sys.stdout
+    print(f"Emitiendo hasta {rows} registros de datos de televisiones con ritmo {profile} en {args.output}...",
+          file=log)
+    try:
+        # Además del bloque en curso, la lectura anticipada retiene bloques codificados
+        in_flight = DEFAULT_PREFETCH_CHUNKS + 2 + (DEFAULT_SORT_WORKERS if options['sort_by'] else 0)
+        chunk_size = plan_chunk_size(
+            args, rows, args.format, options['weights'], options['where'], log, in_flight=in_flight
+        )
+        sku_index = SkuOffsetIndexWriter(index_path(args.output)) if args.sku_index else None
+        report = emit_at_rate(
+            args.output, args.format, rows, profile, chunk_size, registry=options['registry'],
+            weights=options['weights'], engine=args.engine, seed=options['seed'], start=start,
+            duration=args.duration, faults=faults, where=options['where'], sort_by=options['sort_by'],
+            sort_tmp_dir=args.sort_tmp_dir, sku_index=sku_index, fingerprint=fingerprint
+        )
+    except (ValueError, OSError) as e:
+        parser.error(str(e))
+    print(report.format(), file=log)
+    if fingerprint is not None:
+        write_fingerprint(fingerprint, args, log)
+    if sku_index is not None:
+        # Las filas codificadas por adelantado que no se emitieron no entran en el índice
+        write_sku_index(sku_index, log, rows=report.rows)
+    if faults is not None:
+        write_fault_manifest(faults, args.fault_manifest, log, max_row=start + report.rows)
+
+
+def run_streaming(args, parser, options):
+    """
+    Escribe los datos por bloques según se generan.
+    
+    Args:
+        args (argparse.Namespace): Argumentos del programa.
+        parser (argparse.ArgumentParser): Analizador con el que informar de los errores.
+        options (dict): Opciones interpretadas por validate_args.
+    """
+    rows, sort_by = options['rows'], options['sort_by']
+    faults, fingerprint = options['faults'], options['fingerprint']
+    output_file = args.output
+    extension = {'arrow': '.arrow', 'binary': '.bin', 'csv': '.csv'}.get(args.format)
+    if output_file != '-' and extension and not output_file.endswith(extension):
+        output_file = f"{output_file}{extension}"
+    # Con la salida estándar ocupada por los datos, los mensajes van a stderr
+    log = sys.stderr if output_file == '-' else sys.stdout
+    try:
+        # La ordenación externa retiene además los bloques que se están volcando y el lote de la mezcla
+        in_flight = DEFAULT_SORT_WORKERS + 2 if sort_by else 1
+        chunk_size = plan_chunk_size(
+            args, rows, args.format, options['weights'], options['where'], log, in_flight=in_flight
+        )
+        print(f"Generando {rows} registros de datos de televisiones en bloques de {chunk_size}...", file=log)
+        sku_index = SkuOffsetIndexWriter(index_path(output_file)) if args.sku_index else None
+        stream_to_output(
+            output_file, args.format, rows, chunk_size,
+            registry=options['registry'], weights=options['weights'], engine=args.engine, seed=options['seed'],
+            start=options['start'], faults=faults, where=options['where'], sort_by=sort_by,
+            sort_tmp_dir=args.sort_tmp_dir, sku_index=sku_index, fingerprint=fingerprint
+        )
+    except (ValueError, ImportError) as e:
+        parser.error(str(e))
+    destination = 'la salida estándar' if output_file == '-' else output_file
+    print(f"Se han generado exitosamente {rows} registros de datos de televisiones en {destination}", file=log)
+    if sku_index is not None:
+        write_sku_index(sku_index, log)
+    if fingerprint is not None:
+        write_fingerprint(fingerprint, args, log)
+    if faults is not None:
+        write_fault_manifest(faults, args.fault_manifest, log)
+
+
+def run_in_memory(args, parser, options):
+    """
+    Genera el catálogo completo en memoria, lo guarda y genera las tablas derivadas.
+    
+    Args:
+        args (argparse.Namespace): Argumentos del programa.
+        parser (argparse.ArgumentParser): Analizador con el que informar de los errores.
+        options (dict): Opciones interpretadas por validate_args.
+    """
+    rows = options['rows']
+    faults, fingerprint = options['faults'], options['fingerprint']
     
     # Generar datos
-    print(f"Generando {args.rows} registros de datos de televisiones...")
-    df = generate_television_data(args.rows)
+    print(f"Generando {rows} registros de datos de televisiones...")
+    try:
+        if args.max_memory:
+            # Sin streaming el catálogo completo tiene que caber en el presupuesto
+            check_fits(args.max_memory, rows, args.format, args.engine, options['weights'], options['where'])
+        df = generate_with_registry(
+            rows, registry=options['registry'], weights=options['weights'], engine=args.engine,
+            seed=options['seed'], start=options['start'], where=options['where']
+        )
+    except ValueError as e:
+        parser.error(str(e))
+    if options['sort_by']:
+        df = sort_frame(df, options['sort_by'])
+    
+    # Los fallos solo afectan al catálogo escrito; las tablas derivadas usan el original
+    output_df = faults.inject(df) if faults is not None else df
     
     # Mostrar una muestra de los datos
     print("\nMuestra de los datos generados:")
-    print(df.head(5))
+    print(output_df.head(5))
     
     # Guardar datos
     if args.format == 'csv':
         output_file = args.output if args.output.endswith('.csv') else f"{args.output}.csv"
-        df.to_csv(output_file, index=False)
+        sku_index = SkuOffsetIndexWriter(index_path(output_file)) if args.sku_index else None
+        write_csv_stream([output_df], output_file, index=sku_index)
+        if sku_index is not None:
+            write_sku_index(sku_index, sys.stdout)
     elif args.format == 'json':
         output_file = args.output if args.output.endswith('.json') else f"{args.output}.json"
-        df.to_json(output_file, orient='records', indent=4)
+        output_df.to_json(output_file, orient='records', indent=4)
     elif args.format == 'excel':
         output_file = args.output if args.output.endswith('.xlsx') else f"{args.output}.xlsx"
-        df.to_excel(output_file, index=False)
+        output_df.to_excel(output_file, index=False)
+    
+    print(f"\nSe han generado exitosamente {rows} registros de datos de televisiones y se han guardado en {output_file}")
+    if fingerprint is not None:
+        fingerprint.update(output_df)
+        write_fingerprint(fingerprint, args, sys.stdout)
+    if faults is not None:
+        write_fault_manifest(faults, args.fault_manifest, sys.stdout)
+    
+    # Generar el esquema en estrella a partir del catálogo
+    if args.orders > 0:
+        orders_seed = args.seed if args.seed is not None else random.getrandbits(64)
+        print(f"\nGenerando {args.orders} pedidos en {args.tables_dir} (semilla {orders_seed})...")
+        paths = write_star_schema(df, args.tables_dir, args.orders, seed=orders_seed)
+        print(f"Tablas generadas: {', '.join(paths.values())}")
+    
+    # Generar el historial de precios a partir del catálogo
+    if args.price_history:
+        history_seed = args.seed if args.seed is not None else random.getrandbits(64)
+        part_prefix = f"shard-{args.shard_index:05d}-part" if args.num_shards > 1 else 'part'
+        print(f"\nGenerando el historial de precios en {args.price_history} (semilla {history_seed})...")
+        try:
+            written = write_price_history(
+                df, args.price_history, history_seed, lifetime_days=args.price_history_days, part_prefix=part_prefix
+            )
+        except ValueError as e:
+            parser.error(str(e))
+        print(f"Se han escrito {written} filas de historial de precios")
+
+
+def main():
+    """Función principal del programa."""
+    parser = build_parser()
+    args = parser.parse_args()
+    options = validate_args(args, parser)
+    
+    # La emisión a ritmo controlado escribe cada fila cuando le toca
+    if args.rate:
+        run_paced(args, parser, options)
+        return
+    
+    if args.append:
+        print(f"Añadiendo {args.rows} registros a {args.append}...")
+        try:
+            if args.max_memory:
+                check_fits(args.max_memory, args.rows, 'csv', args.engine, options['weights'], options['where'])
+            append_to_csv(
+                args.append, args.rows, registry=options['registry'], weights=options['weights'],
+                engine=args.engine, where=options['where']
+            )
+        except ValueError as e:
+            parser.error(str(e))
+        print(f"\nSe han añadido exitosamente {args.rows} registros a {args.append}")
+        return
     
-    print(f"\nSe han generado exitosamente {args.rows} registros de datos de televisiones y se han guardado en {output_file}")
+    if streams_output(args):
+        run_streaming(args, parser, options)
+    else:
+        run_in_memory(args, parser, options)
 
 
 if __name__ == "__main__":
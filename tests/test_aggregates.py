@@ -0,0 +1,107 @@
+"""
+Tests para los agregados en streaming de las visualizaciones.
+"""
+
+import unittest
+import os
+import tempfile
+import numpy as np
+import pandas as pd
+
+from data_generator_app.aggregates import (
+    CORRELATION_COLUMNS, PRICE_SEGMENT_BINS, PRICE_SEGMENT_LABELS,
+    ChartAggregates, compute_chart_aggregates
+)
+from data_generator_app.data_generator import generate_television_data
+
+
+def _all_aggregates(**kwargs):
+    """Crea agregados con todas las opciones activadas."""
+    return ChartAggregates(
+        value_count_columns=["BRAND", "SCREEN_SIZE_INCHES"],
+        price_by_brand=True,
+        tech_by_segment=True,
+        correlation=True,
+        scatter_sample=True,
+        **kwargs
+    )
+
+
+class TestChartAggregates(unittest.TestCase):
+    """Pruebas de los agregados acumulados por bloques."""
+
+    def setUp(self):
+        self.df = generate_television_data(500)
+
+    def test_streaming_matches_in_memory(self):
+        """Prueba que la lectura por bloques coincide con pandas en memoria."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            csv_path = os.path.join(temp_dir, "data.csv")
+            self.df.to_csv(csv_path, index=False)
+            aggregates = compute_chart_aggregates(csv_path, _all_aggregates(), chunksize=64)
+
+        self.assertEqual(aggregates.total_records, 500)
+        self.assertEqual(aggregates.counts("BRAND").to_dict(), self.df["BRAND"].value_counts().to_dict())
+
+        pd.testing.assert_frame_equal(
+            aggregates.correlation_matrix(), self.df[CORRELATION_COLUMNS].corr(), check_exact=False
+        )
+
+        segments = pd.cut(self.df["PRICE_USD"], bins=PRICE_SEGMENT_BINS, labels=PRICE_SEGMENT_LABELS)
+        expected = pd.crosstab(self.df["DISPLAY_TECHNOLOGY"], segments)
+        crosstab = aggregates.crosstab()
+        for label in crosstab.columns:
+            np.testing.assert_array_equal(crosstab[label].to_numpy(), expected[label].to_numpy())
+
+        # Con pocos datos la muestra contiene todas las filas
+        self.assertEqual(len(aggregates.scatter_points()), 500)
+
+    def test_box_stats_close_to_exact_quantiles(self):
+        """Prueba que los cuartiles del histograma tienen resolución de 1 USD."""
+        aggregates = _all_aggregates()
+        aggregates.update(self.df)
+
+        for stats in aggregates.price_box_stats():
+            prices = self.df.loc[self.df["BRAND"] == stats["label"], "PRICE_USD"]
+            median = prices.quantile(0.5, interpolation="lower")
+            self.assertAlmostEqual(stats["med"], median, delta=1.0)
+            self.assertLessEqual(stats["whislo"], stats["q1"])
+            self.assertGreaterEqual(stats["whishi"], stats["q3"])
+
+    def test_merge_equals_single_pass(self):
+        """Prueba que fusionar agregados parciales equivale a una sola pasada."""
+        whole = _all_aggregates(sample_size=20)
+        whole.update(self.df)
+
+        merged = _all_aggregates(sample_size=20)
+        for part in np.array_split(np.arange(len(self.df)), 3):
+            partial = _all_aggregates(sample_size=20)
+            partial.update(self.df.iloc[part])
+            merged.merge(partial)
+
+        self.assertEqual(merged.total_records, whole.total_records)
+        pd.testing.assert_series_equal(merged.counts("SCREEN_SIZE_INCHES", sort_index=True),
+                                       whole.counts("SCREEN_SIZE_INCHES", sort_index=True))
+        pd.testing.assert_frame_equal(merged.crosstab(), whole.crosstab())
+        pd.testing.assert_frame_equal(merged.correlation_matrix(), whole.correlation_matrix())
+        self.assertEqual(merged.price_box_stats(), whole.price_box_stats())
+        np.testing.assert_array_equal(merged.price_rating_counts, whole.price_rating_counts)
+
+        # Muestra estratificada: 20 filas por cada tecnología presente
+        points = merged.scatter_points()
+        self.assertTrue((points["DISPLAY_TECHNOLOGY"].value_counts() == 20).all())
+        self.assertEqual(len(merged.scatter_points(max_points=70)), 70)
+
+    def test_price_rating_histogram_counts_all_rows(self):
+        """Prueba que el histograma 2D cubre todas las filas."""
+        aggregates = _all_aggregates(sample_size=5)
+        aggregates.update(self.df)
+        prices, ratings, counts = aggregates.price_rating_histogram()
+
+        self.assertEqual(counts.sum(), len(self.df))
+        self.assertTrue(set(ratings) <= set(self.df["QUALITY_RATING"]))
+        self.assertTrue((prices > 0).all())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+"""
+Tests para el formato binario de registros de ancho fijo.
+"""
+
+import unittest
+import os
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+from data_generator_app.binary_format import (
+    HEADER_ALIGNMENT, RECORD_DTYPE, decode_records, encode_records, open_records, read_header, read_rows,
+    write_binary_stream
+)
+from data_generator_app.data_generator import generate_television_data
+
+
+class TestBinaryFormat(unittest.TestCase):
+    """Pruebas de la codificación y del acceso aleatorio."""
+
+    def test_round_trip_both_engines(self):
+        """Prueba que codificar y decodificar devuelve los mismos datos."""
+        for engine in ("legacy", "vectorized"):
+            df = generate_television_data(2_000, engine=engine)
+            records = encode_records(df)
+            self.assertEqual(records.dtype, RECORD_DTYPE)
+            pd.testing.assert_frame_equal(decode_records(records), df)
+
+    def test_numpy_columns(self):
+        """Prueba que se aceptan los diccionarios de arrays del generador."""
+        columns = generate_television_data(100, engine="vectorized", return_type="numpy")
+        df = pd.DataFrame(columns)
+        pd.testing.assert_frame_equal(decode_records(encode_records(columns)), df)
+
+    def test_file_random_access(self):
+        """Prueba que el archivo se proyecta en memoria y se leen filas sueltas."""
+        df = generate_television_data(1_000, engine="vectorized")
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "tv.bin")
+            rows = write_binary_stream([df.iloc[:300], df.iloc[300:]], path)
+            self.assertEqual(rows, 1_000)
+
+            header = read_header(path)
+            self.assertEqual(header["offset"] % HEADER_ALIGNMENT, 0)
+            self.assertEqual(os.path.getsize(path), header["offset"] + 1_000 * RECORD_DTYPE.itemsize)
+
+            records = open_records(path)
+            self.assertIsInstance(records, np.memmap)
+            self.assertEqual(len(records), 1_000)
+            self.assertEqual(records["PRICE_USD"][777], df["PRICE_USD"].iloc[777])
+            indices = [999, 0, 512]
+            pd.testing.assert_frame_equal(read_rows(path, indices), df.iloc[indices].reset_index(drop=True))
+            del records
+
+    def test_invalid_values(self):
+        """Prueba que se rechazan valores que no caben en el registro."""
+        df = generate_television_data(10)
+        for column, value in (("BRAND", "Acme"), ("DIMENSIONS_CM", "big"), ("SUPPLIER_ID", "X1"),
+                              ("PRODUCT_SKU", "bad"), ("HDR_FORMATS", "HDR11")):
+            broken = df.copy()
+            broken.loc[3, column] = value
+            with self.assertRaises(ValueError):
+                encode_records(broken)
+
+    def test_not_binary_file(self):
+        """Prueba que se rechaza un archivo sin la cabecera del formato."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "tv.csv")
+            generate_television_data(5).to_csv(path, index=False)
+            with self.assertRaises(ValueError):
+                open_records(path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+"""
+Tests para la caché en disco de conjuntos generados.
+"""
+
+import unittest
+import io
+import os
+import tempfile
+from unittest import mock
+
+import pandas as pd
+
+from data_generator_app.cache import DatasetCache, schema_fingerprint
+from data_generator_app.data_generator import TelevisionDataGenerator
+
+
+class TestDatasetCache(unittest.TestCase):
+    """Pruebas de la caché de datos generados."""
+
+    def test_cache_hit_matches_generation(self):
+        """Prueba que un acierto devuelve los mismos datos y estado aleatorio."""
+        reference = TelevisionDataGenerator(seed=42)
+        expected_first = reference.generate_tv_data(num_records=30)
+        expected_second = reference.generate_tv_data(num_records=20)
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            # Primera pasada: fallos que llenan la caché
+            generator = TelevisionDataGenerator(seed=42, cache_dir=cache_dir)
+            generator.generate_tv_data(num_records=30)
+            generator.generate_tv_data(num_records=20)
+            self.assertEqual(len(os.listdir(cache_dir)), 2)
+            # El estado aleatorio se guarda como JSON, sin pickle
+            for entry in os.listdir(cache_dir):
+                self.assertIn("rng_state.json", os.listdir(os.path.join(cache_dir, entry)))
+                self.assertFalse(any(name.endswith(".pkl") for name in os.listdir(os.path.join(cache_dir, entry))))
+
+            # Segunda pasada: aciertos
+            generator = TelevisionDataGenerator(seed=42, cache_dir=cache_dir)
+            first = generator.generate_tv_data(num_records=30)
+            second = generator.generate_tv_data(num_records=20)
+
+        pd.testing.assert_frame_equal(first, expected_first)
+        pd.testing.assert_frame_equal(second, expected_second)
+
+    def test_cache_hit_is_writable(self):
+        """Prueba que un acierto se puede modificar como un fallo sin alterar la entrada guardada."""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            TelevisionDataGenerator(seed=1, cache_dir=cache_dir).generate_tv_data(num_records=100)
+            df = TelevisionDataGenerator(seed=1, cache_dir=cache_dir).generate_tv_data(num_records=100)
+            expected = df.copy()
+            df.loc[0, "STOCK_QUANTITY"] = 5
+            df.iloc[0, df.columns.get_loc("PRICE_USD")] = 1.0
+            df["PRICE_USD"] += 1
+            self.assertEqual(df.loc[0, "PRICE_USD"], 2.0)
+
+            again = TelevisionDataGenerator(seed=1, cache_dir=cache_dir).generate_tv_data(num_records=100)
+        pd.testing.assert_frame_equal(again, expected)
+
+    def test_fingerprint_covers_package(self):
+        """Prueba que la huella cambia con cualquier módulo del paquete, no solo con los generadores."""
+        expected = schema_fingerprint()
+        real_open = open
+
+        def edited_sku(path, *args, **kwargs):
+            f = real_open(path, *args, **kwargs)
+            if os.path.basename(path) != "sku.py":
+                return f
+            with f:
+                return io.BytesIO(f.read() + b"\n# cambio\n")
+
+        with mock.patch("builtins.open", edited_sku):
+            self.assertNotEqual(schema_fingerprint(), expected)
+        self.assertEqual(schema_fingerprint(), expected)
+
+    def test_unseeded_generator_skips_cache(self):
+        """Prueba que sin semilla no se usa la caché."""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            generator = TelevisionDataGenerator(cache_dir=cache_dir)
+            generator.generate_tv_data(num_records=5)
+            self.assertEqual(os.listdir(cache_dir), [])
+
+    def test_lru_eviction(self):
+        """Prueba que se expulsan las entradas usadas hace más tiempo."""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache = DatasetCache(cache_dir, max_bytes=1 << 40)
+            df = pd.DataFrame({"A": range(1000)})
+            for i, key in enumerate(["a", "b", "c"]):
+                cache.store(key, df)
+                os.utime(os.path.join(cache_dir, key), (i, i))
+
+            # Usar "a" la convierte en la entrada más reciente
+            self.assertIsNotNone(cache.load("a"))
+            entry_size = sum(e.stat().st_size for e in os.scandir(os.path.join(cache_dir, "a")))
+            cache.max_bytes = 2 * entry_size
+            cache.evict()
+
+            self.assertEqual(sorted(os.listdir(cache_dir)), ["a", "c"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+"""
+Tests para el motor vectorizado de generación.
+"""
+
+import unittest
+import random
+
+import numpy as np
+import pandas as pd
+
+from data_generator_app.columnar import generate_frame, sku_codes
+from data_generator_app.constants import COLUMN_NAMES
+from data_generator_app.data_generator import generate_television_data
+from data_generator_app.sku import SKU_SPACE, SkuIndex, decode_sku, decode_skus
+from data_generator_app.validation import validate_frame
+
+
+class TestColumnar(unittest.TestCase):
+    """Pruebas del motor vectorizado."""
+
+    def test_matches_generator_rules(self):
+        """Prueba que los datos cumplen las reglas y tipos del motor original."""
+        df = generate_television_data(20_000, engine="vectorized")
+        legacy = generate_television_data(50)
+
+        self.assertEqual(list(df.columns), COLUMN_NAMES)
+        pd.testing.assert_series_equal(df.dtypes, legacy.dtypes)
+        report = validate_frame(df)
+        self.assertTrue(report.ok, report.format())
+
+    def test_model_formats(self):
+        """Prueba los formatos de modelo de cada marca."""
+        df = generate_frame(20_000, seed=3)
+        models = df.set_index(["BRAND", "DISPLAY_TECHNOLOGY"]).sort_index()["MODEL"]
+
+        self.assertTrue(models.loc[("Samsung", "QLED")].str.fullmatch(r"QN\d{2}[A-Z]\d{2}[A-Z]{2}").all())
+        self.assertTrue(models.loc[("LG", "OLED")].str.fullmatch(r"OLED\d{2}[A-Z]\d{2}[A-Z]{2}").all())
+        self.assertTrue(models.loc["Sony"].str.fullmatch(r"XBR-\d{2}[A-Z]\d{2}[A-Z]{2}").all())
+        self.assertTrue(models.loc["TCL"].str.fullmatch(r"[A-Z]{2}-\d{6}").all())
+        self.assertTrue(df["SUPPLIER_ID"].str.fullmatch(r"SUP[1-9]\d{3}").all())
+
+    def test_chunking_does_not_change_rows(self):
+        """Prueba que generar por trozos da las mismas filas."""
+        whole = generate_frame(20_000, seed=11)
+        parts = pd.concat([
+            generate_frame(5000, seed=11),
+            generate_frame(9000, seed=11, start=5000),
+            generate_frame(6000, seed=11, start=14_000),
+        ], ignore_index=True)
+
+        pd.testing.assert_frame_equal(whole, parts)
+
+    def test_seed_from_random(self):
+        """Prueba que random.seed hace reproducible el motor vectorizado."""
+        random.seed(8)
+        first = generate_television_data(100, engine="vectorized")
+        random.seed(8)
+        second = generate_television_data(100, engine="vectorized")
+
+        pd.testing.assert_frame_equal(first, second)
+
+    def test_sku_permutation_and_existing_skus(self):
+        """Prueba que los SKUs son únicos y evitan los existentes."""
+        codes = sku_codes(np.arange(200_000), seed=1)
+        self.assertEqual(len(np.unique(codes)), 200_000)
+        self.assertTrue(((codes >= 0) & (codes < SKU_SPACE)).all())
+        self.assertEqual(decode_skus(codes[:3]).tolist(), [decode_sku(code) for code in codes[:3]])
+
+        taken = generate_frame(300, seed=2)
+        existing = set(taken["PRODUCT_SKU"])
+        df = generate_frame(1000, seed=2, existing_skus=existing)
+        self.assertFalse(df["PRODUCT_SKU"].isin(taken["PRODUCT_SKU"]).any())
+        self.assertTrue(df["PRODUCT_SKU"].is_unique)
+        self.assertEqual(len(existing), 1000 + 300)
+
+        index = SkuIndex()
+        index.add_codes(codes[:500])
+        df = generate_frame(800, seed=1, existing_skus=index)
+        self.assertTrue(df["PRODUCT_SKU"].is_unique)
+        self.assertEqual(len(index), 1300)
+
+    def test_invalid_engine(self):
+        """Prueba que se rechazan motores desconocidos."""
+        with self.assertRaises(ValueError):
+            generate_television_data(10, engine="turbo")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+"""
+Tests para la generación condicionada.
+"""
+
+import unittest
+
+import pandas as pd
+
+from data_generator_app.conditions import parse_where
+from data_generator_app.data_generator import generate_television_data
+
+
+WHERE = "DISPLAY_TECHNOLOGY=OLED;BRAND=Samsung,LG,Sony;PRICE_USD>=2000;MANUFACTURE_YEAR>=2022"
+
+
+class TestConditions(unittest.TestCase):
+    """Pruebas de las condiciones de generación."""
+
+    def test_rows_match_conditions(self):
+        """Prueba que todas las filas cumplen las condiciones sin descartar ninguna."""
+        df = generate_television_data(20_000, engine="vectorized", seed=1, weights="realistic", where=WHERE)
+        self.assertEqual(len(df), 20_000)
+        self.assertEqual(set(df["DISPLAY_TECHNOLOGY"]), {"OLED"})
+        self.assertEqual(set(df["BRAND"]), {"Samsung", "LG", "Sony"})
+        self.assertGreaterEqual(df["PRICE_USD"].min(), 2000)
+        self.assertGreaterEqual(df["MANUFACTURE_YEAR"].min(), 2022)
+        self.assertTrue(df["PRODUCT_SKU"].is_unique)
+
+    def test_matches_filtered_distribution(self):
+        """Prueba que la distribución coincide con la de generar todo y filtrar."""
+        where = {"PRICE_USD": (1500, 3000), "RESOLUTION": ["Full HD", "4K UHD"]}
+        full = generate_television_data(400_000, engine="vectorized", seed=2)
+        expected = full[full["PRICE_USD"].between(1500, 3000) & full["RESOLUTION"].isin(where["RESOLUTION"])]
+        df = generate_television_data(len(expected), engine="vectorized", seed=3, where=where)
+
+        self.assertTrue(df["PRICE_USD"].between(1500, 3000).all())
+        for column in ("BRAND", "DISPLAY_TECHNOLOGY", "SCREEN_SIZE_INCHES", "RESOLUTION"):
+            difference = df[column].value_counts(normalize=True) - expected[column].value_counts(normalize=True)
+            self.assertLess(difference.abs().max(), 0.02, column)
+        self.assertAlmostEqual(df["PRICE_USD"].mean() / expected["PRICE_USD"].mean(), 1, delta=0.01)
+
+    def test_independent_of_chunking(self):
+        """Prueba que las filas con condiciones no dependen del troceado."""
+        whole = generate_television_data(10_000, engine="vectorized", seed=4, where=WHERE)
+        parts = [generate_television_data(2_500, engine="vectorized", seed=4, start=start, where=WHERE)
+                 for start in range(0, 10_000, 2_500)]
+        pd.testing.assert_frame_equal(pd.concat(parts, ignore_index=True), whole)
+
+    def test_price_bounds_in_cents(self):
+        """Prueba que los límites de precio que no son céntimos exactos se cumplen tras redondear."""
+        self.assertEqual(parse_where({"PRICE_USD": (1234.561, 1234.579)}), {"PRICE_USD": (1234.57, 1234.57)})
+        self.assertEqual(parse_where("PRICE_USD>=0.29;PRICE_USD<=0.29"), {"PRICE_USD": (0.29, 0.29)})
+        with self.assertRaises(ValueError):
+            parse_where({"PRICE_USD": (1234.567, 1234.569)})
+
+        df = generate_television_data(2_000, engine="vectorized", seed=5, where={"PRICE_USD": (1234.561, 1234.579)})
+        self.assertEqual(set(df["PRICE_USD"]), {1234.57})
+        df = generate_television_data(20_000, engine="vectorized", seed=6, where={"PRICE_USD": (999.995, 1000.014)})
+        self.assertEqual(set(df["PRICE_USD"]), {1000.0, 1000.01})
+
+    def test_parse_where(self):
+        """Prueba el formato de texto y los errores de las condiciones."""
+        self.assertEqual(
+            parse_where("SCREEN_SIZE_INCHES>=75;PRICE_USD>=1000;PRICE_USD<=2000;COLOR=Negro"),
+            {"SCREEN_SIZE_INCHES": [75, 85, 98], "PRICE_USD": (1000, 2000), "COLOR": ["Negro"]},
+        )
+        for spec in ("BRAND=Acme", "MODEL=X", "PRICE_USD=100", "BRAND>=3", "PRICE_USD>=3000;PRICE_USD<=2000",
+                     "BRAND", "MANUFACTURE_YEAR>=2030", "BRAND=LG;BRAND=Sony"):
+            with self.assertRaises(ValueError):
+                parse_where(spec)
+        with self.assertRaises(ValueError):
+            generate_television_data(10, engine="vectorized", where={"PRICE_USD": (50_000, None)})
+        with self.assertRaises(ValueError):
+            generate_television_data(10, where=WHERE)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+"""
+Tests para el codificador CSV.
+"""
+
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from data_generator_app.csv_encoder import ENCODE_BATCH_ROWS, encode_csv
+from data_generator_app.data_generator import generate_television_data
+
+
+def pandas_csv(df, header=True):
+    """CSV de referencia escrito por pandas."""
+    return df.to_csv(index=False, header=header, lineterminator="\n").encode("utf-8")
+
+
+class TestCsvEncoder(unittest.TestCase):
+    """Pruebas de igualdad byte a byte con pandas."""
+
+    def test_matches_pandas_both_engines(self):
+        """Prueba que el CSV coincide con el de pandas para ambos motores."""
+        for engine in ("legacy", "vectorized"):
+            df = generate_television_data(ENCODE_BATCH_ROWS + 500 if engine == "vectorized" else 3_000,
+                                          engine=engine, weights="realistic")
+            self.assertEqual(encode_csv(df), pandas_csv(df))
+            self.assertEqual(encode_csv(df.iloc[:7], header=False), pandas_csv(df.iloc[:7], header=False))
+
+    def test_numpy_columns(self):
+        """Prueba que se aceptan diccionarios de arrays."""
+        columns = generate_television_data(50, engine="vectorized", return_type="numpy")
+        self.assertEqual(encode_csv(columns), pandas_csv(pd.DataFrame(columns)))
+
+    def test_fallback_values(self):
+        """Prueba los valores que no siguen el esquema del generador."""
+        df = pd.DataFrame({
+            "PRICE_USD": [1.0, 2.5, np.nan, -3.25, 1e13, 0.01, 0.1 + 0.2, -0.0],
+            "WEIGHT_KG": [1e16, 1e-5, 12.0, 3.14159, np.inf, 0.5, 7.25, 2.0],
+            "STOCK_QUANTITY": [1, -2, 3, 40, 5, 0, 7, 123456789],
+            "BRAND": ["LG", "Acme", "LG", None, "Sony", "LG", "LG", "TCL"],
+            "HDR_FORMATS": ["HDR10,HLG", "None", "x", "HDR10", "HDR10+", "HLG", "None", "None"],
+            "MODEL": ['a"b', "c,d", "", None, "ñandú", " e", "f\ng", "h"],
+            "HAS_WIFI": [True, False] * 4,
+        })
+        self.assertEqual(encode_csv(df), pandas_csv(df))
+
+        # Valores que pandas escribe con su propio formato
+        extra = {
+            "RELEASE_DATE": pd.to_datetime(["2021-03-04 00:00:00", "2022-05-06 07:08:09"] * 4),
+            "WARRANTY": pd.to_timedelta([1, 2] * 4, unit="D"),
+            "STOCK_QUANTITY": np.array([2 ** 64 - 1, 0] * 4, dtype=np.uint64),
+            "MODEL": ["a\x00b", "c"] * 4,
+            "PRICE_USD": np.array([0.1, 2.5] * 4, dtype=np.float32),
+        }
+        for column, values in extra.items():
+            other = df.assign(**{column: values})
+            self.assertEqual(encode_csv(other), pandas_csv(other), column)
+            self.assertEqual(encode_csv({name: other[name].to_numpy() for name in other}), pandas_csv(other), column)
+
+    def test_empty(self):
+        """Prueba un bloque sin filas."""
+        df = generate_television_data(0)
+        self.assertEqual(encode_csv(df), pandas_csv(df))
+
+
+if __name__ == "__main__":
+    unittest.main()
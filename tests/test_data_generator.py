@@ -224,6 +224,29 @@ class TestDataGenerator(unittest.TestCase):
                 valid_date = False
             self.assertTrue(valid_date, f"Fecha inválida: {date_str}")
 
+    
+    def test_columnar_builder_matches_row_dicts(self):
+        """Prueba que el volcado en columnas equivale a construir filas como diccionarios."""
+        import random
+        
+        random.seed(42)
+        np.random.seed(42)
+        df = generate_television_data(500)
+        
+        # Misma secuencia aleatoria construyendo el DataFrame a partir de diccionarios
+        random.seed(42)
+        np.random.seed(42)
+        skus = set()
+        rows = []
+        for _ in range(500):
+            sku = generate_unique_sku(skus)
+            skus.add(sku)
+            rows.append(generate_tv_data_row(sku))
+        expected = pd.DataFrame(rows)[COLUMN_NAMES]
+        
+        pd.testing.assert_frame_equal(df, expected, check_exact=True)
+        self.assertEqual(generate_television_data(0).shape, (0, len(COLUMN_NAMES)))
+
 
 if __name__ == "__main__":
     unittest.main()
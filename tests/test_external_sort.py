@@ -0,0 +1,81 @@
+"""
+Tests para la ordenación externa.
+"""
+
+import unittest
+import os
+import tempfile
+from unittest import mock
+
+import pandas as pd
+
+from data_generator_app import external_sort as external_sort_module
+from data_generator_app.binary_format import CATEGORY_COLUMNS
+from data_generator_app.data_generator import generate_television_data
+from data_generator_app.external_sort import external_sort, parse_sort_by, sort_frame
+from data_generator_app.streaming import iter_television_chunks
+
+
+class TestExternalSort(unittest.TestCase):
+    """Pruebas de las runs ordenadas y de su mezcla."""
+
+    def test_matches_stable_sort(self):
+        """Prueba que el resultado coincide con ordenar todo en memoria de forma estable."""
+        df = generate_television_data(30_000, engine="vectorized", seed=11)
+        for by in (["BRAND", "PRICE_USD"], ["RELEASE_DATE"], ["HAS_WIFI", "MODEL"]):
+            chunks = iter_television_chunks(30_000, 4_000, engine="vectorized", seed=11)
+            merged = list(external_sort(chunks, by, chunk_size=4_000))
+            self.assertGreater(len(merged), 1)
+            expected = df.sort_values(by, kind="stable", ignore_index=True)
+            pd.testing.assert_frame_equal(pd.concat(merged, ignore_index=True), expected)
+
+    def test_repeated_keys(self):
+        """Prueba que una clave con pocos valores se mezcla en pocos pasos y en bloques completos."""
+        calls = []
+        lexsort = external_sort_module._lexsort
+
+        def counting(keys):
+            calls.append(len(keys[0]))
+            return lexsort(keys)
+
+        # Ventanas pequeñas frente a las runs: sin tratar los empates harían falta cientos de pasos
+        df = generate_television_data(40_000, engine="vectorized", seed=5)
+        chunks = iter_television_chunks(40_000, 4_000, engine="vectorized", seed=5)
+        with mock.patch.object(external_sort_module, "_lexsort", counting), \
+                mock.patch.object(external_sort_module, "MIN_MERGE_WINDOW", 64):
+            merged = list(external_sort(chunks, "BRAND", chunk_size=640))
+
+        # Una ordenación por run y, en la mezcla, del orden de un paso por marca
+        steps = len(calls) - 10
+        self.assertLessEqual(steps, 2 * len(CATEGORY_COLUMNS["BRAND"]))
+        self.assertEqual({len(chunk) for chunk in merged[:-1]}, {640})
+        expected = df.sort_values("BRAND", kind="stable", ignore_index=True)
+        pd.testing.assert_frame_equal(pd.concat(merged, ignore_index=True), expected)
+
+    def test_numeric_columns(self):
+        """Prueba que SUPPLIER_ID y DIMENSIONS_CM se ordenan por su valor numérico."""
+        df = generate_television_data(2_000)
+        ordered = sort_frame(df, "SUPPLIER_ID,DIMENSIONS_CM")
+        suppliers = ordered["SUPPLIER_ID"].str.slice(3).astype(int)
+        self.assertTrue(suppliers.is_monotonic_increasing)
+        self.assertEqual(sorted(ordered["PRODUCT_SKU"]), sorted(df["PRODUCT_SKU"]))
+
+    def test_temporary_files(self):
+        """Prueba que las runs se borran al terminar y que una entrada vacía no produce bloques."""
+        with tempfile.TemporaryDirectory() as tmp:
+            chunks = iter_television_chunks(3_000, 1_000)
+            rows = sum(len(chunk) for chunk in external_sort(chunks, "PRICE_USD", 1_000, tmp_dir=tmp))
+            self.assertEqual(rows, 3_000)
+            self.assertEqual(os.listdir(tmp), [])
+            self.assertEqual(list(external_sort([], "PRICE_USD", 1_000, tmp_dir=tmp)), [])
+
+    def test_parse_sort_by(self):
+        """Prueba la validación de las columnas."""
+        self.assertEqual(parse_sort_by(" BRAND, PRICE_USD "), ["BRAND", "PRICE_USD"])
+        for spec in ("", "PRICE", "BRAND,BRAND"):
+            with self.assertRaises(ValueError):
+                parse_sort_by(spec)
+
+
+if __name__ == "__main__":
+    unittest.main()
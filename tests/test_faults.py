@@ -0,0 +1,87 @@
+"""
+Tests para la inyección de fallos de calidad de datos.
+"""
+
+import unittest
+import os
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+from data_generator_app.csv_encoder import encode_csv
+from data_generator_app.data_generator import generate_television_data
+from data_generator_app.faults import DEFAULT_FAULT_RATES, FaultInjector, parse_faults
+
+
+class TestFaultInjector(unittest.TestCase):
+    """Pruebas de la selección de celdas y del manifiesto."""
+
+    def setUp(self):
+        self.df = generate_television_data(20_000, engine="vectorized", seed=7)
+
+    def test_manifest_matches_changes(self):
+        """Prueba que el manifiesto recoge exactamente las celdas modificadas."""
+        original = self.df.copy()
+        injector = FaultInjector("default", seed=1)
+        corrupted = injector.inject(self.df)
+        pd.testing.assert_frame_equal(self.df, original)
+
+        manifest = injector.manifest
+        changed = set()
+        for column in DEFAULT_FAULT_RATES:
+            differs = ~((corrupted[column] == original[column]) & corrupted[column].notna())
+            changed |= {(row, column) for row in np.flatnonzero(differs.to_numpy())}
+        self.assertEqual(set(zip(manifest["ROW"], manifest["COLUMN"])), changed)
+
+        counts = injector.counts()
+        for column, faults in DEFAULT_FAULT_RATES.items():
+            for fault, rate in faults.items():
+                self.assertAlmostEqual(counts[(column, fault)] / len(self.df), rate, delta=rate / 2)
+
+        # Los SKUs duplicados existen en otra fila y el CSV se sigue escribiendo igual que con pandas
+        duplicates = manifest.loc[manifest["FAULT"] == "duplicate_sku", "ROW"]
+        self.assertTrue(corrupted["PRODUCT_SKU"].duplicated(keep=False).iloc[duplicates].all())
+        self.assertEqual(encode_csv(corrupted), corrupted.to_csv(index=False, lineterminator="\n").encode())
+
+    def test_independent_of_chunking(self):
+        """Prueba que se corrompen las mismas celdas con cualquier troceado y posición inicial."""
+        rates = {"MODEL": {"typo": 0.05, "null": 0.05}, "QUALITY_RATING": {"out_of_range": 0.1, "null": 0.1},
+                 "HAS_WIFI": {"null": 0.1}, "DIMENSIONS_CM": {"malformed_dimensions": 0.2}}
+        whole = FaultInjector(rates, seed=3)
+        expected = whole.inject(self.df)
+
+        chunked = FaultInjector(rates, seed=3)
+        chunks = [self.df.iloc[start:start + 3_000] for start in range(0, len(self.df), 3_000)]
+        pd.testing.assert_frame_equal(pd.concat(chunked.apply(chunks)), expected)
+        pd.testing.assert_frame_equal(chunked.manifest, whole.manifest)
+
+        # Un fragmento que empieza en la fila 5000 coincide con esa parte del conjunto
+        shard = FaultInjector(rates, seed=3, start=5_000)
+        pd.testing.assert_frame_equal(shard.inject(self.df.iloc[5_000:]), expected.iloc[5_000:])
+        self.assertEqual(expected["QUALITY_RATING"].dtype, "Int64")
+
+    def test_write_manifest(self):
+        """Prueba que el manifiesto se escribe como CSV y se puede recortar."""
+        injector = FaultInjector({"PRICE_USD": {"out_of_range": 0.5}}, seed=2)
+        injector.inject(self.df.head(100))
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "faults.csv")
+            written = injector.write_manifest(path, max_row=50)
+            manifest = pd.read_csv(path)
+        self.assertEqual(len(manifest), written)
+        self.assertTrue((manifest["ROW"] < 50).all())
+        self.assertTrue(((manifest["CORRUPTED_VALUE"] < 0) | (manifest["CORRUPTED_VALUE"] > 10_000)).all())
+
+    def test_parse_faults(self):
+        """Prueba el formato de texto y los errores de configuración."""
+        self.assertEqual(parse_faults("BRAND:typo=0.01, PRICE_USD:null=0.02"),
+                         {"BRAND": {"typo": 0.01}, "PRICE_USD": {"null": 0.02}})
+        for spec in ("BRAND:typo", "UNKNOWN:null=0.1", "BRAND:flip=0.1", "PRICE_USD:typo=0.1",
+                     "BRAND:typo=1.5", "BRAND:typo=0.6,BRAND:null=0.6"):
+            with self.assertRaises(ValueError):
+                parse_faults(spec)
+
+
+if __name__ == "__main__":
+    unittest.main()
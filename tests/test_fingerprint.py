@@ -0,0 +1,93 @@
+"""
+Tests para las huellas por bloque y columna.
+"""
+
+import unittest
+import json
+import os
+import tempfile
+
+import pandas as pd
+
+from data_generator_app.data_generator import generate_television_data
+from data_generator_app.fingerprint import ChunkFingerprinter, compare_manifests, load_manifest
+
+
+def fingerprint(chunks, block_rows=1_000, start=0):
+    """Manifiesto de unos bloques consecutivos."""
+    fingerprinter = ChunkFingerprinter(block_rows, start=start)
+    for chunk in chunks:
+        fingerprinter.update(chunk)
+    return fingerprinter.manifest()
+
+
+class TestFingerprint(unittest.TestCase):
+    """Pruebas del cálculo y la comparación de huellas."""
+
+    def setUp(self):
+        self.df = generate_television_data(3_500, engine="vectorized", seed=9)
+
+    def test_independent_of_chunking_and_dtypes(self):
+        """Prueba que las huellas no dependen del troceado ni de los tipos de pandas."""
+        whole = fingerprint([self.df])
+        self.assertEqual([block["rows"] for block in whole["blocks"]], [1_000, 1_000, 1_000, 500])
+
+        chunks = [self.df.iloc[start:start + 700] for start in range(0, len(self.df), 700)]
+        self.assertIsNone(compare_manifests(whole, fingerprint(chunks)))
+
+        converted = self.df.astype({"QUALITY_RATING": "Int64", "HAS_WIFI": "boolean", "BRAND": "string"})
+        self.assertIsNone(compare_manifests(whole, fingerprint([converted])))
+
+    def test_pinpoints_first_difference(self):
+        """Prueba que la comparación señala el primer bloque y las columnas que difieren."""
+        reference = fingerprint([self.df])
+        changed = self.df.copy()
+        changed.loc[2_100, "PRICE_USD"] += 0.01
+        changed.loc[2_200, "MODEL"] = None
+        changed.loc[3_100, "BRAND"] = "Acme"
+        difference = compare_manifests(reference, fingerprint([changed]))
+        self.assertEqual((difference["start"], difference["rows"]), (2_000, 1_000))
+        self.assertEqual(difference["columns"], ["MODEL", "PRICE_USD"])
+
+        difference = compare_manifests(reference, fingerprint([self.df.iloc[:3_200]]))
+        self.assertEqual(difference["start"], 3_000)
+        difference = compare_manifests(reference, fingerprint([self.df], block_rows=500))
+        self.assertIsNone(difference["start"])
+
+    def test_shards_align_with_whole_run(self):
+        """Prueba que un fragmento comparte los bloques completos con la ejecución entera."""
+        whole = fingerprint([self.df])
+        shard = fingerprint([self.df.iloc[1_500:]], start=1_500)
+        self.assertEqual([block["start"] for block in shard["blocks"]], [1_500, 2_000, 3_000])
+        self.assertEqual(shard["blocks"][1], whole["blocks"][2])
+
+        # Se comparan los bloques completos que comparten; el primero del fragmento está incompleto
+        for first, second in ((whole, shard), (shard, whole)):
+            difference = compare_manifests(first, second)
+            self.assertEqual((difference["start"], difference["rows"], difference["columns"]), (0, 2_000, []))
+
+        changed = self.df.iloc[1_500:].copy()
+        changed.loc[3_200, "BRAND"] = "Acme"
+        difference = compare_manifests(whole, fingerprint([changed], start=1_500))
+        self.assertEqual((difference["start"], difference["rows"], difference["columns"]), (3_000, 500, ["BRAND"]))
+
+    def test_write_and_load(self):
+        """Prueba que el manifiesto se escribe como JSON con los metadatos."""
+        fingerprinter = ChunkFingerprinter(1_000)
+        list(fingerprinter.apply([self.df]))
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "fingerprint.json")
+            written = fingerprinter.write(path, {"seed": 9})
+            manifest = load_manifest(path)
+            self.assertEqual(manifest, json.loads(json.dumps(written)))
+            self.assertEqual(manifest["metadata"]["seed"], 9)
+            self.assertEqual(manifest["metadata"]["pandas"], pd.__version__)
+
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump({"version": 0}, f)
+            with self.assertRaises(ValueError):
+                load_manifest(path)
+
+
+if __name__ == "__main__":
+    unittest.main()
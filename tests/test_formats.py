@@ -0,0 +1,59 @@
+"""
+Tests para los tipos de resultado de la generación.
+"""
+
+import unittest
+import importlib.util
+import random
+
+import numpy as np
+import pandas as pd
+
+from data_generator_app.constants import COLUMN_NAMES
+from data_generator_app.data_generator import generate_television_data
+
+
+class TestReturnTypes(unittest.TestCase):
+    """Pruebas de return_type en generate_television_data."""
+
+    def _generate(self, return_type, engine="legacy"):
+        random.seed(21)
+        np.random.seed(21)
+        return generate_television_data(300, engine=engine, return_type=return_type)
+
+    def test_numpy_columns_match_dataframe(self):
+        """Prueba que el diccionario de arrays contiene los mismos datos."""
+        for engine in ("legacy", "vectorized"):
+            df = self._generate("pandas", engine)
+            columns = self._generate("numpy", engine)
+
+            self.assertEqual(list(columns), COLUMN_NAMES)
+            pd.testing.assert_frame_equal(pd.DataFrame(columns), df)
+
+    def test_structured_array(self):
+        """Prueba que el array estructurado no contiene objetos de Python."""
+        df = self._generate("pandas")
+        records = self._generate("structured")
+
+        self.assertEqual(records.dtype.names, tuple(COLUMN_NAMES))
+        self.assertFalse(any(records.dtype[name] == object for name in COLUMN_NAMES))
+        self.assertEqual(records["PRODUCT_SKU"].tolist(), df["PRODUCT_SKU"].tolist())
+        np.testing.assert_array_equal(records["PRICE_USD"], df["PRICE_USD"].to_numpy())
+
+    @unittest.skipUnless(importlib.util.find_spec("pyarrow"), "requiere pyarrow")
+    def test_arrow_table(self):
+        """Prueba que la tabla Arrow equivale al DataFrame."""
+        df = self._generate("pandas", "vectorized")
+        table = self._generate("arrow", "vectorized")
+
+        self.assertEqual(table.column_names, COLUMN_NAMES)
+        pd.testing.assert_frame_equal(table.to_pandas(), df)
+
+    def test_invalid_return_type(self):
+        """Prueba que se rechazan tipos de resultado desconocidos."""
+        with self.assertRaises(ValueError):
+            generate_television_data(10, return_type="polars")
+
+
+if __name__ == "__main__":
+    unittest.main()
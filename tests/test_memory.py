@@ -0,0 +1,94 @@
+"""
+Tests para el tamaño de bloque según el presupuesto de memoria.
+"""
+
+import random
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from data_generator_app.data_generator import generate_television_data
+from data_generator_app.memory import (
+    MEMORY_SAFETY_FACTOR, MIN_CHUNK_SIZE, check_fits, chunk_size_for_budget, measure_row_cost, parse_memory
+)
+from data_generator_app.sku import SKU_INDEX_BYTES
+from data_generator_app.streaming import iter_television_chunks
+
+
+class TestMemoryBudget(unittest.TestCase):
+    """Pruebas de la medición del coste por fila y del tamaño de bloque."""
+
+    def test_parse_memory(self):
+        """Prueba las unidades admitidas y los errores de formato."""
+        self.assertEqual(parse_memory("2GB"), 2_000_000_000)
+        self.assertEqual(parse_memory("512MiB"), 512 << 20)
+        self.assertEqual(parse_memory("1.5k"), 1500)
+        self.assertEqual(parse_memory(4096), 4096)
+        for spec in ("", "2XB", "-1GB", "0", "GB"):
+            with self.assertRaises(ValueError):
+                parse_memory(spec)
+
+    def test_chunk_size_follows_budget(self):
+        """Prueba que el bloque crece con el presupuesto y se reparte entre los bloques vivos."""
+        per_row, _ = measure_row_cost("csv", engine="legacy")
+        self.assertGreater(per_row, 100)
+        small = chunk_size_for_budget("200MB", format="csv", engine="legacy", baseline=0)
+        large = chunk_size_for_budget("400MB", format="csv", engine="legacy", baseline=0)
+        self.assertGreater(large, 1.9 * small)
+        shared = chunk_size_for_budget("400MB", format="csv", engine="legacy", baseline=0, in_flight=4)
+        self.assertAlmostEqual(shared / large, 0.25, delta=0.01)
+        self.assertEqual(chunk_size_for_budget("400MB", rows=500, format="csv", engine="legacy", baseline=0), 500)
+
+        with self.assertRaises(ValueError):
+            chunk_size_for_budget("1MB", format="csv", engine="legacy", baseline=0)
+        with self.assertRaises(ValueError):
+            chunk_size_for_budget("1GB", format="csv", engine="legacy", baseline=10 ** 9)
+        self.assertGreaterEqual(small, MIN_CHUNK_SIZE)
+
+    def test_check_fits(self):
+        """Prueba que se rechaza generar de una vez lo que no cabe."""
+        needed = check_fits("1GB", 10_000, format="json", engine="legacy", baseline=0)
+        self.assertLess(needed, 10 ** 9)
+        with self.assertRaises(ValueError):
+            check_fits("100MB", 10_000_000, format="json", engine="legacy", baseline=0)
+
+    def test_chunks_with_budget(self):
+        """Prueba que la medición no altera las filas generadas con semilla."""
+        expected = generate_television_data(20_000, engine="vectorized", seed=5)
+        chunks = list(iter_television_chunks(20_000, engine="vectorized", seed=5, max_memory="64GB", format="csv"))
+        self.assertEqual(len(chunks), 1)
+        pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), expected)
+
+        chunk_size = chunk_size_for_budget("64GB", format="csv", engine="vectorized")
+        self.assertGreater(chunk_size, 20_000)
+
+        # La muestra del motor legacy no consume la secuencia aleatoria global
+        random.seed(6)
+        np.random.seed(6)
+        expected = generate_television_data(1_000)
+        random.seed(6)
+        np.random.seed(6)
+        measure_row_cost("arrow", engine="legacy")
+        pd.testing.assert_frame_equal(generate_television_data(1_000), expected)
+
+    def test_legacy_sku_index(self):
+        """Prueba que el motor legacy cuenta en el presupuesto los SKUs de todos los bloques."""
+        per_row, fixed = measure_row_cost("csv", engine="legacy")
+        chunk_size = chunk_size_for_budget("400MB", format="csv", engine="legacy", baseline=0)
+        self.assertEqual(chunk_size, int((400e6 * MEMORY_SAFETY_FACTOR - fixed - SKU_INDEX_BYTES) / per_row))
+
+        # Los SKUs se recuerdan en un mapa de bits con el mismo resultado que un set
+        random.seed(3)
+        np.random.seed(3)
+        skus = set()
+        expected = [generate_television_data(1_000, existing_skus=skus) for _ in range(3)]
+        random.seed(3)
+        np.random.seed(3)
+        chunks = list(iter_television_chunks(3_000, 1_000))
+        pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), pd.concat(expected, ignore_index=True))
+        self.assertEqual(pd.concat(chunks)["PRODUCT_SKU"].nunique(), 3_000)
+
+
+if __name__ == "__main__":
+    unittest.main()
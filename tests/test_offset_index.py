@@ -0,0 +1,78 @@
+"""
+Tests para el índice de desplazamientos por SKU.
+"""
+
+import json
+import unittest
+import os
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+from data_generator_app.offset_index import (
+    SkuOffsetIndex, SkuOffsetIndexWriter, index_path, lookup_rows
+)
+from data_generator_app.pacing import paced_chunks
+from data_generator_app.streaming import iter_television_chunks, write_csv_stream
+
+
+class TestOffsetIndex(unittest.TestCase):
+    """Pruebas de la escritura del índice y de la búsqueda de filas."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def test_csv_lookup(self):
+        """Prueba que cada SKU lleva a su fila del CSV, también si está duplicado."""
+        chunks = list(iter_television_chunks(5_000, 1_500, engine="vectorized", seed=3))
+        # Un SKU repetido en otro bloque debe devolver las dos filas
+        chunks[2].loc[chunks[2].index[0], "PRODUCT_SKU"] = chunks[0]["PRODUCT_SKU"].iloc[10]
+        path = os.path.join(self.tmp.name, "data.csv")
+        writer = SkuOffsetIndexWriter(index_path(path))
+        write_csv_stream(chunks, path, index=writer)
+        self.assertEqual(writer.close(), 5_000)
+
+        with open(path, encoding="utf-8") as f:
+            lines = f.read().splitlines()[1:]
+        index = SkuOffsetIndex(index_path(path))
+        self.assertEqual(len(index), 5_000)
+        self.assertTrue(np.all(np.diff(np.load(index_path(path))["sku"]) >= 0))
+        for row in (0, 1_499, 1_500, 4_999):
+            sku = lines[row].split(",")[0]
+            expected = [line for line in lines if line.startswith(sku)]
+            self.assertEqual(lookup_rows(path, sku, index), expected)
+        self.assertEqual(len(lookup_rows(path, chunks[0]["PRODUCT_SKU"].iloc[10])), 2)
+        self.assertEqual(lookup_rows(path, "AA100000"), [])
+
+    def test_json_lines_and_truncation(self):
+        """Prueba el índice de JSON Lines y el descarte de las filas que no se emitieron."""
+        path = os.path.join(self.tmp.name, "data.jsonl")
+        writer = SkuOffsetIndexWriter(index_path(path))
+        chunks = list(iter_television_chunks(900, 300))
+        with open(path, "wb") as f:
+            for data, _ in paced_chunks(chunks, "json", index=writer):
+                f.write(data)
+        self.assertEqual(writer.close(rows=500), 500)
+
+        rows = pd.read_json(path, lines=True)
+        line = lookup_rows(path, rows["PRODUCT_SKU"].iloc[499])
+        self.assertEqual(json.loads(line[0])["MODEL"], rows["MODEL"].iloc[499])
+        self.assertEqual(lookup_rows(path, rows["PRODUCT_SKU"].iloc[500]), [])
+
+    def test_stale_index(self):
+        """Prueba que un índice de otro archivo se detecta al leer."""
+        chunks = list(iter_television_chunks(100, 100))
+        first = os.path.join(self.tmp.name, "first.csv")
+        second = os.path.join(self.tmp.name, "second.csv")
+        writer = SkuOffsetIndexWriter(index_path(first))
+        write_csv_stream(chunks, first, index=writer)
+        writer.close()
+        write_csv_stream(list(iter_television_chunks(100, 100)), second)
+        with self.assertRaises(ValueError):
+            lookup_rows(second, chunks[0]["PRODUCT_SKU"].iloc[50], index_path(first))
+
+
+if __name__ == "__main__":
+    unittest.main()
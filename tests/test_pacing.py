@@ -0,0 +1,148 @@
+"""
+Tests para la emisión a ritmo controlado.
+"""
+
+import unittest
+import io
+import threading
+import time
+
+import pandas as pd
+
+from data_generator_app.pacing import (
+    BurstRate, ConstantRate, RampRate, emit_paced, encode_chunk, paced_chunks, parse_rate, prefetch
+)
+from data_generator_app.streaming import iter_television_chunks
+
+
+class FakeClock:
+    """Reloj simulado que solo avanza al esperar."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def clock(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class RecordingSink(io.BytesIO):
+    """Destino que anota las filas escritas en cada instante."""
+
+    def __init__(self, clock):
+        super().__init__()
+        self.fake_clock = clock
+        self.writes = []
+
+    def write(self, data):
+        self.writes.append((self.fake_clock.now, data.count(b"\n")))
+        return super().write(data)
+
+
+class TestPacing(unittest.TestCase):
+    """Pruebas de los perfiles y del emisor."""
+
+    def test_profiles(self):
+        """Prueba las filas acumuladas de cada perfil."""
+        self.assertEqual(ConstantRate(100).cumulative(2.5), 250)
+        ramp = RampRate(0, 100, 10)
+        self.assertEqual(ramp.cumulative(10), 500)
+        self.assertEqual(ramp.cumulative(12), 700)
+        burst = BurstRate(10, 110, 5, 1)
+        self.assertEqual(burst.cumulative(1), 110)
+        self.assertEqual(burst.cumulative(5), 150)
+        self.assertEqual(burst.cumulative(5.5), 205)
+
+    def test_parse_rate(self):
+        """Prueba la interpretación de las especificaciones de ritmo."""
+        self.assertEqual(parse_rate("50000").rate, 50000)
+        self.assertIsInstance(parse_rate("constant:10"), ConstantRate)
+        self.assertIsInstance(parse_rate("ramp:0:100:60"), RampRate)
+        self.assertIsInstance(parse_rate("burst:10:100:60:5"), BurstRate)
+        for spec in ("0", "ramp:1:2", "burst:1:2:3:4:5", "wave:1", "fast", "nan", "burst:1:2:3:4"):
+            with self.assertRaises(ValueError):
+                parse_rate(spec)
+
+    def test_emission_follows_profile(self):
+        """Prueba que cada escritura lleva justo las filas que exige el perfil."""
+        chunks = list(iter_television_chunks(1_000, chunk_size=300))
+        fake = FakeClock()
+        sink = RecordingSink(fake)
+        profile = RampRate(1_000, 4_000, 0.2)
+        report = emit_paced(paced_chunks(chunks, "csv"), sink, profile, tick=0.01, clock=fake.clock, sleep=fake.sleep)
+
+        self.assertEqual(report.rows, 1_000)
+        emitted = 0
+        for moment, lines in sink.writes:
+            emitted += lines
+            # La cabecera cuenta como una línea más en la primera escritura
+            self.assertEqual(emitted - 1, min(int(profile.cumulative(moment)), 1_000))
+        self.assertAlmostEqual(report.jitter, 0.0)
+
+        expected = io.StringIO()
+        pd.concat(chunks).to_csv(expected, index=False, lineterminator="\n")
+        self.assertEqual(sink.getvalue().decode("utf-8"), expected.getvalue())
+
+    def test_duration_stops_emission(self):
+        """Prueba que la emisión se detiene al cumplirse la duración."""
+        fake = FakeClock()
+        chunks = paced_chunks(iter_television_chunks(10_000, chunk_size=1_000), "json")
+        report = emit_paced(chunks, io.BytesIO(), ConstantRate(2_000), duration=1.0,
+                            clock=fake.clock, sleep=fake.sleep)
+
+        self.assertEqual(report.rows, 2_000)
+        self.assertEqual(report.elapsed, 1.0)
+        self.assertAlmostEqual(report.achieved_rate, report.target_rate)
+
+    def test_real_clock_never_runs_ahead(self):
+        """Prueba que con el reloj real no se emite antes de tiempo."""
+        started = time.perf_counter()
+        report = emit_paced(paced_chunks(iter_television_chunks(600, chunk_size=200), "csv"), io.BytesIO(),
+                            ConstantRate(3_000))
+        self.assertEqual(report.rows, 600)
+        self.assertGreaterEqual(time.perf_counter() - started, 0.19)
+
+    def test_encode_chunk_row_ends(self):
+        """Prueba que los finales de fila separan exactamente las filas."""
+        chunk = next(iter_television_chunks(5))
+        data, ends = encode_chunk(chunk, "csv", header=True)
+        self.assertEqual(len(ends), 5)
+        self.assertEqual(data[ends[-1]:], b"")
+        self.assertTrue(data[:ends[0]].startswith(b"PRODUCT_SKU"))
+
+    def test_prefetch_propagates_errors(self):
+        """Prueba que los errores del hilo productor llegan al consumidor."""
+        def failing():
+            yield 1
+            raise RuntimeError("fallo")
+
+        items = prefetch(failing())
+        self.assertEqual(next(items), 1)
+        with self.assertRaises(RuntimeError):
+            next(items)
+
+    def test_prefetch_stops_producer_when_consumer_stops(self):
+        """Prueba que el hilo productor termina si el consumidor deja de leer."""
+        closed = []
+
+        def endless():
+            try:
+                while True:
+                    yield 1
+            finally:
+                closed.append(True)
+
+        items = prefetch(endless(), depth=1)
+        self.assertEqual(next(items), 1)
+        before = threading.active_count()
+        items.close()
+        self.assertEqual(closed, [True])
+        self.assertEqual(threading.active_count(), before - 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
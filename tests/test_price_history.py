@@ -0,0 +1,82 @@
+"""
+Tests para el historial diario de precios.
+"""
+
+import unittest
+import os
+import tempfile
+
+import pandas as pd
+
+from data_generator_app.data_generator import generate_television_data
+from data_generator_app.price_history import (
+    PRICE_HISTORY_COLUMNS, iter_price_history, price_series, write_price_history
+)
+
+
+class TestPriceHistory(unittest.TestCase):
+    """Pruebas de las series de precios por SKU."""
+
+    def setUp(self):
+        self.catalog = generate_television_data(50)
+
+    def test_series_starts_at_release_with_launch_price(self):
+        """Prueba que la serie empieza en RELEASE_DATE y dura lifetime_days días."""
+        product = self.catalog.iloc[0]
+        series = price_series(product["PRODUCT_SKU"], product["RELEASE_DATE"], product["PRICE_USD"], 7, 120)
+
+        self.assertEqual(list(series.columns), PRICE_HISTORY_COLUMNS)
+        self.assertEqual(len(series), 120)
+        self.assertEqual(series["DATE"].iloc[0], product["RELEASE_DATE"])
+        self.assertTrue(pd.to_datetime(series["DATE"]).diff().dropna().dt.days.eq(1).all())
+        if not series["IS_PROMOTION"].iloc[0]:
+            self.assertAlmostEqual(series["PRICE_USD"].iloc[0], product["PRICE_USD"], places=2)
+        self.assertTrue((series["PRICE_USD"] > 0).all())
+        self.assertTrue(series.loc[~series["IS_PROMOTION"], "DISCOUNT_PCT"].eq(0).all())
+        self.assertTrue(series.loc[series["IS_PROMOTION"], "DISCOUNT_PCT"].between(10, 30).all())
+
+    def test_series_reproducible_from_seed_and_sku(self):
+        """Prueba que cada serie depende solo de la semilla y del SKU."""
+        product = self.catalog.iloc[3]
+        args = (product["PRODUCT_SKU"], product["RELEASE_DATE"], product["PRICE_USD"])
+        pd.testing.assert_frame_equal(price_series(*args, seed=11), price_series(*args, seed=11))
+        self.assertFalse(price_series(*args, seed=11)["PRICE_USD"].equals(price_series(*args, seed=12)["PRICE_USD"]))
+
+    def test_chunks_match_single_series(self):
+        """Prueba que el troceado por SKUs y meses reproduce las series completas."""
+        frames = list(iter_price_history(self.catalog, seed=5, lifetime_days=90, sku_chunk_size=16))
+        self.assertEqual({chunk_index for _, chunk_index, _ in frames}, {0, 1, 2, 3})
+        for month, _, frame in frames:
+            self.assertTrue(frame["DATE"].str.startswith(month).all())
+
+        history = pd.concat([frame for _, _, frame in frames], ignore_index=True)
+        self.assertEqual(len(history), 90 * len(self.catalog))
+        for _, product in self.catalog.sample(5, random_state=0).iterrows():
+            series = price_series(product["PRODUCT_SKU"], product["RELEASE_DATE"], product["PRICE_USD"], 5, 90)
+            chunked = history[history["PRODUCT_SKU"] == product["PRODUCT_SKU"]].sort_values("DATE")
+            pd.testing.assert_frame_equal(chunked.reset_index(drop=True), series)
+
+    def test_write_partitions_by_month(self):
+        """Prueba que el historial se escribe en una partición por mes."""
+        with tempfile.TemporaryDirectory() as tmp:
+            written = write_price_history(self.catalog, tmp, seed=1, lifetime_days=40, sku_chunk_size=20)
+            partitions = sorted(os.listdir(tmp))
+            self.assertTrue(all(name.startswith("month=") for name in partitions))
+
+            total = 0
+            for name in partitions:
+                for part in os.listdir(os.path.join(tmp, name)):
+                    frame = pd.read_csv(os.path.join(tmp, name, part))
+                    self.assertTrue(frame["DATE"].str.startswith(name[len("month="):]).all())
+                    total += len(frame)
+            self.assertEqual(total, written)
+            self.assertEqual(written, 40 * len(self.catalog))
+
+    def test_invalid_lifetime(self):
+        """Prueba que se rechaza una duración no positiva."""
+        with self.assertRaises(ValueError):
+            list(iter_price_history(self.catalog, seed=1, lifetime_days=0))
+
+
+if __name__ == "__main__":
+    unittest.main()
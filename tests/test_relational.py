@@ -0,0 +1,85 @@
+"""
+Tests para la generación del esquema en estrella.
+"""
+
+import unittest
+import os
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+from data_generator_app.data_generator import generate_television_data
+from data_generator_app.relational import (
+    generate_orders, generate_suppliers, generate_warehouses, iter_orders, write_star_schema
+)
+
+
+class TestRelational(unittest.TestCase):
+    """Pruebas de las tablas de dimensiones y de hechos."""
+
+    def setUp(self):
+        self.catalog = generate_television_data(200)
+
+    def test_catalog_foreign_keys(self):
+        """Prueba que el catálogo referencia proveedores y almacenes existentes."""
+        suppliers = generate_suppliers(seed=1)
+        warehouses = generate_warehouses(seed=1)
+
+        self.assertTrue(suppliers["SUPPLIER_ID"].is_unique)
+        self.assertTrue(self.catalog["SUPPLIER_ID"].isin(suppliers["SUPPLIER_ID"]).all())
+        self.assertTrue(self.catalog["WAREHOUSE_LOCATION"].isin(warehouses["WAREHOUSE_LOCATION"]).all())
+
+    def test_orders_foreign_keys_and_chunks(self):
+        """Prueba que los pedidos referencian claves válidas en todos los bloques."""
+        chunks = list(iter_orders(self.catalog, 25_000, chunk_size=10_000, seed=3))
+        self.assertEqual([len(chunk) for chunk in chunks], [10_000, 10_000, 5_000])
+
+        orders = pd.concat(chunks, ignore_index=True)
+        np.testing.assert_array_equal(orders["ORDER_ID"], np.arange(1, 25_001))
+        self.assertTrue(orders["PRODUCT_SKU"].isin(self.catalog["PRODUCT_SKU"]).all())
+        self.assertTrue(orders["WAREHOUSE_ID"].isin(generate_warehouses()["WAREHOUSE_ID"]).all())
+
+        # Proveedor y almacén coinciden con los del producto
+        merged = orders.merge(self.catalog, on="PRODUCT_SKU", suffixes=("", "_PRODUCT"))
+        self.assertTrue((merged["SUPPLIER_ID"] == merged["SUPPLIER_ID_PRODUCT"]).all())
+        self.assertTrue((merged["ORDER_DATE"] >= merged["RELEASE_DATE"]).all())
+
+    def test_orders_popularity_is_skewed(self):
+        """Prueba que la popularidad de los productos sigue una cola larga."""
+        orders = generate_orders(self.catalog, 50_000, seed=5)
+        counts = orders["PRODUCT_SKU"].value_counts()
+
+        # Con Zipf(1.1) el producto más vendido supera con mucho el reparto uniforme
+        self.assertGreater(counts.iloc[0], 10 * 50_000 / len(self.catalog))
+        self.assertGreater(counts.iloc[:20].sum(), 0.5 * 50_000)
+
+    def test_orders_reproducible_with_seed(self):
+        """Prueba que la misma semilla genera los mismos pedidos."""
+        pd.testing.assert_frame_equal(
+            generate_orders(self.catalog, 1000, seed=7),
+            generate_orders(self.catalog, 1000, seed=7)
+        )
+
+    def test_orders_reject_unknown_warehouse(self):
+        """Prueba que una ubicación de almacén desconocida produce un error."""
+        catalog = self.catalog.copy()
+        catalog.loc[3, "WAREHOUSE_LOCATION"] = "Atlantis"
+        with self.assertRaisesRegex(ValueError, "Atlantis"):
+            generate_orders(catalog, 10, seed=1)
+
+    def test_write_star_schema(self):
+        """Prueba que se escriben las tres tablas en CSV."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            paths = write_star_schema(self.catalog, temp_dir, 5000, chunk_size=1500, seed=11)
+            orders = pd.read_csv(paths["orders"])
+            suppliers = pd.read_csv(paths["suppliers"])
+
+            self.assertEqual(set(paths), {"suppliers", "warehouses", "orders"})
+            self.assertEqual(len(orders), 5000)
+            self.assertTrue(orders["SUPPLIER_ID"].isin(suppliers["SUPPLIER_ID"]).all())
+            self.assertTrue(os.path.exists(paths["warehouses"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+"""
+Tests para la caché de gráficas renderizadas.
+"""
+
+import unittest
+import os
+import tempfile
+from unittest import mock
+
+from data_generator_app.render_cache import MANIFEST_NAME, chart_key, code_fingerprint, input_fingerprint, render_cached
+
+
+def write_marker(aggregates, output_path, label="a"):
+    """Gráfica de prueba que escribe un texto en lugar de una imagen."""
+    with open(output_path, "w") as f:
+        f.write(f"{aggregates}:{label}")
+
+
+def write_other_marker(aggregates, output_path):
+    """Segunda gráfica de prueba."""
+    with open(output_path, "w") as f:
+        f.write(str(aggregates))
+
+
+class TestRenderCache(unittest.TestCase):
+    """Pruebas de la detección de gráficas desactualizadas."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.input_path = os.path.join(self.tmp.name, "data.csv")
+        with open(self.input_path, "w") as f:
+            f.write("A,B\n" + "1,2\n" * 50_000)
+        self.loads = 0
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def load(self):
+        self.loads += 1
+        return "datos"
+
+    def render(self, charts, force=False):
+        return render_cached(charts, self.input_path, self.load, self.tmp.name, max_workers=1, force=force)
+
+    def test_fingerprint_changes_with_content(self):
+        """Prueba que la huella cambia al modificar el archivo."""
+        first = input_fingerprint(self.input_path)
+        self.assertEqual(input_fingerprint(self.input_path), first)
+        with open(self.input_path, "r+") as f:
+            f.seek(os.path.getsize(self.input_path) - 2)
+            f.write("3")
+        os.utime(self.input_path, ns=(0, 0))
+        self.assertNotEqual(input_fingerprint(self.input_path), first)
+
+    def test_key_depends_on_function_and_parameters(self):
+        """Prueba que la clave cambia con la función y sus parámetros."""
+        key = chart_key("x", write_marker, {"label": "a"})
+        self.assertEqual(chart_key("x", write_marker, {"label": "a"}), key)
+        self.assertNotEqual(chart_key("x", write_marker, {"label": "b"}), key)
+        self.assertNotEqual(chart_key("x", write_other_marker), key)
+        self.assertNotEqual(chart_key("y", write_marker, {"label": "a"}), key)
+
+    def test_only_stale_charts_are_rendered(self):
+        """Prueba que solo se dibujan las gráficas cuya clave ha cambiado."""
+        first = os.path.join(self.tmp.name, "first.png")
+        second = os.path.join(self.tmp.name, "second.png")
+        charts = [(write_marker, first, {"label": "a"}), (write_other_marker, second)]
+
+        self.assertEqual(self.render(charts), ([first, second], []))
+        self.assertTrue(os.path.exists(os.path.join(self.tmp.name, MANIFEST_NAME)))
+
+        # Sin cambios no se cargan los datos
+        self.assertEqual(self.render(charts), ([], [first, second]))
+        self.assertEqual(self.loads, 1)
+
+        # Un cambio de parámetros o una imagen borrada solo afecta a su gráfica
+        charts[0] = (write_marker, first, {"label": "b"})
+        self.assertEqual(self.render(charts), ([first], [second]))
+        os.remove(second)
+        self.assertEqual(self.render(charts), ([second], [first]))
+        self.assertEqual(self.render(charts, force=True), ([first, second], []))
+        with open(first) as f:
+            self.assertEqual(f.read(), "datos:b")
+
+    def test_aggregate_code_invalidates_all_charts(self):
+        """Prueba que un cambio en el código de los agregados vuelve a dibujarlo todo."""
+        first = os.path.join(self.tmp.name, "first.png")
+        second = os.path.join(self.tmp.name, "second.png")
+        charts = [(write_marker, first), (write_other_marker, second)]
+        self.assertEqual(code_fingerprint(self.load), code_fingerprint(self.load))
+
+        self.assertEqual(self.render(charts), ([first, second], []))
+        with mock.patch("data_generator_app.render_cache._module_source", lambda module: "cambiado"):
+            self.assertEqual(self.render(charts), ([first, second], []))
+        self.assertEqual(self.loads, 2)
+
+    def test_failed_load(self):
+        """Prueba que no se registra nada si no se pueden cargar los datos."""
+        path = os.path.join(self.tmp.name, "chart.png")
+        result = render_cached([(write_marker, path)], self.input_path, lambda: None, self.tmp.name, max_workers=1)
+        self.assertIsNone(result)
+        self.assertFalse(os.path.exists(os.path.join(self.tmp.name, MANIFEST_NAME)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+"""
+Tests para el muestreo categórico con tablas alias.
+"""
+
+import unittest
+import random
+
+import numpy as np
+
+from data_generator_app.constants import BRANDS, CATEGORICAL_VALUES, MARKET_SHARE_WEIGHTS
+from data_generator_app.data_generator import generate_television_data
+from data_generator_app.sampling import AliasTable, build_samplers
+
+
+class TestAliasTable(unittest.TestCase):
+    """Pruebas de las tablas alias de Walker."""
+
+    def test_batch_frequencies_match_weights(self):
+        """Prueba que las frecuencias muestreadas siguen los pesos."""
+        weights = [5, 0, 1, 3, 1]
+        table = AliasTable(list("abcde"), weights)
+        samples = table.sample_batch(200_000, np.random.default_rng(0))
+
+        values, counts = np.unique(samples, return_counts=True)
+        frequencies = dict(zip(values, counts / len(samples)))
+        self.assertNotIn("b", frequencies)
+        for value, weight in zip("acde", [5, 1, 3, 1]):
+            self.assertAlmostEqual(frequencies[value], weight / 10, delta=0.01)
+
+    def test_scalar_sample_uses_one_draw(self):
+        """Prueba que cada muestra consume un solo número aleatorio."""
+        table = AliasTable([1, 2, 3], [1, 2, 3])
+        random.seed(4)
+        samples = [table.sample() for _ in range(30_000)]
+        after_samples = random.random()
+        random.seed(4)
+        for _ in range(30_000):
+            random.random()
+
+        self.assertEqual(random.random(), after_samples)
+        self.assertAlmostEqual(samples.count(3) / len(samples), 0.5, delta=0.02)
+
+    def test_invalid_weights(self):
+        """Prueba que se rechazan pesos inválidos."""
+        with self.assertRaises(ValueError):
+            AliasTable(["a", "b"], [1])
+        with self.assertRaises(ValueError):
+            AliasTable(["a", "b"], [0, 0])
+        with self.assertRaises(ValueError):
+            AliasTable(["a", "b"], [-1, 2])
+        with self.assertRaises(ValueError):
+            build_samplers({"PRICE_USD": [1]})
+        with self.assertRaises(ValueError):
+            build_samplers({"BRAND": {"Acme": 1}})
+
+
+class TestWeightedGeneration(unittest.TestCase):
+    """Pruebas de la generación con pesos."""
+
+    def test_realistic_weights_are_aligned(self):
+        """Prueba que los pesos predefinidos tienen un valor por categoría."""
+        for column, weights in MARKET_SHARE_WEIGHTS.items():
+            self.assertEqual(len(weights), len(CATEGORICAL_VALUES[column]), column)
+
+    def test_generation_with_weights(self):
+        """Prueba que los pesos se aplican en los datos generados."""
+        df = generate_television_data(3000, weights={
+            "BRAND": {"Samsung": 3, "LG": 1},
+            "SCREEN_SIZE_INCHES": {"55": 1},
+        })
+
+        self.assertEqual(set(df["BRAND"]), {"Samsung", "LG"})
+        self.assertAlmostEqual((df["BRAND"] == "Samsung").mean(), 0.75, delta=0.04)
+        self.assertTrue((df["SCREEN_SIZE_INCHES"] == 55).all())
+
+    def test_realistic_preset(self):
+        """Prueba que el perfil realista sesga las marcas."""
+        df = generate_television_data(3000, weights="realistic")
+        share = df["BRAND"].value_counts(normalize=True)
+
+        self.assertTrue(df["BRAND"].isin(BRANDS).all())
+        self.assertGreater(share["Samsung"], share["Realme"] * 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+"""
+Tests para el reparto del conjunto de datos en fragmentos.
+"""
+
+import unittest
+import multiprocessing
+
+import pandas as pd
+
+from data_generator_app.sharding import generate_shard, iter_shard_chunks, shard_bounds, shard_path
+
+
+def _generate(args):
+    """Genera un fragmento en un proceso aparte."""
+    rows, seed, num_shards, shard_index = args
+    return generate_shard(rows, seed, num_shards, shard_index, weights="realistic")
+
+
+class TestSharding(unittest.TestCase):
+    """Pruebas de los fragmentos generados sin coordinación."""
+
+    def test_bounds_cover_all_rows(self):
+        """Prueba que los rangos son contiguos, disjuntos y cubren todas las filas."""
+        bounds = [shard_bounds(10, 4, k) for k in range(4)]
+        self.assertEqual(bounds, [(0, 3), (3, 6), (6, 8), (8, 10)])
+        self.assertEqual(shard_bounds(2, 4, 3), (2, 2))
+
+        for rows, shards, index in ((10, 0, 0), (10, 4, 4), (10, 4, -1), (-1, 1, 0)):
+            with self.assertRaises(ValueError):
+                shard_bounds(rows, shards, index)
+
+    def test_shards_in_processes_equal_single_run(self):
+        """Prueba que los fragmentos generados en varios procesos forman una ejecución única."""
+        rows, seed, shards = 20_000, 42, 3
+        with multiprocessing.get_context("spawn").Pool(shards) as pool:
+            parts = pool.map(_generate, [(rows, seed, shards, k) for k in range(shards)])
+
+        combined = pd.concat(parts, ignore_index=True)
+        single = generate_shard(rows, seed, weights="realistic")
+        pd.testing.assert_frame_equal(combined, single)
+        self.assertTrue(combined["PRODUCT_SKU"].is_unique)
+
+    def test_chunked_shard_matches_shard(self):
+        """Prueba que el fragmento por bloques coincide con el fragmento completo."""
+        chunks = list(iter_shard_chunks(5_000, seed=7, num_shards=2, shard_index=1, chunk_size=1_000))
+        self.assertEqual([len(chunk) for chunk in chunks], [1_000, 1_000, 500])
+        pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), generate_shard(5_000, 7, 2, 1))
+
+    def test_shard_path(self):
+        """Prueba que el fragmento se añade antes de la extensión."""
+        self.assertEqual(shard_path("data/tv.csv", 3, 8), "data/tv-shard-00003-of-00008.csv")
+        self.assertEqual(shard_path("tv", 0, 2), "tv-shard-00000-of-00002")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,149 @@
+"""
+Tests para la codificación de SKUs y los índices de exclusión.
+"""
+
+import unittest
+import os
+import tempfile
+import multiprocessing
+import numpy as np
+
+from data_generator_app.data_generator import generate_television_data
+from data_generator_app.sku import (
+    SKU_SPACE, SkuIndex, SkuRegistry, decode_sku, encode_sku, encode_skus
+)
+
+
+def _generate_skus_with_registry(args):
+    """Genera filas en otro proceso reservando sus SKUs en el registro."""
+    registry_path, rows, seed, engine = args
+    import random
+    random.seed(seed)
+    registry = SkuRegistry(registry_path)
+    df = generate_television_data(rows, existing_skus=registry, engine=engine)
+    return df["PRODUCT_SKU"].tolist()
+
+
+class _RacingIndex(SkuIndex):
+    """Índice en el que otro proceso reserva parte de cada lote justo antes que nosotros."""
+
+    def __init__(self, stolen):
+        super().__init__()
+        self.stolen = stolen
+
+    def reserve_codes(self, codes):
+        if self.stolen:
+            taken = np.asarray(codes[:self.stolen])
+            self.stolen = 0
+            self.add_codes(taken)
+        return super().reserve_codes(codes)
+
+
+class TestSkuEncoding(unittest.TestCase):
+    """Pruebas de la codificación entera de SKUs."""
+
+    def test_encode_decode_roundtrip(self):
+        """Prueba que codificar y decodificar devuelve el SKU original."""
+        for sku in ["AA100000", "ZZ999999", "AB123456", "QX500001"]:
+            code = encode_sku(sku)
+            self.assertTrue(0 <= code < SKU_SPACE)
+            self.assertEqual(decode_sku(code), sku)
+
+    def test_encode_skus_matches_scalar(self):
+        """Prueba que la versión vectorizada coincide y marca inválidos."""
+        skus = ["AB123456", "ZZ999999", "ab123456", "AB012345", "AB1234567", None, "AA100000"]
+        codes = encode_skus(np.array(skus, dtype=object))
+
+        self.assertEqual(codes[0], encode_sku("AB123456"))
+        self.assertEqual(codes[1], encode_sku("ZZ999999"))
+        self.assertEqual(codes[6], 0)
+        self.assertTrue(np.all(codes[2:6] == -1))
+        with self.assertRaises(ValueError):
+            encode_sku("AB012345")
+
+
+class TestSkuIndex(unittest.TestCase):
+    """Pruebas del índice de SKUs basado en mapa de bits."""
+
+    def test_add_and_contains(self):
+        """Prueba la pertenencia escalar y vectorizada."""
+        index = SkuIndex()
+        index.add("AB123456")
+        index.add_codes(encode_skus(["CD654321", "CD654321", "EF100000"]))
+
+        self.assertEqual(len(index), 3)
+        self.assertIn("AB123456", index)
+        self.assertIn("CD654321", index)
+        self.assertNotIn("AB123457", index)
+        self.assertNotIn("invalido", index)
+        np.testing.assert_array_equal(
+            index.contains_codes(encode_skus(["EF100000", "EF100001", "xx"])),
+            [True, False, False],
+        )
+
+    def test_generation_avoids_indexed_skus(self):
+        """Prueba que los SKUs generados no colisionan con los de un CSV."""
+        df = generate_television_data(200)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            csv_path = os.path.join(temp_dir, "data.csv")
+            df.to_csv(csv_path, index=False)
+            index = SkuIndex.from_csv(csv_path, chunksize=50)
+
+        self.assertEqual(len(index), 200)
+        new_df = generate_television_data(300, existing_skus=index)
+
+        self.assertEqual(len(index), 500)
+        self.assertFalse(new_df["PRODUCT_SKU"].isin(df["PRODUCT_SKU"]).any())
+        self.assertEqual(new_df["PRODUCT_SKU"].nunique(), 300)
+
+
+class TestSkuRegistry(unittest.TestCase):
+    """Pruebas del registro persistente de SKUs."""
+
+    def test_registry_persists_between_instances(self):
+        """Prueba que los SKUs reservados sobreviven a reabrir el registro."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "skus.registry")
+            registry = SkuRegistry(path)
+            self.assertTrue(registry.reserve("AB123456"))
+            self.assertFalse(registry.reserve("AB123456"))
+            reserved = registry.reserve_codes(encode_skus(["CD100000", "CD100000", "AB123456"]))
+            np.testing.assert_array_equal(reserved, [True, False, False])
+            registry.close()
+
+            reopened = SkuRegistry(path)
+            self.assertIn("AB123456", reopened)
+            self.assertIn("CD100000", reopened)
+            self.assertNotIn("CD100001", reopened)
+            self.assertEqual(len(reopened), 2)
+            reopened.close()
+
+    def test_registry_shared_between_processes(self):
+        """Prueba que procesos con la misma semilla no repiten SKUs."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "skus.registry")
+            SkuRegistry(path).close()
+
+            # Con la misma semilla, sin registro, todos generarían los mismos SKUs
+            for engine in ("legacy", "vectorized"):
+                with multiprocessing.get_context("spawn").Pool(3) as pool:
+                    results = pool.map(_generate_skus_with_registry, [(path, 100, 7, engine)] * 3)
+                all_skus = [sku for skus in results for sku in skus]
+                self.assertEqual(len(set(all_skus)), 300)
+            self.assertEqual(len(SkuRegistry(path)), 600)
+
+    def test_redraws_skus_reserved_concurrently(self):
+        """Prueba que se sortean de nuevo los SKUs que otro proceso reservó entre la comprobación y la reserva."""
+        for engine in ("legacy", "vectorized"):
+            index = _RacingIndex(stolen=25)
+            seed = 3 if engine == "vectorized" else None
+            df = generate_television_data(200, existing_skus=index, engine=engine, seed=seed)
+            self.assertTrue(df["PRODUCT_SKU"].is_unique)
+            # Los 25 robados más los 200 generados, ninguno repetido
+            self.assertEqual(len(index), 225)
+            self.assertTrue(index.contains_codes(encode_skus(df["PRODUCT_SKU"].to_numpy())).all())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+"""
+Tests para la escritura de datos en streaming.
+"""
+
+import unittest
+import importlib.util
+import io
+import os
+import tempfile
+
+import pandas as pd
+
+from data_generator_app.streaming import iter_television_chunks, write_arrow_stream, write_csv_stream
+
+
+class TestStreaming(unittest.TestCase):
+    """Pruebas de la generación y escritura por bloques."""
+
+    def test_chunks_share_skus(self):
+        """Prueba que los bloques tienen el tamaño pedido y SKUs únicos."""
+        chunks = list(iter_television_chunks(250, chunk_size=100))
+
+        self.assertEqual([len(chunk) for chunk in chunks], [100, 100, 50])
+        self.assertTrue(pd.concat(chunks)["PRODUCT_SKU"].is_unique)
+
+    @unittest.skipUnless(importlib.util.find_spec("pyarrow"), "requiere pyarrow")
+    def test_arrow_stream_round_trip(self):
+        """Prueba que el stream Arrow conserva filas, columnas y tipos."""
+        import pyarrow as pa
+
+        chunks = list(iter_television_chunks(300, chunk_size=128))
+        sink = io.BytesIO()
+        rows = write_arrow_stream(chunks, sink)
+
+        reader = pa.ipc.open_stream(sink.getvalue())
+        batches = list(reader)
+        table = pa.Table.from_batches(batches)
+
+        self.assertEqual(rows, 300)
+        self.assertEqual(len(batches), 3)
+        pd.testing.assert_frame_equal(table.to_pandas(), pd.concat(chunks, ignore_index=True))
+
+        # Sin filas el stream sigue teniendo el esquema
+        sink = io.BytesIO()
+        self.assertEqual(write_arrow_stream(iter_television_chunks(0), sink), 0)
+        empty = pa.ipc.open_stream(sink.getvalue()).read_all()
+        self.assertEqual(empty.num_rows, 0)
+        self.assertEqual(empty.schema, table.schema)
+
+    def test_csv_stream_matches_single_write(self):
+        """Prueba que el CSV por bloques es idéntico a escribirlo de una vez."""
+        chunks = list(iter_television_chunks(250, chunk_size=100))
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "stream.csv")
+            write_csv_stream(chunks, path)
+            with open(path, encoding="utf-8") as f:
+                streamed = f.read()
+
+        self.assertEqual(streamed, pd.concat(chunks, ignore_index=True).to_csv(index=False))
+
+
+if __name__ == "__main__":
+    unittest.main()
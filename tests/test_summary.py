@@ -0,0 +1,118 @@
+"""
+Tests para el resumen estadístico en streaming.
+"""
+
+import unittest
+import os
+import tempfile
+import numpy as np
+
+from data_generator_app.data_generator import generate_television_data
+from data_generator_app.summary import HyperLogLog, QuantileSketch, SummaryAccumulator, summarize_csv
+from data_generator_app.utils import export_file_summary, generate_summary_stats
+
+
+class TestSketches(unittest.TestCase):
+    """Pruebas de los bocetos de cuantiles y de valores distintos."""
+
+    def test_quantile_sketch_relative_error(self):
+        """Prueba que la mediana estimada respeta el error relativo."""
+        values = np.random.default_rng(1).lognormal(7, 1, 100_000)
+        sketch = QuantileSketch(relative_accuracy=0.01)
+        for part in np.array_split(values, 7):
+            sketch.update(part)
+
+        for q in (0.1, 0.5, 0.9):
+            expected = np.quantile(values, q)
+            self.assertAlmostEqual(sketch.quantile(q) / expected, 1.0, delta=0.02)
+
+    def test_hyperloglog_estimate_and_merge(self):
+        """Prueba la estimación de distintos y la fusión de bocetos."""
+        first, second = HyperLogLog(), HyperLogLog()
+        first.update(np.arange(0, 60_000))
+        second.update(np.arange(40_000, 100_000))
+        first.merge(second)
+
+        self.assertAlmostEqual(first.estimate() / 100_000, 1.0, delta=0.03)
+
+        small = HyperLogLog()
+        small.update(np.array(["a", "b", "c", "a"], dtype=object))
+        self.assertEqual(small.estimate(), 3)
+
+        # Un bloque con nulos convierte una columna entera en decimal
+        integers, floats = HyperLogLog(), HyperLogLog()
+        integers.update(np.arange(1_000))
+        floats.update(np.append(np.arange(500, 1_500, dtype=np.float64), 0.5))
+        integers.merge(floats)
+        self.assertAlmostEqual(integers.estimate() / 1_501, 1.0, delta=0.02)
+
+
+class TestSummaryAccumulator(unittest.TestCase):
+    """Pruebas del resumen sobre los datos generados."""
+
+    def setUp(self):
+        self.df = generate_television_data(2000)
+
+    def test_summary_matches_pandas(self):
+        """Prueba que los valores exactos coinciden con pandas."""
+        summary = generate_summary_stats(self.df)
+
+        self.assertEqual(summary["total_records"], 2000)
+        self.assertEqual(summary["brands_count"], self.df["BRAND"].nunique())
+        self.assertAlmostEqual(summary["avg_price"], self.df["PRICE_USD"].mean())
+        self.assertEqual(summary["max_price"], self.df["PRICE_USD"].max())
+        self.assertAlmostEqual(summary["median_price"] / self.df["PRICE_USD"].median(), 1.0, delta=0.01)
+        self.assertEqual(summary["resolution_distribution"], self.df["RESOLUTION"].value_counts().to_dict())
+        self.assertEqual(sum(summary["segment_distribution"].values()), 2000)
+
+        sku_distinct = summary["columns"]["PRODUCT_SKU"]["distinct"]
+        self.assertAlmostEqual(sku_distinct / 2000, 1.0, delta=0.03)
+
+    def test_merge_equals_single_pass(self):
+        """Prueba que fusionar resúmenes parciales equivale a una sola pasada."""
+        whole = SummaryAccumulator()
+        whole.update(self.df)
+
+        merged = SummaryAccumulator()
+        for part in np.array_split(np.arange(len(self.df)), 4):
+            partial = SummaryAccumulator()
+            partial.update(self.df.iloc[part])
+            merged.merge(partial)
+
+        expected, result = whole.result(), merged.result()
+        self.assertEqual(result["size_distribution"], expected["size_distribution"])
+        self.assertEqual(result["median_price"], expected["median_price"])
+        self.assertAlmostEqual(result["columns"]["WEIGHT_KG"]["std"], expected["columns"]["WEIGHT_KG"]["std"])
+        self.assertEqual(result["columns"]["MODEL"]["distinct"], expected["columns"]["MODEL"]["distinct"])
+
+    def test_export_file_summary(self):
+        """Prueba que se exporta el resumen de un CSV leído por bloques."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            csv_path = os.path.join(temp_dir, "data.csv")
+            output_path = os.path.join(temp_dir, "summary.txt")
+            self.df.to_csv(csv_path, index=False)
+
+            summary = export_file_summary(csv_path, output_path, chunksize=300)
+            with open(output_path) as f:
+                text = f.read()
+
+        self.assertEqual(summary["total_records"], 2000)
+        self.assertIn("Total de registros: 2000", text)
+        self.assertIn("PRICE_USD", text)
+
+    def test_none_is_not_null(self):
+        """Prueba que el texto "None" de un CSV generado no cuenta como nulo."""
+        df = generate_television_data(20_000, engine="vectorized", seed=4)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            csv_path = os.path.join(temp_dir, "data.csv")
+            df.to_csv(csv_path, index=False)
+            stats = summarize_csv(csv_path, chunksize=5_000).column_stats()
+
+        for column in ("HDR_FORMATS", "VOICE_ASSISTANT", "ECO_CERTIFICATIONS"):
+            self.assertIn("None", set(df[column]))
+            self.assertEqual(stats[column]["nulls"], 0, column)
+        self.assertEqual(stats["VOICE_ASSISTANT"]["distinct"], df["VOICE_ASSISTANT"].nunique())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+"""
+Tests para el validador de invariantes de los datos generados.
+"""
+
+import unittest
+import os
+import tempfile
+
+from data_generator_app.data_generator import generate_television_data
+from data_generator_app.validation import validate_file, validate_frame
+
+
+class TestValidation(unittest.TestCase):
+    """Pruebas del validador vectorizado."""
+
+    def setUp(self):
+        self.df = generate_television_data(1000)
+
+    def test_generated_data_is_valid(self):
+        """Prueba que los datos generados cumplen todas las reglas."""
+        report = validate_frame(self.df)
+        self.assertTrue(report.ok, report.format())
+        self.assertEqual(report.total_rows, 1000)
+
+    def test_violations_are_counted_with_samples(self):
+        """Prueba que se detectan filas corruptas y se guardan ejemplos."""
+        df = self.df.copy()
+        df.loc[3, "RELEASE_DATE"] = f"{df.loc[3, 'MANUFACTURE_YEAR']}-09-01"
+        df.loc[5, "CUSTOMER_RATING"] = min(5.0, df.loc[5, "QUALITY_RATING"] + 1.5) if df.loc[5, "QUALITY_RATING"] < 4 else 1.0
+        df.loc[7, "PRODUCT_SKU"] = "A1234567"
+        df.loc[9, "PRODUCT_SKU"] = df.loc[8, "PRODUCT_SKU"]
+        df.loc[11, "HDMI_PORTS"] = 5 if df.loc[11, "PRICE_USD"] < 1500 else 1
+
+        report = validate_frame(df, sample_rows=2)
+
+        self.assertFalse(report.ok)
+        self.assertEqual(report.violations["release_date"], 1)
+        self.assertEqual(report.violations["customer_rating"], 1)
+        self.assertEqual(report.violations["sku_format"], 1)
+        self.assertEqual(report.violations["sku_unique"], 1)
+        self.assertEqual(report.violations["hdmi_ports"], 1)
+        self.assertEqual(report.samples["sku_unique"][0]["ROW"], 9)
+
+    def test_duplicates_across_chunks(self):
+        """Prueba que la unicidad de SKUs se comprueba entre bloques."""
+        df = self.df.copy()
+        df.loc[900, "PRODUCT_SKU"] = df.loc[10, "PRODUCT_SKU"]
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            csv_path = os.path.join(temp_dir, "data.csv")
+            df.to_csv(csv_path, index=False)
+            report = validate_file(csv_path, chunksize=128)
+
+        self.assertEqual(report.total_rows, 1000)
+        self.assertEqual(report.violations["sku_unique"], 1)
+        self.assertEqual(report.samples["sku_unique"][0]["ROW"], 900)
+        self.assertEqual(sum(report.violations.values()), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,39 @@
+"""
+Script para validar las invariantes de un archivo de datos generado.
+"""
+
+import argparse
+import sys
+
+from data_generator_app.validation import DEFAULT_CHUNK_SIZE, DEFAULT_SAMPLE_ROWS, validate_file
+
+
+def main():
+    """Función principal del programa."""
+    parser = argparse.ArgumentParser(description='Validador de datos de televisiones generados')
+    parser.add_argument('input', type=str, help='Archivo CSV a validar')
+    parser.add_argument(
+        '--chunk-size',
+        type=int,
+        default=DEFAULT_CHUNK_SIZE,
+        help=f'Filas leídas por bloque (por defecto: {DEFAULT_CHUNK_SIZE})'
+    )
+    parser.add_argument(
+        '--samples',
+        type=int,
+        default=DEFAULT_SAMPLE_ROWS,
+        help=f'Filas de ejemplo por regla incumplida (por defecto: {DEFAULT_SAMPLE_ROWS})'
+    )
+    args = parser.parse_args()
+
+    report = validate_file(args.input, chunksize=args.chunk_size, sample_rows=args.samples)
+    print(report.format())
+
+    if not report.ok:
+        print("\nEl archivo incumple las invariantes del generador")
+        sys.exit(1)
+    print("\nEl archivo cumple todas las invariantes del generador")
+
+
+if __name__ == "__main__":
+    main()